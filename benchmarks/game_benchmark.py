@@ -0,0 +1,223 @@
+"""
+Benchmarks do jogo sem janela: micro-benchmarks das rotinas chamadas a cada quadro,
+uma partida roteirizada de 10 segundos, tempo de inicialização e pico de memória.
+
+Roda com os drivers ``dummy`` do SDL, salva os resultados em JSON e compara com
+uma linha de base. Cada métrica é "menor é melhor"; uma regressão acima do limite
+(global ou por métrica, no campo ``thresholds`` da linha de base) encerra com erro.
+
+Uso:
+    python -m benchmarks.game_benchmark --save-baseline
+    python -m benchmarks.game_benchmark --output resultados.json --threshold 0.2
+"""
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BASELINE = os.path.join(ROOT, "benchmarks", "baseline.json")
+GAMEPLAY_FRAMES = 600  # 10 segundos a 60 quadros por segundo
+
+
+def _measure(fn: Callable[[int], None], number: int, repeat: int = 5) -> float:
+    """Mediana, entre ``repeat`` rodadas, do tempo por chamada em µs"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for i in range(number):
+            fn(i)
+        samples.append((time.perf_counter() - start) / number * 1e6)
+    return statistics.median(samples)
+
+
+def _percentile(values, fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+
+def _peak_rss_mb() -> Optional[float]:
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss está em KiB no Linux e em bytes no macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_benchmarks(scale: float = 1.0) -> Dict[str, float]:
+    """Executa todos os benchmarks e retorna {métrica: valor}"""
+    results: Dict[str, float] = {}
+    tracemalloc.start()
+
+    # Inicialização: importação + construção do jogo (tela de carregamento incluída)
+    started_at = time.perf_counter()
+    from src.config import Config
+    from src.game import Game
+    from src.physics_engine import PhysicsEngine
+    # Preset fixo para que os resultados sejam comparáveis entre máquinas e execuções
+    Config.QUALITY_PRESET = "high"
+    game = Game(started_at=started_at)
+    results["startup.total_ms"] = game.startup_metrics['total_ms']
+    results["startup.first_pixel_ms"] = game.startup_metrics['first_pixel_ms']
+
+    # O rastreamento de alocações deixa o código mais lento: só a inicialização é medida
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    results["memory.startup_python_peak_mb"] = peak / (1024 * 1024)
+
+    window, ball, paddles, ui, sound = game.window, game.ball, game.paddles, game.ui, game.sound_manager
+    state = game.state
+    n = max(1, int(2000 * scale))
+
+    # Posições da bola que exercitam paredes, jogadores e o meio do campo
+    positions = [
+        (Config.WIDTH // 2, Config.HEIGHT // 2),
+        (Config.FIELD_OFFSET_X + 5, Config.FIELD_OFFSET_Y + 40),
+        (Config.FIELD_OFFSET_X + Config.FIELD_WIDTH // 2, Config.FIELD_OFFSET_Y + 2),
+        paddles[0].rect.center,
+        paddles[1].rect.center,
+    ]
+
+    def collisions(i):
+        ball.rect.center = positions[i % len(positions)]
+        PhysicsEngine.handle_collisions(ball, paddles, game.events)
+        game.events.dispatch()
+
+    def ball_update(i):
+        if i % 100 == 0:
+            ball.reset()
+        ball.update()
+
+    def paddle_move(i):
+        paddles[0].move(7 if i % 40 < 20 else -7, 7 if i % 60 < 30 else -7)
+
+    def cpu_move(i):
+        if i % 100 == 0:
+            ball.reset()
+        ball.update()
+        paddles[1].cpu_move()
+
+    micro = {
+        "micro.physics.handle_collisions_us": (collisions, n),
+        "micro.ball.update_us": (ball_update, n),
+        "micro.ball.draw_us": (lambda i: ball.draw(window), n),
+        "micro.paddle.move_us": (paddle_move, n),
+        "micro.paddle.cpu_move_us": (cpu_move, n),
+        "micro.ui.draw_field_us": (lambda i: ui.draw_field(window), max(1, n // 10)),
+        "micro.ui.draw_scoreboard_us": (lambda i: ui.draw_scoreboard(window), max(1, n // 10)),
+        "micro.ui.draw_menu_us": (lambda i: ui.draw_menu(window), max(1, n // 10)),
+        "micro.ui.draw_controls_menu_us": (lambda i: ui.draw_controls_menu(window), max(1, n // 10)),
+    }
+    for name, (fn, number) in micro.items():
+        results[name] = _measure(fn, number)
+        sound.update()
+
+    # Partida roteirizada: jogador 1 em zigue-zague, jogador 2 controlado pela CPU
+    state.reset()
+    state.menu_active, state.game_started = False, True
+    state.player2_control = "cpu"
+    ball.reset()
+    frame_times = []
+    for frame in range(max(1, int(GAMEPLAY_FRAMES * scale))):
+        start = time.perf_counter()
+        paddles[0].move(7 if frame % 90 < 45 else -7, 7 if frame % 50 < 25 else -7)
+        paddles[1].cpu_move()
+        PhysicsEngine.step(state, ball, paddles, game.events)
+        game.events.dispatch()
+        game._draw()
+        sound.update()
+        frame_times.append((time.perf_counter() - start) * 1000)
+    results["gameplay.frame_mean_ms"] = statistics.mean(frame_times)
+    results["gameplay.frame_p95_ms"] = _percentile(frame_times, 0.95)
+    results["gameplay.frame_p99_ms"] = _percentile(frame_times, 0.99)
+    results["gameplay.frame_max_ms"] = max(frame_times)
+
+    rss = _peak_rss_mb()
+    if rss is not None:
+        results["memory.peak_rss_mb"] = rss
+    return results
+
+
+def compare(results: Dict[str, float], baseline: dict, threshold: float) -> list:
+    """Retorna as métricas que pioraram além do limite em relação à linha de base"""
+    thresholds = baseline.get("thresholds", {})
+    regressions = []
+    for name, old in baseline.get("metrics", {}).items():
+        new = results.get(name)
+        if new is None or old <= 0:
+            continue
+        limit = thresholds.get(name, threshold)
+        change = new / old - 1
+        if change > limit:
+            regressions.append((name, old, new, change, limit))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", help="arquivo JSON com os resultados")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="linha de base para comparação")
+    parser.add_argument("--save-baseline", action="store_true", help="grava os resultados como nova linha de base")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="piora relativa tolerada (0.25 = 25%%) quando a métrica não tem limite próprio")
+    parser.add_argument("--scale", type=float, default=1.0, help="multiplica o número de iterações")
+    args = parser.parse_args()
+
+    os.chdir(ROOT)
+    sys.path.insert(0, ROOT)
+    results = run_benchmarks(args.scale)
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "metrics": results,
+    }
+
+    print(f"{'métrica':<40}{'valor':>12}")
+    for name, value in results.items():
+        print(f"{name:<40}{value:>12.2f}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    if args.save_baseline:
+        previous = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, encoding="utf-8") as f:
+                previous = json.load(f)
+        # Limites por métrica definidos manualmente são preservados
+        report["thresholds"] = previous.get("thresholds", {})
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nLinha de base gravada em {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        # Sem linha de base nenhuma regressão seria detectada: falha em vez de passar em silêncio
+        print(f"\nFALHA: sem linha de base em {args.baseline}; use --save-baseline para criá-la")
+        sys.exit(1)
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print("\nFALHA: regressões em relação à linha de base")
+        for name, old, new, change, limit in regressions:
+            print(f"  {name}: {old:.2f} -> {new:.2f} (+{change:.0%}, limite {limit:.0%})")
+        sys.exit(1)
+    print("\nOK: nenhuma regressão em relação à linha de base")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Benchmark de inicialização: mede o custo de importação dos módulos do jogo.
+
+Executa um interpretador novo com ``-X importtime`` para cada rodada, soma o tempo
+por pacote de nível superior e verifica que a pilha da câmera (cv2, mediapipe)
+não é carregada em uma inicialização somente com teclado.
+
+Uso:
+    python -m benchmarks.startup_benchmark [--runs 5] [--top 15] [--module src.game]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CAMERA_MODULES = ("cv2", "mediapipe")
+
+
+def _run_once(module: str) -> Tuple[float, Dict[str, int], List[str]]:
+    """
+    Importa o módulo em um processo novo e retorna (tempo total em s,
+    tempo cumulativo por pacote em µs, módulos da câmera carregados).
+    """
+    code = (
+        f"import sys; import {module}; "
+        f"print(','.join(m for m in {CAMERA_MODULES!r} if m in sys.modules))"
+    )
+    env = dict(os.environ, PYGAME_HIDE_SUPPORT_PROMPT="1")
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=True
+    )
+    elapsed = time.perf_counter() - start
+
+    per_package: Dict[str, int] = defaultdict(int)
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, _cumulative, name = line[len("import time:"):].split("|")
+        per_package[name.strip().split(".")[0]] += int(self_us)
+
+    loaded = [m for m in proc.stdout.strip().split(",") if m]
+    return elapsed, per_package, loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--module", default="src.game")
+    args = parser.parse_args()
+
+    totals = []
+    packages: Dict[str, List[int]] = defaultdict(list)
+    loaded_camera = set()
+    for _ in range(args.runs):
+        elapsed, per_package, loaded = _run_once(args.module)
+        totals.append(elapsed)
+        for name, us in per_package.items():
+            packages[name].append(us)
+        loaded_camera.update(loaded)
+
+    print(f"Importação de {args.module} ({args.runs} rodadas)")
+    print(f"  processo completo: mediana {statistics.median(totals) * 1000:.1f} ms, "
+          f"mín {min(totals) * 1000:.1f} ms")
+    print(f"\n  {'pacote':<24}{'mediana (ms)':>14}")
+    ranking = sorted(packages.items(), key=lambda item: statistics.median(item[1]), reverse=True)
+    for name, values in ranking[:args.top]:
+        print(f"  {name:<24}{statistics.median(values) / 1000:>14.2f}")
+
+    if loaded_camera:
+        print(f"\nFALHA: pilha da câmera importada na inicialização: {', '.join(sorted(loaded_camera))}")
+        sys.exit(1)
+    print("\nOK: cv2 e mediapipe não são importados na inicialização")
+
+
+if __name__ == "__main__":
+    main()
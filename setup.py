@@ -1,11 +1,33 @@
+import os
 from cx_Freeze import setup, Executable
+try:
+    from cx_Freeze.command.build_exe import build_exe
+except ImportError:  # cx_Freeze < 6.15
+    from cx_Freeze.dist import build_exe
+from src.config import Config
 
-# Inclua os arquivos de dados necessários
-include_files = [
-    ('assets/imagens', 'assets/imagens'),
-    ('assets/sons', 'assets/sons'),
-    ('assets/fonts', 'assets/fonts')
-]
+
+class BuildExeWithAssets(build_exe):
+    """
+    Gera o arquivo de recursos antes de copiar os arquivos do build. Fica aqui, e não no
+    nível do módulo, para que ``setup.py --help`` não inicie o pygame nem grave arquivos.
+    """
+
+    def run(self):
+        from src.asset_archive import build_archive
+        build_archive(Config.ASSET_ARCHIVE)
+        super().run()
+
+
+# Imagens, sons e fontes vão pré-processados em um único arquivo mapeado em memória
+include_files = [(Config.ASSET_ARCHIVE, Config.ASSET_ARCHIVE)]
+
+# A música é transmitida do disco e continua como arquivos soltos
+for playlist in Config.MUSIC_PLAYLISTS.values():
+    for track in playlist:
+        for ext in (".ogg", ".wav"):
+            if os.path.exists(track + ext) and (track + ext, track + ext) not in include_files:
+                include_files.append((track + ext, track + ext))
 
 # Especificar os pacotes ocultos
 packages = ['mediapipe', 'cv2', 'pygame._sdl2']
@@ -15,6 +37,7 @@ setup(
     name="SeuProjeto",
     version="1.0",
     description="Descrição do seu projeto",
+    cmdclass={'build_exe': BuildExeWithAssets},
     options={
         'build_exe': {
             'packages': packages,
@@ -22,4 +45,4 @@ setup(
         }
     },
     executables=[Executable('src/main.py', base='Win32GUI')]
-)
\ No newline at end of file
+)
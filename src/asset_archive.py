@@ -0,0 +1,149 @@
+"""
+Arquivo único de recursos pré-processados para builds congelados.
+
+O build empacota ``assets/`` em um arquivo indexado com imagens já redimensionadas,
+a bola já recortada em círculo e sons em PCM no formato do mixer. Em tempo de
+execução o arquivo é mapeado em memória e as imagens são criadas sem cópia com
+``pygame.image.frombuffer``:
+
+    python -m src.asset_archive [--output assets.pack]
+"""
+import argparse
+import io
+import json
+import mmap
+import os
+import struct
+from typing import Dict, Optional, Tuple
+import pygame
+
+_MAGIC = b"GAGP"
+_VERSION = 1
+_HEADER = struct.Struct("<4sBxxxQI")   # magic, versão, offset e tamanho do índice
+_ALIGN = 16
+
+# Formato PCM gravado no arquivo (o mesmo do pygame.mixer.init em Game, que não deixa o
+# SDL trocar a frequência nem os canais)
+MIXER_FORMAT = (44100, -16, 2)
+
+
+def image_key(path: str, size: Optional[Tuple[int, int]]) -> str:
+    return f"image|{path}|{size[0]}x{size[1]}" if size else f"image|{path}"
+
+
+def sound_key(path: str) -> str:
+    return f"sound|{path}"
+
+
+def font_key(path: str) -> str:
+    return f"font|{path}"
+
+
+BALL_SURFACE_KEY = "ball_surface"
+
+
+class AssetArchive:
+    """Leitor do arquivo de recursos, mapeado em memória uma única vez"""
+
+    def __init__(self, path: str):
+        self._file = open(path, "rb")
+        # Cópia na escrita: as superfícies apontam para o mapa sem risco se forem alteradas
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_COPY)
+        self._view = memoryview(self._map)
+        magic, version, index_offset, index_size = _HEADER.unpack_from(self._map)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"arquivo de recursos inválido: {path}")
+        self.index: Dict[str, dict] = json.loads(bytes(self._view[index_offset:index_offset + index_size]))
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.index
+
+    def _data(self, entry: dict) -> memoryview:
+        return self._view[entry["offset"]:entry["offset"] + entry["length"]]
+
+    def image(self, key: str) -> Optional[pygame.Surface]:
+        entry = self.index.get(key)
+        if entry is None:
+            return None
+        return pygame.image.frombuffer(self._data(entry), tuple(entry["size"]), entry["format"])
+
+    def sound(self, key: str) -> Optional[pygame.mixer.Sound]:
+        entry = self.index.get(key)
+        # O PCM só é válido se o mixer foi iniciado no mesmo formato do build
+        if entry is None or pygame.mixer.get_init() != tuple(entry["mixer"]):
+            return None
+        return pygame.mixer.Sound(buffer=self._data(entry))
+
+    def font(self, key: str, size: int) -> Optional[pygame.font.Font]:
+        entry = self.index.get(key)
+        if entry is None:
+            return None
+        return pygame.font.Font(io.BytesIO(self._data(entry)), size)
+
+
+class _ArchiveWriter:
+    def __init__(self, path: str):
+        self.path = path
+        self.index: Dict[str, dict] = {}
+        self._file = open(path, "wb")
+        self._file.write(bytes(_HEADER.size))
+
+    def add(self, key: str, data: bytes, **meta):
+        padding = -self._file.tell() % _ALIGN
+        self._file.write(bytes(padding))
+        self.index[key] = dict(meta, offset=self._file.tell(), length=len(data))
+        self._file.write(data)
+
+    def add_surface(self, key: str, surface: pygame.Surface):
+        has_alpha = bool(surface.get_flags() & pygame.SRCALPHA) or surface.get_colorkey() is not None
+        image_format = "RGBA" if has_alpha else "RGB"
+        self.add(key, pygame.image.tostring(surface, image_format), size=surface.get_size(), format=image_format)
+
+    def close(self):
+        index = json.dumps(self.index, sort_keys=True).encode("utf-8")
+        index_offset = self._file.tell()
+        self._file.write(index)
+        self._file.seek(0)
+        self._file.write(_HEADER.pack(_MAGIC, _VERSION, index_offset, len(index)))
+        self._file.close()
+
+
+def build_archive(output: str, root: str = ".") -> Dict[str, dict]:
+    """
+    Empacota os recursos do manifesto de pré-carregamento, já processados.
+    Deve ser executado a partir da raiz do projeto.
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.init()
+    pygame.mixer.init(*MIXER_FORMAT, allowedchanges=0)
+
+    from .asset_preloader import FONT_PATH, IMAGES, SOUNDS
+    from .ball import Ball
+
+    writer = _ArchiveWriter(output)
+    for _, path, size in IMAGES:
+        image = pygame.image.load(os.path.join(root, path))
+        writer.add_surface(image_key(path, size), pygame.transform.scale(image, size) if size else image)
+    writer.add_surface(BALL_SURFACE_KEY, Ball._create_circular_surface())
+    for path in SOUNDS:
+        sound = pygame.mixer.Sound(os.path.join(root, path))
+        writer.add(sound_key(path), sound.get_raw(), mixer=pygame.mixer.get_init())
+    with open(os.path.join(root, FONT_PATH), "rb") as f:
+        writer.add(font_key(FONT_PATH), f.read())
+    writer.close()
+    return writer.index
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", default="assets.pack")
+    args = parser.parse_args()
+
+    index = build_archive(args.output)
+    size = os.path.getsize(args.output)
+    print(f"{len(index)} recursos empacotados em {args.output} ({size / (1024 * 1024):.1f} MiB)")
+
+
+if __name__ == "__main__":
+    main()
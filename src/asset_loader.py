@@ -1,31 +1,105 @@
 import pygame
 import sys
 import os
-from typing import Tuple
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+from .config import Config
+from .asset_archive import AssetArchive, font_key, image_key, sound_key
 
 class AssetLoader:
+    # Recursos já carregados, compartilhados entre o pré-carregamento e os construtores
+    _cache: Dict[Hashable, Any] = {}
+    _cache_lock = threading.Lock()
+    _archive: Optional[AssetArchive] = None
+    _archive_checked = False
+
     @staticmethod
     def resource_path(relative_path: str) -> str:
         """
-        Retorna o caminho absoluto do recurso, considerando se o jogo está empacotado com PyInstaller.
+        Retorna o caminho absoluto do recurso, considerando se o jogo está empacotado com PyInstaller
+        ou cx_Freeze.
         """
         try:
             base_path = sys._MEIPASS
         except Exception:
-            base_path = os.path.abspath(".")
+            if getattr(sys, "frozen", False):
+                base_path = os.path.dirname(sys.executable)
+            else:
+                base_path = os.path.abspath(".")
         return os.path.join(base_path, relative_path)
 
+    @staticmethod
+    def archive() -> Optional[AssetArchive]:
+        """
+        Retorna o arquivo de recursos empacotado, mapeado em memória, se estiver em uso.
+        Por padrão ele só é usado em builds congelados, para não mascarar edições em ``assets/``.
+        """
+        with AssetLoader._cache_lock:
+            if not AssetLoader._archive_checked:
+                AssetLoader._archive_checked = True
+                enabled = Config.USE_ASSET_ARCHIVE
+                if enabled is None:
+                    enabled = getattr(sys, "frozen", False)
+                path = AssetLoader.resource_path(Config.ASSET_ARCHIVE)
+                if enabled and os.path.exists(path):
+                    try:
+                        AssetLoader._archive = AssetArchive(path)
+                    except (OSError, ValueError) as e:
+                        print(f"Erro ao abrir o arquivo de recursos: {e}")
+            return AssetLoader._archive
+
+    @staticmethod
+    def get_or_build(key: Hashable, builder: Callable[[], Any]) -> Any:
+        """
+        Retorna o recurso em cache ou o constrói (uma única vez) com a função fornecida.
+        """
+        with AssetLoader._cache_lock:
+            if key in AssetLoader._cache:
+                return AssetLoader._cache[key]
+        value = builder()
+        with AssetLoader._cache_lock:
+            return AssetLoader._cache.setdefault(key, value)
+
+    @staticmethod
+    def invalidate(key: Hashable):
+        """
+        Descarta um recurso do cache para que o próximo ``get_or_build`` o reconstrua.
+        """
+        with AssetLoader._cache_lock:
+            AssetLoader._cache.pop(key, None)
+
     @staticmethod
     def load_font(name: str, size: int) -> pygame.font.Font:
         """
         Carrega uma fonte com o nome e tamanho especificados.
         """
-        return pygame.font.Font(AssetLoader.resource_path(name), size)
+        def build():
+            archive = AssetLoader.archive()
+            font = archive.font(font_key(name), size) if archive else None
+            return font or pygame.font.Font(AssetLoader.resource_path(name), size)
+        return AssetLoader.get_or_build(("font", name, size), build)
 
     @staticmethod
     def load_image(path: str, size: Tuple[int, int] = None) -> pygame.Surface:
         """
         Carrega uma imagem do caminho especificado e a redimensiona se necessário.
         """
-        img = pygame.image.load(AssetLoader.resource_path(path))
-        return pygame.transform.scale(img, size) if size else img
\ No newline at end of file
+        def build():
+            archive = AssetLoader.archive()
+            img = archive.image(image_key(path, size)) if archive else None
+            if img:
+                return img
+            img = pygame.image.load(AssetLoader.resource_path(path))
+            return pygame.transform.scale(img, size) if size else img
+        return AssetLoader.get_or_build(("image", path, size), build)
+
+    @staticmethod
+    def load_sound(path: str) -> pygame.mixer.Sound:
+        """
+        Carrega um efeito sonoro.
+        """
+        def build():
+            archive = AssetLoader.archive()
+            sound = archive.sound(sound_key(path)) if archive else None
+            return sound or pygame.mixer.Sound(AssetLoader.resource_path(path))
+        return AssetLoader.get_or_build(("sound", path), build)
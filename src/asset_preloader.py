@@ -0,0 +1,137 @@
+import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+from .asset_loader import AssetLoader
+from .ball import Ball
+from .collision_shape import CollisionShape
+from .config import Config
+from .sound_manager import SoundManager
+
+
+class AssetTask(NamedTuple):
+    """Item do manifesto de recursos"""
+    name: str
+    load: Callable[[], object]
+    deps: Tuple[str, ...] = ()
+    main_thread: bool = False  # fontes (SDL_ttf) são carregadas na thread principal
+
+
+FONT_PATH = "assets/fonts/PressStart2P-Regular.ttf"
+
+# Imagens (nome, caminho, tamanho) e sons usados pelo jogo; também definem o conteúdo
+# do arquivo de recursos empacotado (asset_archive)
+IMAGES = [
+    ("grass", "assets/imagens/grass.png", (Config.FIELD_WIDTH, Config.FIELD_HEIGHT)),
+    ("head1", "assets/imagens/head1.png", (35, 30)),
+    ("head2", "assets/imagens/head2.png", (35, 30)),
+    ("player1", "assets/imagens/player1.png", (Config.PADDLE_WIDTH, Config.PADDLE_HEIGHT)),
+    ("player2", "assets/imagens/player2.png", (Config.PADDLE_WIDTH, Config.PADDLE_HEIGHT)),
+    ("soccer_ball", "assets/imagens/soccer_ball.png", None),
+]
+SOUNDS = [f"assets/sons/{name}.wav" for name in ("goal", "collision", "button_click", "button_hover", "start")]
+FONT_SIZES = list(Config.FONT_SIZES.values()) + [10]
+
+
+def default_manifest() -> List[AssetTask]:
+    """
+    Recursos usados pelo SoundManager, UIManager, Ball e Paddle, com as mesmas
+    chaves de cache que os construtores consultam.
+    """
+    manifest = [
+        AssetTask(name, lambda path=path, size=size: AssetLoader.load_image(path, size))
+        for name, path, size in IMAGES
+    ]
+    manifest.append(AssetTask("ball_surface", Ball.load_surface, deps=("soccer_ball",)))
+    manifest += [
+        AssetTask(f"{name}_shape", lambda path=path, size=size: CollisionShape.load(path, size), deps=(name,))
+        for name, path, size in IMAGES if name.startswith("player")
+    ]
+    manifest += [
+        AssetTask(f"sound_{os.path.basename(path)[:-4]}", lambda path=path: AssetLoader.load_sound(path))
+        for path in SOUNDS
+    ]
+    manifest.append(AssetTask("collision_bank", SoundManager.load_collision_bank, deps=("sound_collision",)))
+    manifest += [
+        AssetTask(f"font_{size}", lambda size=size: AssetLoader.load_font(FONT_PATH, size), main_thread=True)
+        for size in FONT_SIZES
+    ]
+    return manifest
+
+
+class AssetPreloader:
+    """
+    Decodifica e redimensiona os recursos do manifesto em um pool de threads,
+    respeitando as dependências. ``poll`` é chamado a cada quadro da tela de carregamento.
+    """
+
+    def __init__(self, manifest: Optional[List[AssetTask]] = None, workers: int = Config.ASSET_LOADER_WORKERS):
+        self.tasks: Dict[str, AssetTask] = {task.name: task for task in (manifest or default_manifest())}
+        self.workers = workers
+        self.completed: Dict[str, float] = {}
+        self.errors: Dict[str, BaseException] = {}
+        self._running: Dict[str, Future] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.started_at = 0.0
+        self.finished_at = 0.0
+
+    def start(self):
+        self.started_at = time.perf_counter()
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="assets")
+        self._schedule()
+
+    @property
+    def progress(self) -> float:
+        return (len(self.completed) + len(self.errors)) / max(len(self.tasks), 1)
+
+    @property
+    def done(self) -> bool:
+        return len(self.completed) + len(self.errors) == len(self.tasks)
+
+    def _ready(self, task: AssetTask) -> bool:
+        return all(dep in self.completed or dep in self.errors for dep in task.deps)
+
+    def _schedule(self):
+        for name, task in self.tasks.items():
+            if name in self._running or name in self.completed or name in self.errors:
+                continue
+            if not task.main_thread and self._ready(task):
+                self._running[name] = self._executor.submit(self._timed, task.load)
+
+    @staticmethod
+    def _timed(load: Callable[[], object]) -> float:
+        start = time.perf_counter()
+        load()
+        return time.perf_counter() - start
+
+    def poll(self, budget_s: float = 0.008):
+        """
+        Coleta tarefas concluídas, agenda as liberadas e executa tarefas da thread
+        principal dentro do orçamento de tempo do quadro.
+        """
+        for name, future in list(self._running.items()):
+            if not future.done():
+                continue
+            del self._running[name]
+            error = future.exception()
+            if error:
+                print(f"Erro ao pré-carregar {name}: {error}")
+                self.errors[name] = error
+            else:
+                self.completed[name] = future.result()
+
+        deadline = time.perf_counter() + budget_s
+        for name, task in self.tasks.items():
+            if time.perf_counter() >= deadline:
+                break
+            if task.main_thread and name not in self.completed and name not in self.errors and self._ready(task):
+                try:
+                    self.completed[name] = self._timed(task.load)
+                except Exception as e:
+                    print(f"Erro ao pré-carregar {name}: {e}")
+                    self.errors[name] = e
+
+        self._schedule()
+        if self.done and not self.finished_at:
+            self.finished_at = time.perf_counter()
+            self._executor.shutdown(wait=False)
@@ -2,25 +2,51 @@ import pygame
 import random
 from .config import Config
 from .asset_loader import AssetLoader
+from .asset_archive import BALL_SURFACE_KEY
+from .collision_shape import CollisionShape
+from .quality_presets import QualitySettings
 
 class Ball:
     def __init__(self):
         self.original_image = AssetLoader.load_image("assets/imagens/soccer_ball.png")
-        self.image = self._create_circular_surface()
+        self.image = Ball.load_surface()
+        self.mask = CollisionShape.ball_mask(self.image)
         self.reset()
 
-    def _create_circular_surface(self) -> pygame.Surface:
+    @staticmethod
+    def load_surface() -> pygame.Surface:
         """
-        Cria uma superfície circular para a bola.
+        Retorna a superfície circular da bola, criada uma única vez.
         """
+        return AssetLoader.get_or_build("ball_surface", Ball._create_circular_surface)
+
+    def reload_surface(self):
+        """
+        Reconstrói a superfície com o preset de qualidade atual (suavização da imagem).
+        """
+        AssetLoader.invalidate("ball_surface")
+        self.image = Ball.load_surface()
+        self.mask = CollisionShape.ball_mask(self.image)
+
+    @staticmethod
+    def _create_circular_surface() -> pygame.Surface:
+        """
+        Cria uma superfície circular para a bola (ou a lê já pronta do arquivo de recursos).
+        """
+        archive = AssetLoader.archive()
+        if archive and QualitySettings.current().smooth_scaling and BALL_SURFACE_KEY in archive:
+            return archive.image(BALL_SURFACE_KEY)
+
+        original_image = AssetLoader.load_image("assets/imagens/soccer_ball.png")
         size = Config.BALL_SIZE
         surface = pygame.Surface((size, size), pygame.SRCALPHA)
         
         # Redimensionar mantendo proporções
-        img_width, img_height = self.original_image.get_size()
+        img_width, img_height = original_image.get_size()
         scale = min(size/img_width, size/img_height)
         new_size = (int(img_width * scale), int(img_height * scale))
-        scaled_img = pygame.transform.smoothscale(self.original_image, new_size)
+        scale_fn = pygame.transform.smoothscale if QualitySettings.current().smooth_scaling else pygame.transform.scale
+        scaled_img = scale_fn(original_image, new_size)
         
         # Centralizar na superfície
         x_pos = (size - new_size[0]) // 2
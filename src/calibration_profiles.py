@@ -0,0 +1,64 @@
+import json
+import os
+import re
+from typing import Optional
+from .config import Config
+
+
+class CalibrationProfiles:
+    """
+    Perfis de calibração do rastreamento de cabeça salvos em disco, um por jogador.
+    """
+    _KEYS = ('min_x', 'max_x', 'min_y', 'max_y', 'center_x', 'center_y')
+
+    @staticmethod
+    def profile_path(player_name: str) -> Optional[str]:
+        """
+        Retorna o caminho do perfil do jogador, ou None se o nome for vazio.
+        """
+        slug = re.sub(r'[^a-z0-9_-]+', '_', player_name.strip().lower()).strip('_')
+        if not slug:
+            return None
+        return os.path.join(Config.USER_DATA_DIR, "profiles", f"{slug}.json")
+
+    @staticmethod
+    def load(player_name: str) -> Optional[dict]:
+        """
+        Carrega os dados de calibração do jogador, se existirem e forem válidos.
+        """
+        path = CalibrationProfiles.profile_path(player_name)
+        if not path or not os.path.exists(path):
+            return None
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)["calibration"]
+            data = {key: float(data[key]) for key in CalibrationProfiles._KEYS}
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"Perfil de calibração inválido ({path}): {e}")
+            return None
+
+        if data['max_x'] <= data['min_x'] or data['max_y'] <= data['min_y']:
+            return None
+        return data
+
+    @staticmethod
+    def save(player_name: str, calibration_data: dict) -> bool:
+        """
+        Salva os dados de calibração do jogador.
+        """
+        path = CalibrationProfiles.profile_path(player_name)
+        if not path:
+            return False
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({
+                    "player": player_name.strip(),
+                    "calibration": {key: float(calibration_data[key]) for key in CalibrationProfiles._KEYS}
+                }, f, indent=2)
+            os.replace(tmp_path, path)
+            return True
+        except OSError as e:
+            print(f"Erro ao salvar perfil de calibração: {e}")
+            return False
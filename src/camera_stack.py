@@ -0,0 +1,126 @@
+import importlib
+import threading
+from typing import Optional
+from .config import Config
+
+
+class CameraStack:
+    """
+    Importa OpenCV e MediaPipe somente quando o controle "Virtual" é usado,
+    mantendo a inicialização rápida quando os dois jogadores usam o teclado.
+    """
+    _preload_thread: Optional[threading.Thread] = None
+
+    _BACKENDS = {
+        "thread": (".head_tracker", "FaceSource"),
+        "process": (".process_head_tracker", "ProcessFaceSource"),
+    }
+
+    @staticmethod
+    def preload():
+        """
+        Importa a pilha da câmera em segundo plano (por exemplo, depois que o menu aparece).
+        """
+        if CameraStack._preload_thread is not None:
+            return
+        CameraStack._preload_thread = threading.Thread(
+            target=CameraStack._import_backend, args=(Config.HEAD_TRACKER_BACKEND,), daemon=True
+        )
+        CameraStack._preload_thread.start()
+
+    @staticmethod
+    def _import_backend(backend: str):
+        module_name, _ = CameraStack._BACKENDS[backend]
+        try:
+            importlib.import_module(module_name, __package__)
+        except Exception as e:
+            # O erro reaparece (e é tratado) quando o rastreamento for ativado
+            print(f"Erro ao pré-carregar a câmera: {e}")
+
+    @staticmethod
+    def source_class(backend: Optional[str] = None) -> type:
+        """
+        Retorna a classe da fonte de rostos (câmera + detector), importando-a se necessário.
+        Se o pré-carregamento estiver em andamento, a trava de importação do Python
+        faz esta chamada aguardar o término em vez de importar duas vezes.
+        """
+        module_name, class_name = CameraStack._BACKENDS[backend or Config.HEAD_TRACKER_BACKEND]
+        module = importlib.import_module(module_name, __package__)
+        return getattr(module, class_name)
+
+    @staticmethod
+    def tracker_class() -> type:
+        """Retorna a classe do rastreador de cabeça de um jogador"""
+        return importlib.import_module(".head_tracker", __package__).HeadTracker
+
+    @staticmethod
+    def cv2():
+        """Retorna o módulo cv2, importando-o na primeira chamada"""
+        return importlib.import_module("cv2")
+
+
+class TrackerLoader:
+    """
+    Carrega o modelo e abre a câmera em segundo plano, sem travar a janela.
+    O progresso fica disponível em ``status`` e ``progress`` para a interface.
+    Os dois jogadores compartilham a mesma fonte (uma câmera e uma inferência por quadro);
+    ``side`` indica qual rosto o rastreador criado deve seguir.
+    """
+    LOADING = "loading"
+    READY = "ready"
+    ERROR = "error"
+
+    _source = None
+    _source_lock = threading.Lock()
+
+    def __init__(self, side: int = 0):
+        self.side = side
+        self.status = TrackerLoader.LOADING
+        self.progress = "Preparando câmera..."
+        self.tracker = None
+        self.error: Optional[str] = None
+        self._cancelled = False
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def cancel(self):
+        """Descarta o carregamento; o rastreador é liberado assim que ficar pronto"""
+        with self._lock:
+            self._cancelled = True
+            tracker, self.tracker = self.tracker, None
+        if tracker:
+            tracker.stop()
+
+    def _run(self):
+        tracker = None
+        try:
+            self.progress = "Importando bibliotecas..."
+            source_class = CameraStack.source_class()
+            tracker_class = CameraStack.tracker_class()
+            with TrackerLoader._source_lock:
+                source = TrackerLoader._source
+                if not isinstance(source, source_class):
+                    self.progress = "Carregando modelo..."
+                    source = TrackerLoader._source = source_class()
+                self.progress = "Abrindo câmera..."
+                source.open_camera()
+            tracker = tracker_class(source, self.side)
+        except Exception as e:
+            print(f"Erro ao iniciar webcam: {e}")
+            if tracker:
+                tracker.stop()
+            self.error = str(e)
+            self.progress = "Erro ao abrir câmera"
+            self.status = TrackerLoader.ERROR
+            return
+
+        with self._lock:
+            if self._cancelled:
+                tracker.stop()
+                return
+            self.tracker = tracker
+            self.progress = "Câmera pronta"
+            self.status = TrackerLoader.READY
@@ -0,0 +1,77 @@
+from typing import List, Optional, Tuple
+import pygame
+from .asset_loader import AssetLoader
+
+# Raio da média móvel usada para estimar as normais do contorno
+_NORMAL_SMOOTHING = 4
+
+
+class CollisionShape:
+    """
+    Geometria de colisão derivada do canal alfa de um sprite: a máscara de pixels
+    (``pygame.mask``) e, para cada pixel, a normal do contorno mais próximo, calculadas
+    uma única vez e reutilizadas a cada colisão.
+    """
+
+    def __init__(self, surface: pygame.Surface):
+        self.mask = pygame.mask.from_surface(surface)
+        self.size = surface.get_size()
+        self.normals = self._compute_normals(surface)
+
+    @staticmethod
+    def load(image_path: str, size: Tuple[int, int]) -> "CollisionShape":
+        """Forma do sprite já redimensionado, em cache pelo caminho e tamanho"""
+        return AssetLoader.get_or_build(
+            ("collision_shape", image_path, size),
+            lambda: CollisionShape(AssetLoader.load_image(image_path, size))
+        )
+
+    @staticmethod
+    def ball_mask(surface: pygame.Surface) -> pygame.mask.Mask:
+        """Máscara da bola (circular, não depende da rotação)"""
+        return AssetLoader.get_or_build("ball_mask", lambda: pygame.mask.from_surface(surface))
+
+    def _compute_normals(self, surface: pygame.Surface) -> List[List[Tuple[float, float]]]:
+        """
+        Normal de saída em cada pixel: o gradiente (invertido) da ocupação suavizada.
+        Onde o gradiente se anula, usa a direção a partir do centro de massa da máscara.
+        """
+        import numpy as np
+
+        occupancy = (pygame.surfarray.array_alpha(surface) > 127).astype(np.float32)
+        r = _NORMAL_SMOOTHING
+        padded = np.pad(occupancy, r)
+        # Média móvel (caixa) via somas acumuladas nos dois eixos
+        summed = np.zeros((padded.shape[0] + 1, padded.shape[1] + 1), dtype=np.float32)
+        summed[1:, 1:] = padded.cumsum(0).cumsum(1)
+        k = 2 * r + 1
+        blurred = (summed[k:, k:] - summed[:-k, k:] - summed[k:, :-k] + summed[:-k, :-k]) / (k * k)
+        grad_x, grad_y = np.gradient(blurred)
+        nx, ny = -grad_x, -grad_y
+
+        width, height = self.size
+        cx, cy = self.mask.centroid()
+        xs, ys = np.meshgrid(np.arange(width), np.arange(height), indexing="ij")
+        length = np.hypot(nx, ny)
+        flat = length < 1e-3
+        nx = np.where(flat, xs - cx, nx)
+        ny = np.where(flat, ys - cy, ny)
+        length = np.hypot(nx, ny)
+        length[length == 0] = 1
+        nx, ny = nx / length, ny / length
+        # Listas Python: a consulta por colisão fica mais barata que indexar o array
+        return [list(zip(col_x, col_y)) for col_x, col_y in zip(nx.tolist(), ny.tolist())]
+
+    def contact(self, offset: Tuple[int, int], other: pygame.mask.Mask) -> Optional[Tuple[int, int]]:
+        """
+        Ponto de contato (coordenadas locais) com a máscara ``other`` deslocada de
+        ``offset``, ou None se não houver sobreposição de pixels.
+        """
+        if self.mask.overlap(other, offset) is None:
+            return None
+        return self.mask.overlap_mask(other, offset).centroid()
+
+    def normal_at(self, point: Tuple[int, int]) -> Tuple[float, float]:
+        x = min(max(point[0], 0), self.size[0] - 1)
+        y = min(max(point[1], 0), self.size[1] - 1)
+        return self.normals[x][y]
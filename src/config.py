@@ -1,3 +1,6 @@
+import os
+
+
 class Config:
     WIDTH, HEIGHT = 1600, 1000
     FIELD_OFFSET_X, FIELD_OFFSET_Y = 100, 50
@@ -18,3 +21,66 @@ class Config:
     TIME_OPTIONS = [60, 180, 300]
     HEAD_TRACKING_SMOOTHING = 0.1
     MIN_HEAD_MOVEMENT = 0.005
+    HEAD_CALIBRATION_LOW_QUANTILE = 0.05
+    HEAD_CALIBRATION_HIGH_QUANTILE = 0.95
+    HEAD_TRACKER_BACKEND = "thread"  # "thread" ou "process"
+    HEAD_TRACKER_RING_SLOTS = 3
+    HEAD_TRACKER_MAX_FACES = 2  # rostos por quadro (um por jogador com controle "Virtual")
+    HEAD_TRACKER_MAX_JUMP = 0.2  # deslocamento máximo (fração da imagem) para manter a identidade
+    HEAD_TRACKER_LOST_FRAMES = 30  # quadros sem um rosto até reidentificá-lo pelo lado
+    HEAD_TRACKER_MODEL = None  # 0 = curto alcance (mais rápido), 1 = alcance completo, None = preset de qualidade
+    HEAD_TRACKER_INPUT_SIZE = None  # imagem enviada ao detector, por exemplo (320, 240); None = quadro inteiro
+    HEAD_TRACKER_AUTO_DETECTOR = False  # mede as combinações abaixo em quadros reais e escolhe a mais barata
+    HEAD_TRACKER_INPUT_SIZES = ((160, 120), (320, 240), None)
+    HEAD_TRACKER_AUTO_FRAMES = 30  # quadros medidos por combinação
+    HEAD_TRACKER_AUTO_MIN_RATE = 0.9  # taxa de detecção mínima, relativa à melhor combinação
+    HEAD_MOTION_GATING = True  # só roda o detector quando a imagem muda (ou na taxa mínima)
+    HEAD_MOTION_GRID = (32, 24)  # miniatura em tons de cinza usada para medir o movimento
+    HEAD_MOTION_THRESHOLD = 8  # diferença de cinza (0-255) para uma célula da miniatura mudar
+    HEAD_MOTION_MIN_CELLS = 2  # células alteradas que contam como movimento (ignora ruído isolado)
+    HEAD_IDLE_DETECTION_RATE = 2.0  # detecções por segundo com a imagem parada
+    HEAD_MOTION_SETTLE_FRAMES = 3  # detecções extras após o movimento, até a suavização alcançar o rosto
+    PRELOAD_CAMERA_STACK = False
+    PREWARM_CAMERA = False
+    USER_DATA_DIR = os.path.join(os.path.expanduser("~"), ".golagol")
+    CALIBRATION_PROFILE_CHECK_FRAMES = 15
+    CALIBRATION_PROFILE_MARGIN = 0.25
+    CALIBRATION_PROFILE_MIN_HIT_RATIO = 0.6
+    AUDIO_VOICES = 8
+    MUSIC_PLAYLISTS = {
+        'menu': ["assets/sons/background"],
+        'match': ["assets/sons/background"],
+    }
+    MUSIC_VOLUME = 0.3
+    MUSIC_FADE_MS = 400  # fade de saída da faixa atual e depois de entrada da próxima (um só stream)
+    ASSET_LOADER_WORKERS = 4
+    GAMEPAD_DEADZONE = 0.15
+    INPUT_LATENCY_WINDOW = 256
+    CPU_REACTION_FRAMES = 8
+    CPU_AIM_ERROR = 25
+    NET_TICK_RATE = 60
+    NET_INPUT_DELAY = 2
+    NET_MAX_ROLLBACK = 12
+    NET_INPUTS_PER_PACKET = 16
+    NET_FINISH_TIMEOUT = 5.0  # segundos esperando as últimas entradas (ou a confirmação delas) no fim da partida
+    NET_FINISH_GRACE = 0.5  # segundos reenviando depois do fim, caso a confirmação enviada ao outro lado se perca
+    SPECTATOR_PORT = 7790
+    SPECTATOR_RATE = 20  # snapshots por segundo
+    SPECTATOR_HISTORY = 64
+    SPECTATOR_CLIENT_TIMEOUT = 5.0
+    TELEMETRY_PATH = os.path.join(USER_DATA_DIR, "telemetry.bin")
+    MATCH_SNAPSHOT_PATH = os.path.join(USER_DATA_DIR, "partida.snap")
+    AUTOSAVE_MATCH = True
+    STATS_BINS = (56, 36)  # células do mapa de calor (largura, altura do campo)
+    STATS_EXPORT = True
+    STATS_DIR = os.path.join(USER_DATA_DIR, "stats")
+    RECORD_REPLAYS = True
+    REPLAY_DIR = os.path.join(USER_DATA_DIR, "replays")
+    REPLAY_VIDEO_FPS = 30
+    SIM_EVENT_CAPACITY = 16  # eventos de física por tick (os excedentes são descartados)
+    SIMULATION_RATE = 60  # passos de física por segundo (a velocidade do jogo depende disso)
+    QUALITY_PRESET = None  # "low", "medium", "high", "ultra" ou None para escolher automaticamente
+    QUALITY_PROVISIONAL_PRESET = "medium"  # usado até o benchmark da primeira execução terminar
+    QUALITY_FILE = os.path.join(USER_DATA_DIR, "quality.json")
+    ASSET_ARCHIVE = "assets.pack"
+    USE_ASSET_ARCHIVE = None  # None: só em builds congelados; True/False força
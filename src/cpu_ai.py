@@ -0,0 +1,124 @@
+import random
+from typing import Optional, Tuple
+from .config import Config
+
+
+def predict_intercept_y(x: float, y: float, speed_x: float, speed_y: float,
+                        target_x: float, top: float, bottom: float) -> Optional[Tuple[float, float]]:
+    """
+    Resolve analiticamente onde o centro da bola cruza ``target_x``, refletindo nas
+    paredes superior e inferior (o intervalo [top, bottom] é "dobrado" sobre si mesmo).
+    Retorna (y, quadros até o cruzamento) ou None se a bola não chega a ``target_x``.
+    """
+    if speed_x == 0 or (target_x - x) * speed_x <= 0:
+        return None
+    frames = (target_x - x) / speed_x
+    height = bottom - top
+    if height <= 0:
+        return top, frames
+
+    # Posição "desdobrada" reduzida a um período de ida e volta
+    unfolded = (y - top + speed_y * frames) % (2 * height)
+    folded = unfolded if unfolded <= height else 2 * height - unfolded
+    return top + folded, frames
+
+
+class CpuController:
+    """
+    Oponente controlado pela CPU que prevê a trajetória da bola uma vez por jogada
+    (toque de um jogador ou reinício). A dificuldade é expressa como tempo de reação e
+    erro de mira, não como ruído a cada quadro. Rebotes nas paredes e acelerações da
+    mesma jogada só recalculam o ponto de interceptação, sem novo sorteio nem nova reação.
+    """
+
+    def __init__(self, paddle, reaction_frames: int = Config.CPU_REACTION_FRAMES,
+                 aim_error: float = Config.CPU_AIM_ERROR):
+        self.paddle = paddle
+        self.reaction_frames = reaction_frames
+        self.aim_error = aim_error
+        self._velocity: Optional[Tuple[float, float]] = None
+        self._direction = 0  # sinal de speed_x na jogada atual
+        self._last_center: Optional[Tuple[int, int]] = None
+        self._error = 0.0  # sorteio do erro de mira da jogada, em unidades de ``aim_error``
+        self._target: Optional[Tuple[float, float]] = self._home()
+        self._pending: Optional[Tuple[float, float]] = None
+        self._has_pending = False
+        self._pending_in = 0
+
+    def _home(self) -> Tuple[float, float]:
+        """Posição de espera: no meio da própria metade, alinhada ao centro do gol"""
+        left, right, top, bottom = self.paddle.constraints
+        depth = 0.75 if self.paddle.side else 0.25
+        return left + (right - left) * depth, top + (bottom - top) / 2
+
+    def _in_own_half(self, ball) -> bool:
+        left, right, _top, _bottom = self.paddle.constraints
+        return ball.rect.centerx >= left if self.paddle.side else ball.rect.centerx <= right
+
+    def _plan(self, ball) -> Optional[Tuple[float, float]]:
+        """
+        Calcula o ponto de interceptação para a velocidade atual da bola.
+        Retorna None quando a bola está na própria metade sem vir em direção ao gol:
+        nesse caso a CPU ataca a bola por trás.
+        """
+        home_x, home_y = self._home()
+        radius = Config.BALL_SIZE / 2
+
+        # Só intercepta bolas vindo em direção à própria linha de defesa
+        intercept = predict_intercept_y(
+            ball.rect.centerx, ball.rect.centery, ball.speed_x, ball.speed_y,
+            home_x, Config.FIELD_OFFSET_Y + radius, Config.FIELD_OFFSET_Y + Config.FIELD_HEIGHT - radius
+        )
+        if intercept is None:
+            if self._in_own_half(ball):
+                return None
+            # Volta para a posição de espera acompanhando a bola de longe
+            return home_x, (home_y + ball.rect.centery) / 2
+
+        y, frames = intercept
+        # Erro de mira cresce com o tempo de voo restante
+        return home_x, y + self._error * self.aim_error * min(1.0, frames / 60)
+
+    def update(self, ball):
+        """
+        Planeja uma nova jogada só quando ``speed_x`` troca de sinal ou a bola é
+        reposicionada; outras mudanças de velocidade mantêm o sorteio e o tempo de
+        reação e só atualizam o alvo (a previsão é analítica e barata).
+        """
+        center = ball.rect.center
+        velocity = (ball.speed_x, ball.speed_y)
+        direction = (ball.speed_x > 0) - (ball.speed_x < 0)
+        # Reinício após gol: a bola salta para o centro sem trocar necessariamente de sentido
+        teleported = (self._last_center is not None
+                      and abs(center[0] - self._last_center[0]) > 2 * abs(ball.speed_x) + Config.BALL_SIZE)
+        self._last_center = center
+
+        if direction != self._direction or teleported:
+            self._direction, self._velocity = direction, velocity
+            self._error = random.gauss(0, 1)
+            self._pending = self._plan(ball)
+            self._pending_in = self.reaction_frames
+            self._has_pending = True
+        elif velocity != self._velocity:
+            self._velocity = velocity
+            if self._has_pending:
+                self._pending = self._plan(ball)
+            else:
+                self._target = self._plan(ball)
+
+        if self._has_pending:
+            if self._pending_in <= 0:
+                self._target, self._has_pending = self._pending, False
+            else:
+                self._pending_in -= 1
+
+        target = self._target
+        if target is None:
+            # Ataque por trás: empurra a bola de volta para o campo adversário
+            behind = (Config.BALL_SIZE + self.paddle.rect.width) / 2
+            target = (ball.rect.centerx + (behind if self.paddle.side else -behind), ball.rect.centery)
+
+        speed = self.paddle.cpu_speed
+        dx = target[0] - self.paddle.rect.centerx
+        dy = target[1] - self.paddle.rect.centery
+        return max(min(dx, speed), -speed), max(min(dy, speed), -speed)
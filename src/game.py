@@ -1,6 +1,8 @@
 import pygame
+import struct
 import sys
-import cv2
+import time
+from typing import List, Optional
 from .config import Config
 from .game_state import GameState
 from .sound_manager import SoundManager
@@ -9,48 +11,108 @@ from .ball import Ball
 from .paddle import Paddle
 from .physics_engine import PhysicsEngine
 from .input_handler import InputHandler
+from .camera_stack import CameraStack
+from .asset_preloader import AssetPreloader
+from .input_bindings import ActionMap
+from .quality_presets import QualitySettings
+from .game_snapshot import GameSnapshot
+from .sim_events import EventBus
+from .replay import Replay
 
 
 
 class Game:
-    def __init__(self):
+    def __init__(self, started_at: Optional[float] = None, quality: Optional[str] = None):
+        started_at = started_at or time.perf_counter()
         pygame.init()
-        pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
+        self.quality = QualitySettings.select(quality)
+        # allowedchanges=0: o SDL converte para o formato do dispositivo, e o PCM do arquivo
+        # de recursos (gravado em MIXER_FORMAT) continua válido em placas de 48 kHz
+        pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=self.quality.mixer_buffer, allowedchanges=0)
+        self.mixer_buffer = self.quality.mixer_buffer
         self.window = pygame.display.set_mode((Config.WIDTH, Config.HEIGHT))
         pygame.display.set_caption("Futebol Game Desktop")
-        
+
+        # Recursos decodificados em paralelo enquanto a tela de carregamento é exibida
+        self.startup_metrics = {}
+        self._preload_assets(started_at)
+
         self.state = GameState()
+        self.input = ActionMap()
         self.sound_manager = SoundManager()
         self.ui = UIManager(self.state, self.sound_manager)
         self.ball = Ball()
-        self.paddles = [
-            Paddle("assets/imagens/player1.png", (
-                Config.FIELD_OFFSET_X,
-                Config.FIELD_OFFSET_X + Config.FIELD_WIDTH // 2,
-                Config.FIELD_OFFSET_Y,
-                Config.FIELD_OFFSET_Y + Config.FIELD_HEIGHT
-            )),
-            Paddle("assets/imagens/player2.png", (
-                Config.FIELD_OFFSET_X + Config.FIELD_WIDTH // 2,
-                Config.FIELD_OFFSET_X + Config.FIELD_WIDTH,
-                Config.FIELD_OFFSET_Y,
-                Config.FIELD_OFFSET_Y + Config.FIELD_HEIGHT
-            ),  ball=self.ball)
-        ]
-        self.paddles[0].rect.topleft = (Config.FIELD_OFFSET_X + 50, Config.HEIGHT//2 - Config.PADDLE_HEIGHT//2)
-        self.paddles[1].rect.topleft = (Config.FIELD_OFFSET_X + Config.FIELD_WIDTH - 50 - Config.PADDLE_WIDTH, Config.HEIGHT//2 - Config.PADDLE_HEIGHT//2)
+        self.paddles = Game.create_paddles(self.ball)
+        # Eventos da física, consumidos pelos assinantes uma vez por tick
+        self.events = EventBus()
+        self.events.subscribe(self.sound_manager.on_sim_events)
+        self.session = None
+        self.spectators = None
+        self.telemetry = None
+        self.stats = None
+        self.replay: Optional[Replay] = None
 
         self.clock = pygame.time.Clock()
         self.timer_event = pygame.USEREVENT + 1
         pygame.time.set_timer(self.timer_event, 1000)
 
+        self.startup_metrics['total_ms'] = (time.perf_counter() - started_at) * 1000
+        print("Inicialização: primeiro quadro em {first_pixel_ms:.0f} ms, recursos em {assets_ms:.0f} ms, "
+              "total {total_ms:.0f} ms".format(**self.startup_metrics))
+
+    def _preload_assets(self, started_at: float):
+        """
+        Exibe a tela de carregamento enquanto o pool de threads prepara os recursos.
+        """
+        preloader = AssetPreloader()
+        preloader.start()
+        clock = pygame.time.Clock()
+
+        while True:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    pygame.quit()
+                    sys.exit()
+
+            preloader.poll()
+            self._draw_loading_screen(preloader.progress)
+            if 'first_pixel_ms' not in self.startup_metrics:
+                self.startup_metrics['first_pixel_ms'] = (time.perf_counter() - started_at) * 1000
+            if preloader.done:
+                break
+            clock.tick(self.quality.fps)
+
+        self.startup_metrics['assets_ms'] = (preloader.finished_at - preloader.started_at) * 1000
+
+    def _draw_loading_screen(self, progress: float):
+        """
+        Desenha a barra de progresso do carregamento (sem fontes, que ainda estão carregando).
+        """
+        self.window.fill(Config.BLACK)
+        bar = pygame.Rect(Config.WIDTH // 2 - 300, Config.HEIGHT // 2 - 15, 600, 30)
+        fill = bar.inflate(-8, -8)
+        fill.width = int(fill.width * progress)
+        pygame.draw.rect(self.window, Config.GOLD, fill, border_radius=8)
+        pygame.draw.rect(self.window, Config.WHITE, bar, 3, border_radius=10)
+        pygame.display.flip()
+
     def reset(self):
         """
         Reseta o estado do jogo.
         """
         self.state.reset()
         self.ball.reset()
-        self.paddles = [
+        # Os rastreadores dos jogadores antigos ainda estão presos à câmera compartilhada
+        for paddle in self.paddles:
+            paddle.disable_head_tracking()
+        self.paddles = Game.create_paddles(self.ball)
+
+    @staticmethod
+    def create_paddles(ball: Ball) -> List[Paddle]:
+        """
+        Cria os dois jogadores nas posições iniciais.
+        """
+        paddles = [
             Paddle("assets/imagens/player1.png", (
                 Config.FIELD_OFFSET_X,
                 Config.FIELD_OFFSET_X + Config.FIELD_WIDTH//2,
@@ -62,21 +124,54 @@ class Game:
                 Config.FIELD_OFFSET_X + Config.FIELD_WIDTH,
                 Config.FIELD_OFFSET_Y,
                 Config.FIELD_OFFSET_Y + Config.FIELD_HEIGHT
-            ), ball=self.ball)
+            ), ball=ball, side=1)
         ]
-
-        self.paddles[0].rect.topleft = (Config.FIELD_OFFSET_X + 50, Config.HEIGHT//2 - Config.PADDLE_HEIGHT//2)
-        self.paddles[1].rect.topleft = (Config.FIELD_OFFSET_X + Config.FIELD_WIDTH - 50 - Config.PADDLE_WIDTH, Config.HEIGHT//2 - Config.PADDLE_HEIGHT//2)
+        paddles[0].rect.topleft = (Config.FIELD_OFFSET_X + 50, Config.HEIGHT//2 - Config.PADDLE_HEIGHT//2)
+        paddles[1].rect.topleft = (Config.FIELD_OFFSET_X + Config.FIELD_WIDTH - 50 - Config.PADDLE_WIDTH, Config.HEIGHT//2 - Config.PADDLE_HEIGHT//2)
+        return paddles
 
     def run(self):
         """
         Inicia o loop principal do jogo.
         """
+        first_frame = True
         while True:
+            # Com menos quadros por segundo a física dá mais passos por quadro, mantendo a velocidade do jogo
+            steps_per_frame = max(1, Config.SIMULATION_RATE // self.quality.fps)
             self._handle_events()
-            self._update()
+            for _ in range(steps_per_frame):
+                self._update()
+                if self.telemetry:
+                    self._publish_telemetry()
             self._draw()
-            self.clock.tick(60)
+            if self.spectators:
+                self.spectators.publish(self._spectator_snapshot())
+            self.sound_manager.set_music('match' if self.state.game_started else 'menu')
+            self.sound_manager.update()
+            if first_frame:
+                first_frame = False
+                # Primeira execução: mede o hardware sem atrasar a primeira tela. A medição
+                # bloqueia o loop por um segundo com o menu parado, sem disputar a CPU
+                if QualitySettings.benchmark_pending():
+                    self._apply_quality(QualitySettings.measure())
+                # Com o menu já visível, a pilha da câmera pode ser importada em segundo plano
+                if Config.PREWARM_CAMERA:
+                    self.paddles[0].prewarm_head_tracking()
+                elif Config.PRELOAD_CAMERA_STACK:
+                    CameraStack.preload()
+            self.clock.tick(self.quality.fps)
+
+    def _apply_quality(self, preset):
+        """
+        Aplica um preset escolhido com o jogo já aberto. O FPS e a webcam leem o preset
+        atual; a bola é redesenhada com a nova suavização. O buffer do mixer só muda
+        reiniciando o áudio, então o menu avisa que é preciso reiniciar o jogo.
+        """
+        previous, self.quality = self.quality, preset
+        if preset.smooth_scaling != previous.smooth_scaling:
+            self.ball.reload_surface()
+        if preset.mixer_buffer != self.mixer_buffer:
+            self.ui.notice = f"Qualidade {preset.name}: reinicie para ajustar o áudio"
 
     def _handle_events(self):
         """
@@ -84,61 +179,247 @@ class Game:
         """
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
+                self._autosave()
+                self._save_replay()
+                self._report_input_latency()
                 pygame.quit()
                 sys.exit()
-            
+
+            self.input.handle_event(event)
             InputHandler.handle(event, self.state, self)
 
-            if event.type == self.timer_event and self.state.game_started and not self.state.is_paused:
+            # No modo online o tempo deriva do tick da sessão
+            if event.type == self.timer_event and self.state.game_started and not self.state.is_paused and not self.session:
                 self.state.time_remaining -= 1
                 if self.state.time_remaining <= 0:
                     self.state.game_over = True
                     self.state.game_started = False
+                    GameSnapshot.clear()
+            if event.type == self.timer_event:
+                self._autosave()
+
+    def _autosave(self):
+        """
+        Salva a partida em andamento para que ela possa ser retomada após fechar o jogo.
+        """
+        if Config.AUTOSAVE_MATCH and not self.session and self.state.game_started and not self.state.game_over:
+            GameSnapshot.save(GameSnapshot.snapshot(self.state, self.ball, self.paddles))
+
+    def resume_match(self) -> bool:
+        """
+        Retoma a última partida salva, pausada. Retorna False se não houver partida em andamento.
+        """
+        data = GameSnapshot.load()
+        if not data:
+            print("Nenhuma partida salva para retomar")
+            return False
+        try:
+            GameSnapshot.restore(data, self.state, self.ball, self.paddles)
+        except (ValueError, struct.error) as e:
+            print(f"Partida salva inválida: {e}")
+            self.state.reset()
+            return False
+        if not self.state.game_started or self.state.game_over:
+            print("A partida salva já terminou")
+            self.state.reset()
+            return False
+
+        # O rastreamento de cabeça precisa ser ativado novamente pelo menu
+        if self.state.player1_control == "virtual":
+            self.state.player1_control = "wasd"
+        if self.state.player2_control == "virtual":
+            self.state.player2_control = "arrows"
+        self.state.menu_active = False
+        self.state.is_paused = True
+        # A partida volta a ser salva pelo autosave enquanto continuar
+        GameSnapshot.clear()
+        self.start_match_stats()
+        self.start_replay()
+        return True
 
     def _update(self):
         """
         Atualiza o estado do jogo.
         """
-        if self.state.game_started and not self.state.game_over and not self.state.is_paused:
+        self._sync_head_tracking()
+
+        if self.session:
+            self._advance_online()
+        elif self.state.game_started and not self.state.game_over and not self.state.is_paused:
             self._move_players()
-            self.ball.update()
-            result = PhysicsEngine.handle_collisions(self.ball, self.paddles, self.sound_manager, self)
-            if result == "player1":
-                self.state.player1_score += 1
-                self.ball.reset(-1)
-            elif result == "player2":
-                self.state.player2_score += 1
-                self.ball.reset(1)
+            PhysicsEngine.step(self.state, self.ball, self.paddles, self.events)
+            self.events.dispatch()
+            if self.stats:
+                self.stats.record_tick(self.ball, self.paddles)
+            if self.replay is not None:
+                self.replay.record(self.state, self.ball, self.paddles)
+
+        if self.stats and self.state.game_over and not self.stats.finished:
+            self.stats.finish((self.state.player1_name, self.state.player2_name))
+        if self.replay is not None and self.state.game_over:
+            self._save_replay()
+
+    def start_online(self, session):
+        """
+        Inicia uma partida online: a sessão de rollback passa a conduzir a simulação.
+        """
+        self.session = session
+        session.on_tick = self._record_online_tick
+        # O rastreamento de cabeça é desligado pela sessão; o menu volta a oferecer o teclado
+        self.state.player1_control = "wasd"
+        self.state.player2_control = "arrows"
+        self.state.menu_active = False
+        self.state.game_started = True
+        self.state.game_over = False
+        self.start_replay()
+
+    def start_match_stats(self):
+        """
+        Zera as estatísticas para uma nova partida (o NumPy só é carregado aqui).
+        """
+        if self.stats is None:
+            from .match_stats import MatchStats
+            self.stats = MatchStats()
+            self.events.subscribe(self.stats.on_sim_events)
+        else:
+            self.stats.reset()
+
+    def start_replay(self):
+        """
+        Começa a gravar a partida (um registro por tick) para exportação em vídeo.
+        """
+        if Config.RECORD_REPLAYS:
+            self.replay = Replay((self.state.player1_name, self.state.player2_name))
+
+    def _save_replay(self):
+        """
+        Salva o replay gravado, se houver, e encerra a gravação.
+        """
+        replay, self.replay = self.replay, None
+        if replay is not None and self.session:
+            # Ticks após a última entrada remota confirmada ainda podem estar errados
+            replay.truncate(self.session.confirmed_remote + 1)
+        if replay and len(replay):
+            replay.player_names = (self.state.player1_name, self.state.player2_name)
+            path = replay.save()
+            if path:
+                print(f"Replay salvo em {path} ({replay.duration:.0f} s)")
+
+    def start_spectator_server(self, port: int = Config.SPECTATOR_PORT):
+        """
+        Transmite a partida para espectadores a partir de uma thread separada.
+        """
+        from .spectator import SpectatorServer
+        self.spectators = SpectatorServer(port=port)
+        self.spectators.start()
+
+    def _spectator_snapshot(self):
+        from .spectator import SpectatorSnapshot
+        state = self.state
+        status = 2 if state.game_over else 1 if state.game_started else 0
+        return SpectatorSnapshot(
+            self.ball.rect.centerx, self.ball.rect.centery,
+            self.paddles[0].rect.centerx, self.paddles[0].rect.centery,
+            self.paddles[1].rect.centerx, self.paddles[1].rect.centery,
+            state.player1_score, state.player2_score, max(0, state.time_remaining), status,
+            state.player1_name, state.player2_name,
+        )
+
+    def start_telemetry(self, path: str = Config.TELEMETRY_PATH):
+        """
+        Publica o estado a cada tick em memória compartilhada para ferramentas externas.
+        """
+        from .telemetry import TelemetryWriter
+        self.telemetry = TelemetryWriter(path)
+        print(f"Telemetria em {path}")
+
+    def _publish_telemetry(self):
+        state, ball = self.state, self.ball
+        p1, p2 = self.paddles[0].rect, self.paddles[1].rect
+        now = time.perf_counter()
+        tracker_ms = [-1.0, -1.0]
+        for i, paddle in enumerate(self.paddles):
+            if paddle.head_tracker and paddle.head_tracker.running:
+                tracker_ms[i] = (now - paddle.head_tracker.get_position_snapshot().timestamp) * 1000
+        self.telemetry.publish(
+            time.time(), ball.rect.centerx, ball.rect.centery, ball.speed_x, ball.speed_y,
+            p1.centerx, p1.centery, p2.centerx, p2.centery,
+            state.player1_score, state.player2_score, max(0, state.time_remaining),
+            2 if state.game_over else 1 if state.game_started else 0,
+            self.clock.get_rawtime(), tracker_ms[0], tracker_ms[1],
+        )
+
+    def stop_online(self):
+        """
+        Encerra a partida online e libera o socket.
+        """
+        if self.session:
+            self.session.transport.close()
+            self.session = None
+
+    def _advance_online(self):
+        """
+        Envia a entrada local (WASD ou controle) e avança a sessão um tick. Depois do
+        fim, mantém a troca de pacotes até o outro jogador confirmar as últimas entradas.
+        """
+        if self.state.game_over:
+            self.session.linger()
+            return
+        if not self.state.game_started:
+            return
+        command = self.input.sample()['player1']
+        # Arredondada aqui, a entrada enviada é exatamente a que os dois lados simulam
+        self.session.advance((round(command.dx), round(command.dy)))
+
+    def _record_online_tick(self, tick: int):
+        """
+        Grava um tick da sessão online no replay. Ticks corrigidos pelo rollback são
+        regravados no mesmo índice, então o vídeo mostra só o que de fato aconteceu.
+        """
+        if self.replay is not None:
+            self.replay.record(self.state, self.ball, self.paddles, tick)
+
+    def _sync_head_tracking(self):
+        """
+        Ativa rastreadores que terminaram de carregar e expõe o progresso para a interface.
+        """
+        for paddle in self.paddles:
+            paddle.poll_head_tracking()
+        self.state.head_trackers = [paddle.head_tracker for paddle in self.paddles]
+        self.state.camera_statuses = [paddle.tracking_status() for paddle in self.paddles]
 
     def _move_players(self):
         """
-        Move os jogadores de acordo com as teclas pressionadas.
+        Move os jogadores de acordo com as ações amostradas logo antes da física.
         """
         if self.state.is_paused:
             return
 
-        keys = pygame.key.get_pressed()
+        commands = self.input.sample()
 
         # Player 1
         dx, dy = 0, 0
         if self.state.player1_control == "wasd":
-            if keys[pygame.K_w]: dy -= Config.PLAYER_SPEED
-            if keys[pygame.K_s]: dy += Config.PLAYER_SPEED
-            if keys[pygame.K_a]: dx -= Config.PLAYER_SPEED
-            if keys[pygame.K_d]: dx += Config.PLAYER_SPEED
+            dx, dy = commands['player1'].dx, commands['player1'].dy
 
         self.paddles[0].move(dx, dy)
 
         # Player 2
         if self.state.player2_control == "arrows":
-            dx, dy = 0, 0
-            if keys[pygame.K_UP]: dy -= Config.PLAYER_SPEED
-            if keys[pygame.K_DOWN]: dy += Config.PLAYER_SPEED
-            if keys[pygame.K_LEFT]: dx -= Config.PLAYER_SPEED
-            if keys[pygame.K_RIGHT]: dx += Config.PLAYER_SPEED
-            self.paddles[1].move(dx, dy)
+            self.paddles[1].move(commands['player2'].dx, commands['player2'].dy)
         elif self.state.player2_control == "cpu":
             self.paddles[1].cpu_move()
+        elif self.state.player2_control == "virtual":
+            self.paddles[1].move(0, 0)
+
+    def _report_input_latency(self):
+        """
+        Mostra a latência medida entre a entrada e o movimento do jogador.
+        """
+        report = self.input.latency_report()
+        if report:
+            print("Latência entrada -> movimento: média {mean_ms:.1f} ms, p95 {p95_ms:.1f} ms, "
+                  "máx {max_ms:.1f} ms ({samples} amostras, {estimated} estimadas)".format(**report))
 
     def _draw(self):
         """Desenha todos os elementos do jogo na tela."""
@@ -160,21 +441,23 @@ class Game:
         elif self.state.menu_active:
             self.ui.draw_menu(self.window)
         elif self.state.game_over:
-            self.ui.draw_end_game(self.window)
+            self.ui.draw_end_game(self.window, self.stats)
 
         # Tela de calibração (sobrepõe tudo)
-        if self.state.is_calibrating and hasattr(self.paddles[0], 'head_tracker') and self.paddles[0].head_tracker:
+        calibrating = self.paddles[self.state.calibrating_player]
+        if self.state.is_calibrating and calibrating.head_tracker:
             try:
-                if hasattr(self.paddles[0].head_tracker, 'cap') and self.paddles[0].head_tracker.cap.isOpened():
-                    ret, frame = self.paddles[0].head_tracker.cap.read()
+                if calibrating.head_tracker.cap and calibrating.head_tracker.cap.isOpened():
+                    ret, frame = calibrating.head_tracker.cap.read()
                     if ret:
-                        frame = cv2.flip(frame, 1)
+                        frame = CameraStack.cv2().flip(frame, 1)
                         button_rect = self.ui.draw_calibration_screen(self.window, frame)
 
                         # Verificar clique no botão de finalizar
                         mouse_pos = pygame.mouse.get_pos()
                         if button_rect.collidepoint(mouse_pos) and pygame.mouse.get_pressed()[0]:
-                            if self.paddles[0].head_tracker.end_calibration():
+                            name = (self.state.player1_name, self.state.player2_name)[self.state.calibrating_player]
+                            if calibrating.finish_calibration(name):
                                 self.state.is_calibrating = False
                                 self.sound_manager.play_button_click_sound()
             except Exception as e:
@@ -0,0 +1,137 @@
+import os
+import random
+import struct
+from typing import List, Optional
+from .config import Config
+from .game_state import GameState
+
+# Layout fixo (little-endian). A parte de simulação vem primeiro para que
+# o rollback possa salvar e restaurar só o que a física altera.
+_HEADER = struct.Struct("<4sBB")                 # magic, versão, inclui metadados
+_SIMULATION = struct.Struct(
+    "<ii dddd"                                    # bola: rect.x, rect.y, speed_x, speed_y, angle, rotation_speed
+    "ii dd"                                       # jogador 1: rect.x, rect.y, smoothed_x, smoothed_y
+    "ii dd"                                       # jogador 2
+    "HHhB"                                        # placar, tempo restante, flags (iniciado, fim)
+)
+_RNG = struct.Struct("<625IBd")                  # estado do Mersenne Twister, gauss_next
+_META = struct.Struct("<HBB32s32s12s12s")        # duração, pausa, menu, nomes, controles
+
+_MAGIC = b"GAGQ"
+_VERSION = 1
+_FLAG_STARTED, _FLAG_OVER = 1, 2
+
+
+class GameSnapshot:
+    """
+    Captura e restaura o estado completo da simulação em um buffer binário de layout
+    fixo, incluindo o estado do gerador aleatório (usado por ``Ball.reset``).
+    """
+    SIMULATION_SIZE = _HEADER.size + _SIMULATION.size + _RNG.size
+    FULL_SIZE = SIMULATION_SIZE + _META.size
+
+    @staticmethod
+    def snapshot(state: GameState, ball, paddles: List, rng_state: Optional[tuple] = None,
+                 include_meta: bool = True) -> bytes:
+        """
+        Empacota bola, jogadores, placar e tempo. Com ``include_meta`` também salva
+        nomes, controles e o estado do menu. Sem ``rng_state``, usa o do módulo ``random``.
+        """
+        p1, p2 = paddles
+        flags = (_FLAG_STARTED if state.game_started else 0) | (_FLAG_OVER if state.game_over else 0)
+        _, internal, gauss_next = rng_state or random.getstate()
+        parts = [
+            _HEADER.pack(_MAGIC, _VERSION, include_meta),
+            _SIMULATION.pack(
+                ball.rect.x, ball.rect.y, ball.speed_x, ball.speed_y, ball.angle, ball.rotation_speed,
+                p1.rect.x, p1.rect.y, p1.smoothed_x, p1.smoothed_y,
+                p2.rect.x, p2.rect.y, p2.smoothed_x, p2.smoothed_y,
+                state.player1_score, state.player2_score, state.time_remaining, flags,
+            ),
+            _RNG.pack(*internal, gauss_next is not None, gauss_next or 0.0),
+        ]
+        if include_meta:
+            parts.append(_META.pack(
+                state.selected_duration, state.is_paused, state.menu_active,
+                state.player1_name.encode("utf-8")[:32], state.player2_name.encode("utf-8")[:32],
+                state.player1_control.encode()[:12], state.player2_control.encode()[:12],
+            ))
+        return b"".join(parts)
+
+    @staticmethod
+    def restore(data: bytes, state: GameState, ball, paddles: List, restore_rng: bool = True) -> tuple:
+        """
+        Restaura o snapshot nos objetos existentes e retorna o estado do gerador
+        aleatório. Com ``restore_rng`` ele também é aplicado ao módulo ``random``.
+        """
+        magic, version, has_meta = _HEADER.unpack_from(data)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("snapshot inválido ou de outra versão")
+
+        offset = _HEADER.size
+        (ball.rect.x, ball.rect.y, ball.speed_x, ball.speed_y, ball.angle, ball.rotation_speed,
+         p1_x, p1_y, p1_sx, p1_sy, p2_x, p2_y, p2_sx, p2_sy,
+         state.player1_score, state.player2_score, state.time_remaining, flags) = _SIMULATION.unpack_from(data, offset)
+        p1, p2 = paddles
+        p1.rect.x, p1.rect.y, p1.smoothed_x, p1.smoothed_y = p1_x, p1_y, p1_sx, p1_sy
+        p2.rect.x, p2.rect.y, p2.smoothed_x, p2.smoothed_y = p2_x, p2_y, p2_sx, p2_sy
+        state.game_started = bool(flags & _FLAG_STARTED)
+        state.game_over = bool(flags & _FLAG_OVER)
+
+        offset += _SIMULATION.size
+        rng_values = _RNG.unpack_from(data, offset)
+        rng_state = (3, rng_values[:625], rng_values[626] if rng_values[625] else None)
+        if restore_rng:
+            random.setstate(rng_state)
+
+        if has_meta:
+            (state.selected_duration, is_paused, menu_active, name1, name2,
+             control1, control2) = _META.unpack_from(data, offset + _RNG.size)
+            state.is_paused, state.menu_active = bool(is_paused), bool(menu_active)
+            state.player1_name = name1.rstrip(b"\0").decode("utf-8", "ignore")
+            state.player2_name = name2.rstrip(b"\0").decode("utf-8", "ignore")
+            state.player1_control = control1.rstrip(b"\0").decode()
+            state.player2_control = control2.rstrip(b"\0").decode()
+        return rng_state
+
+    @staticmethod
+    def save(data: bytes, path: str = Config.MATCH_SNAPSHOT_PATH) -> bool:
+        """
+        Grava o snapshot em disco de forma atômica.
+        """
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+            return True
+        except OSError as e:
+            print(f"Erro ao salvar a partida: {e}")
+            return False
+
+    @staticmethod
+    def load(path: str = Config.MATCH_SNAPSHOT_PATH) -> Optional[bytes]:
+        """
+        Lê um snapshot salvo, ou None se não existir.
+        """
+        try:
+            with open(path, "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            print(f"Erro ao carregar a partida salva: {e}")
+            return None
+
+    @staticmethod
+    def clear(path: str = Config.MATCH_SNAPSHOT_PATH):
+        """
+        Apaga o snapshot salvo (partida terminada, abandonada ou já retomada).
+        """
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"Erro ao apagar a partida salva: {e}")
@@ -11,6 +11,9 @@ class GameState:
         self.player1_control = "wasd"
         self.player2_control = "arrows"
         self.is_calibrating = False
+        self.calibrating_player = 0  # índice do jogador em calibração
+        self.head_trackers = [None, None]
+        self.camera_statuses = [None, None]
 
     def reset(self):
         """
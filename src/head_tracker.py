@@ -1,22 +1,475 @@
 import cv2
 import mediapipe as mp
 import threading
-import numpy as np
-from typing import Tuple, Optional
+import time
+from typing import List, NamedTuple, Tuple, Optional
+from .config import Config
+from .quality_presets import QualitySettings
 
 
-class HeadTracker:
-    def __init__(self):
-        self.mp_face = mp.solutions.face_detection
-        self.face = self.mp_face.FaceDetection(
-            min_detection_confidence=0.7,
-            model_selection=1
+class HeadPosition(NamedTuple):
+    """Snapshot imutável da posição da cabeça publicada pela thread de rastreamento"""
+    x: float
+    y: float
+    seq: int
+    timestamp: float
+
+
+class StreamingQuantile:
+    """
+    Estimador P² (Jain & Chlamtac) de um quantil em memória constante.
+    Mantém apenas cinco marcadores, independentemente do número de amostras.
+    """
+
+    def __init__(self, p: float):
+        self.p = p
+        self.count = 0
+        self._heights: List[float] = []
+        self._positions = [0, 1, 2, 3, 4]
+        self._desired = [0.0, 2 * p, 4 * p, 2 + 2 * p, 4.0]
+        self._increments = [0.0, p / 2, p, (1 + p) / 2, 1.0]
+
+    def add(self, value: float):
+        """Adiciona uma amostra ao estimador"""
+        self.count += 1
+        q = self._heights
+
+        if self.count <= 5:
+            q.append(value)
+            if self.count == 5:
+                q.sort()
+            return
+
+        # Localiza a célula da amostra e ajusta os extremos
+        if value < q[0]:
+            q[0] = value
+            k = 0
+        elif value >= q[4]:
+            q[4] = value
+            k = 3
+        else:
+            k = 0
+            while value >= q[k + 1]:
+                k += 1
+
+        n = self._positions
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+
+        # Ajusta os marcadores centrais
+        for i in range(1, 4):
+            d = self._desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                step = 1 if d > 0 else -1
+                candidate = self._parabolic(i, step)
+                if q[i - 1] < candidate < q[i + 1]:
+                    q[i] = candidate
+                else:
+                    q[i] += step * (q[i + step] - q[i]) / (n[i + step] - n[i])
+                n[i] += step
+
+    def _parabolic(self, i: int, d: int) -> float:
+        q, n = self._heights, self._positions
+        return q[i] + d / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i]) +
+            (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
         )
+
+    def value(self) -> float:
+        """Retorna a estimativa atual do quantil"""
+        if self.count == 0:
+            raise ValueError("Nenhuma amostra coletada")
+        if self.count < 5:
+            ordered = sorted(self._heights)
+            return ordered[min(int(self.p * len(ordered)), len(ordered) - 1)]
+        return self._heights[2]
+
+
+class CalibrationAccumulator:
+    """Coleta estatísticas de calibração em memória O(1) para os dois eixos"""
+
+    def __init__(self, low: float = Config.HEAD_CALIBRATION_LOW_QUANTILE,
+                 high: float = Config.HEAD_CALIBRATION_HIGH_QUANTILE):
+        self.count = 0
+        self._axes = [
+            (StreamingQuantile(low), StreamingQuantile(0.5), StreamingQuantile(high))
+            for _ in range(2)
+        ]
+
+    def add(self, x: float, y: float):
+        self.count += 1
+        for estimators, value in zip(self._axes, (x, y)):
+            for estimator in estimators:
+                estimator.add(value)
+
+    def result(self) -> dict:
+        """Retorna os limites robustos (percentis) e a mediana de cada eixo"""
+        (low_x, mid_x, high_x), (low_y, mid_y, high_y) = [
+            tuple(estimator.value() for estimator in estimators) for estimators in self._axes
+        ]
+        return {
+            'min_x': low_x,
+            'max_x': high_x,
+            'min_y': low_y,
+            'max_y': high_y,
+            'center_x': mid_x,
+            'center_y': mid_y
+        }
+
+
+class DetectorSettings(NamedTuple):
+    """Modelo do MediaPipe e resolução da imagem enviada a ele"""
+    model_selection: int
+    input_size: Optional[Tuple[int, int]]  # None = quadro inteiro da câmera
+
+    @staticmethod
+    def configured() -> "DetectorSettings":
+        model = Config.HEAD_TRACKER_MODEL
+        if model is None:
+            model = QualitySettings.current().model_selection
+        return DetectorSettings(model, Config.HEAD_TRACKER_INPUT_SIZE)
+
+    def describe(self) -> str:
+        model = "curto" if self.model_selection == 0 else "completo"
+        size = "quadro inteiro" if self.input_size is None else "{}x{}".format(*self.input_size)
+        return f"modelo {model}, {size}"
+
+
+class DetectorAutoSelector:
+    """
+    Escolha automática do detector: cada combinação de modelo e resolução processa
+    ``frames`` quadros reais da câmera (o rastreamento continua enquanto isso) e vence
+    a mais barata cuja taxa de detecção fica próxima da melhor taxa observada.
+    """
+    WARMUP_FRAMES = 2  # a primeira inferência de cada modelo é mais lenta
+
+    def __init__(self, frames: int = Config.HEAD_TRACKER_AUTO_FRAMES,
+                 min_rate: float = Config.HEAD_TRACKER_AUTO_MIN_RATE):
+        # Do mais barato para o mais caro, para que o rastreamento comece leve
+        self.candidates = [
+            DetectorSettings(model, size)
+            for model in (0, 1)
+            for size in Config.HEAD_TRACKER_INPUT_SIZES
+        ]
+        self.frames = frames
+        self.min_rate = min_rate
+        self.results: List[Tuple[DetectorSettings, float, float]] = []  # (combinação, ms, taxa)
+        self._start_candidate(0)
+
+    def _start_candidate(self, index: int):
+        self._index = index
+        self._seen = 0
+        self._elapsed = 0.0
+        self._hits = 0
+
+    @property
+    def current(self) -> DetectorSettings:
+        return self.candidates[self._index]
+
+    def record(self, seconds: float, found: bool) -> Optional[DetectorSettings]:
+        """Registra um quadro; ao fim da medição retorna a combinação escolhida"""
+        self._seen += 1
+        if self._seen <= self.WARMUP_FRAMES:
+            return None
+        self._elapsed += seconds
+        self._hits += found
+        measured = self._seen - self.WARMUP_FRAMES
+        if measured < self.frames:
+            return None
+
+        self.results.append((self.current, self._elapsed / measured * 1000, self._hits / measured))
+        if self._index + 1 < len(self.candidates):
+            self._start_candidate(self._index + 1)
+            return None
+
+        best_rate = max(rate for _, _, rate in self.results)
+        if not best_rate:
+            # Ninguém diante da câmera: a medição recomeça
+            self.results = []
+            self._start_candidate(0)
+            return None
+        stable = [result for result in self.results if result[2] >= best_rate * self.min_rate]
+        return min(stable, key=lambda result: result[1])[0]
+
+
+class MotionGate:
+    """
+    Decide se um quadro precisa passar pelo detector: compara uma miniatura em tons de
+    cinza com a do último quadro analisado e conta as células que mudaram (a média
+    da imagem inteira diluiria uma cabeça pequena). Com a imagem parada, a detecção cai para
+    ``idle_rate`` por segundo; o primeiro quadro com movimento volta à taxa plena.
+    Como a referência é o último quadro analisado, movimentos lentos se acumulam até
+    passar do limite em vez de se perderem entre quadros consecutivos.
+    Cada detecção move a posição publicada só uma fração do caminho (suavização), então
+    depois do movimento ainda rodam ``settle_frames`` detecções antes da taxa ociosa;
+    sem elas o jogador terminaria de se acomodar só na taxa de ``idle_rate``.
+    """
+
+    def __init__(self, threshold: int = Config.HEAD_MOTION_THRESHOLD,
+                 min_cells: int = Config.HEAD_MOTION_MIN_CELLS,
+                 idle_rate: float = Config.HEAD_IDLE_DETECTION_RATE,
+                 grid: Tuple[int, int] = Config.HEAD_MOTION_GRID,
+                 settle_frames: int = Config.HEAD_MOTION_SETTLE_FRAMES):
+        self.threshold = threshold
+        self.min_cells = min_cells
+        self.idle_interval = 1.0 / idle_rate
+        self.grid = grid
+        self.settle_frames = settle_frames
+        self._reference = None
+        self._last_detection = 0.0
+        self._settle_left = 0
+        self.detected = 0
+        self.skipped = 0
+
+    def should_detect(self, frame, force: bool = False) -> bool:
+        small = cv2.cvtColor(cv2.resize(frame, self.grid, interpolation=cv2.INTER_AREA), cv2.COLOR_BGR2GRAY)
+        now = time.perf_counter()
+        moved = (self._reference is not None
+                 and (cv2.absdiff(small, self._reference) > self.threshold).sum() >= self.min_cells)
+        if moved:
+            self._settle_left = self.settle_frames
+        elif self._settle_left:
+            self._settle_left -= 1
+            moved = True
+        if force or moved or self._reference is None or now - self._last_detection >= self.idle_interval:
+            self._reference = small
+            self._last_detection = now
+            self.detected += 1
+            return True
+        self.skipped += 1
+        return False
+
+    def report(self) -> Optional[str]:
+        total = self.detected + self.skipped
+        if not total:
+            return None
+        return f"detector executado em {self.detected / total:.0%} dos {total} quadros"
+
+
+class FaceIdentity:
+    """
+    Associa os rostos detectados aos dois jogadores de forma estável entre quadros:
+    cada rosto fica com o jogador cuja última posição está mais próxima. Sem histórico,
+    o rosto à esquerda da imagem espelhada é do jogador 1 e o da direita, do jogador 2.
+    """
+
+    def __init__(self, max_jump: float = Config.HEAD_TRACKER_MAX_JUMP,
+                 lost_frames: int = Config.HEAD_TRACKER_LOST_FRAMES):
+        self.max_jump = max_jump
+        self.lost_frames = lost_frames
+        self.reset()
+
+    def reset(self):
+        self.last: List[Optional[Tuple[float, float]]] = [None, None]
+        self.missed = [0, 0]
+
+    @staticmethod
+    def _distance(a: Tuple[float, float], b: Tuple[float, float]) -> float:
+        return (a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2
+
+    def _slot_for(self, face: Tuple[float, float]) -> int:
+        """Jogador de um rosto isolado: o mais próximo dentro de ``max_jump`` ou, senão, o lado"""
+        known = [(self._distance(face, last), slot) for slot, last in enumerate(self.last) if last]
+        if known:
+            distance, slot = min(known)
+            if distance <= self.max_jump ** 2:
+                return slot
+        return 0 if face[0] < 0.5 else 1
+
+    def assign(self, faces: List[Tuple[float, float]]) -> List[Optional[Tuple[float, float]]]:
+        """Retorna a posição do rosto de cada jogador neste quadro (None se não foi visto)"""
+        assigned: List[Optional[Tuple[float, float]]] = [None, None]
+        if len(faces) >= 2:
+            a, b = faces[0], faces[1]
+            if self.last[0] and self.last[1]:
+                keep = self._distance(a, self.last[0]) + self._distance(b, self.last[1])
+                swap = self._distance(b, self.last[0]) + self._distance(a, self.last[1])
+                assigned = [a, b] if keep <= swap else [b, a]
+            else:
+                assigned = [a, b] if a[0] <= b[0] else [b, a]
+        elif faces:
+            assigned[self._slot_for(faces[0])] = faces[0]
+
+        for slot, face in enumerate(assigned):
+            if face:
+                self.last[slot] = face
+                self.missed[slot] = 0
+            elif self.last[slot]:
+                self.missed[slot] += 1
+                # Depois de muito tempo sumido, o jogador volta a ser identificado pelo lado
+                if self.missed[slot] > self.lost_frames:
+                    self.last[slot] = None
+        return assigned
+
+
+class FaceSource:
+    """
+    Câmera e detector de rosto compartilhados pelos jogadores com controle "Virtual".
+    Cada quadro passa por uma única inferência; os rostos encontrados são entregues
+    aos rastreadores conectados. A câmera é liberada quando o último se desconecta.
+    """
+
+    def __init__(self):
+        self.settings = DetectorSettings.configured()
+        self.selector = DetectorAutoSelector() if Config.HEAD_TRACKER_AUTO_DETECTOR else None
+        if self.selector:
+            self.settings = self.selector.current
+        self._detectors = {}
+        self.face = self._create_detector(self.settings.model_selection)
         self.cap = None
-        self.current_x = 0.5
-        self.current_y = 0.5
         self.running = False
         self.thread = None
+        self.identity = FaceIdentity()
+        self.motion = MotionGate() if Config.HEAD_MOTION_GATING else None
+        self._trackers_lock = threading.Lock()
+        self._trackers: List["HeadTracker"] = []
+
+    def _create_detector(self, model_selection: int):
+        """Carrega (uma única vez por modelo) o detector de rosto do MediaPipe"""
+        if model_selection not in self._detectors:
+            self.mp_face = mp.solutions.face_detection
+            self._detectors[model_selection] = self.mp_face.FaceDetection(
+                min_detection_confidence=0.7,
+                model_selection=model_selection
+            )
+        return self._detectors[model_selection]
+
+    def open_camera(self):
+        """Abre a câmera e descarta o primeiro quadro (aquecimento do driver)"""
+        if self.cap:
+            return
+        quality = QualitySettings.current()
+        self.cap = cv2.VideoCapture(0)
+        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, quality.camera_size[0])
+        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, quality.camera_size[1])
+        self.cap.set(cv2.CAP_PROP_FPS, quality.camera_fps)
+        if not self.cap.isOpened():
+            self.cap.release()
+            self.cap = None
+            raise RuntimeError("não foi possível abrir a câmera")
+        self.cap.read()
+
+    def attach(self, tracker: "HeadTracker"):
+        """Passa a alimentar o rastreador, iniciando a captura se necessário"""
+        with self._trackers_lock:
+            if tracker not in self._trackers:
+                self._trackers.append(tracker)
+            self.identity.reset()
+        if not self.running:
+            self.start()
+
+    def detach(self, tracker: "HeadTracker"):
+        """Desconecta o rastreador; sem nenhum conectado, a captura para"""
+        with self._trackers_lock:
+            if tracker in self._trackers:
+                self._trackers.remove(tracker)
+            self.identity.reset()
+            unused = not self._trackers
+        if unused:
+            self.stop()
+
+    def start(self):
+        self.open_camera()
+        self.running = True
+        self.thread = threading.Thread(target=self._update_loop)
+        self.thread.start()
+
+    def stop(self):
+        self.running = False
+        if self.thread and self.thread is not threading.current_thread():
+            self.thread.join()
+        self.thread = None
+        report = self.motion.report() if self.motion else None
+        if report:
+            print(f"Rastreamento de cabeça: {report}")
+            self.motion = MotionGate()
+        if self.cap:
+            self.cap.release()
+            self.cap = None
+
+    def _update_loop(self):
+        while self.running:
+            try:
+                ret, frame = self.cap.read()
+                if not ret:
+                    continue
+
+                # Pré-processamento da imagem
+                frame = cv2.flip(frame, 1)
+                if not self._needs_detection(frame):
+                    continue
+                self._dispatch(self._measure_detection(frame) if self.selector else self._detect(frame))
+            except Exception as e:
+                print(f"Erro na captura de vídeo: {e}")
+                self.running = False
+                break
+
+    def _needs_detection(self, frame) -> bool:
+        """Filtro de movimento; calibração e escolha do detector precisam de todos os quadros"""
+        if self.motion is None:
+            return True
+        with self._trackers_lock:
+            calibrating = any(tracker.is_calibrating or tracker._verify_remaining for tracker in self._trackers)
+        return self.motion.should_detect(frame, force=calibrating or self.selector is not None)
+
+    def _measure_detection(self, frame) -> List[Tuple[float, float]]:
+        """Detecta com a combinação em avaliação e encerra a escolha automática quando ela termina"""
+        start = time.perf_counter()
+        faces = self._detect(frame)
+        chosen = self.selector.record(time.perf_counter() - start, bool(faces))
+        if chosen:
+            print(f"Detector escolhido: {chosen.describe()}")
+            for settings, ms, rate in self.selector.results:
+                print(f"  {settings.describe()}: {ms:.1f} ms, detecção em {rate:.0%} dos quadros")
+            self.selector = None
+        self.settings = chosen or (self.selector.current if self.selector else self.settings)
+        self.face = self._create_detector(self.settings.model_selection)
+        return faces
+
+    def _detect(self, frame) -> List[Tuple[float, float]]:
+        """Executa a detecção de rosto e retorna o centro dos rostos mais confiáveis"""
+        # As coordenadas são relativas, então reduzir a imagem não altera o resultado
+        if self.settings.input_size:
+            frame = cv2.resize(frame, self.settings.input_size, interpolation=cv2.INTER_AREA)
+        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        results = self.face.process(rgb)
+        if not results.detections:
+            return []
+
+        faces = []
+        for detection in results.detections[:Config.HEAD_TRACKER_MAX_FACES]:
+            box = detection.location_data.relative_bounding_box
+            faces.append((box.xmin + box.width / 2, box.ymin + box.height / 2))
+        return faces
+
+    def _dispatch(self, faces: List[Tuple[float, float]]):
+        """Entrega a cada rastreador conectado o rosto do seu jogador"""
+        with self._trackers_lock:
+            trackers = list(self._trackers)
+            # Um único jogador segue o rosto mais confiável, onde quer que esteja
+            assigned = None if len(trackers) < 2 else self.identity.assign(faces)
+        for tracker in trackers:
+            face = assigned[tracker.side] if assigned else (faces[0] if faces else None)
+            if face:
+                tracker._handle_detection(*face)
+
+
+class HeadTracker:
+    """
+    Posição e calibração da cabeça de um jogador. A captura e a detecção ficam na
+    ``FaceSource``, que pode ser compartilhada pelos dois jogadores.
+    """
+
+    def __init__(self, source: Optional[FaceSource] = None, side: int = 0):
+        self.source = source if source is not None else FaceSource()
+        self.side = side  # 0 = jogador 1 (esquerda), 1 = jogador 2 (direita)
+        self._attached = False
+
+        # Posição publicada de forma atômica para a thread do jogo
+        self._position_lock = threading.Lock()
+        self._position = HeadPosition(0.5, 0.5, 0, time.perf_counter())
 
         # Parâmetros de calibração
         self.calibration_data = {
@@ -28,50 +481,61 @@ class HeadTracker:
             'center_y': 0.5
         }
         self.is_calibrating = False
-        self.calibration_samples = []
+        self._calibration_lock = threading.Lock()
+        self.calibration = CalibrationAccumulator()
+        self.has_calibration = False
+
+        # Verificação rápida de um perfil carregado do disco
+        self.profile_status: Optional[str] = None
+        self._verify_remaining = 0
+        self._verify_hits = 0
 
         # Configurações ajustáveis
         self.smoothing_factor = 0.7
         self.min_movement = 0.005
         self.movement_threshold = 0.02
 
+    @property
+    def running(self) -> bool:
+        return self._attached and self.source.running
+
+    @property
+    def cap(self):
+        return self.source.cap
+
+    def open_camera(self):
+        self.source.open_camera()
+
     def start(self):
-        if not self.cap:
-            self.cap = cv2.VideoCapture(0)
-            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
-            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
-            self.cap.set(cv2.CAP_PROP_FPS, 30)
-        self.running = True
-        self.thread = threading.Thread(target=self._update_loop)
-        self.thread.start()
+        self._attached = True
+        self.source.attach(self)
 
     def stop(self):
-        self.running = False
-        if self.thread:
-            self.thread.join()
-        if self.cap:
-            self.cap.release()
-            self.cap = None
+        self._attached = False
+        self.source.detach(self)
 
     def start_calibration(self):
         """Inicia o processo de calibração"""
-        self.is_calibrating = True
-        self.calibration_samples = []
+        with self._calibration_lock:
+            self.calibration = CalibrationAccumulator()
+            self.is_calibrating = True
         print("Calibração iniciada - Mova sua cabeça em todas as direções")
 
     def end_calibration(self):
         """Finaliza a calibração e calcula os parâmetros"""
-        if len(self.calibration_samples) < 10:
-            print("Calibração falhou - movimentos insuficientes")
+        with self._calibration_lock:
+            if self.calibration.count < 10:
+                print("Calibração falhou - movimentos insuficientes")
+                return False
+            result = self.calibration.result()
+
+        if result['max_x'] - result['min_x'] <= 0 or result['max_y'] - result['min_y'] <= 0:
+            print("Calibração falhou - amplitude de movimento insuficiente")
             return False
 
-        samples = np.array(self.calibration_samples)
-        self.calibration_data['min_x'] = np.min(samples[:, 0])
-        self.calibration_data['max_x'] = np.max(samples[:, 0])
-        self.calibration_data['min_y'] = np.min(samples[:, 1])
-        self.calibration_data['max_y'] = np.max(samples[:, 1])
-        self.calibration_data['center_x'] = np.median(samples[:, 0])
-        self.calibration_data['center_y'] = np.median(samples[:, 1])
+        self.calibration_data.update(result)
+        self.has_calibration = True
+        self.profile_status = None
 
         print("Calibração concluída com sucesso!")
         print(f"Range X: {self.calibration_data['min_x']:.2f}-{self.calibration_data['max_x']:.2f}")
@@ -79,6 +543,42 @@ class HeadTracker:
         self.is_calibrating = False
         return True
 
+    def apply_profile(self, calibration_data: dict):
+        """
+        Aplica um perfil salvo imediatamente e o confere contra os próximos quadros.
+        Se o rosto ficar fora da faixa calibrada, o perfil é descartado.
+        """
+        with self._calibration_lock:
+            self.calibration_data.update(calibration_data)
+            self.has_calibration = True
+            self.profile_status = "verificando"
+            self._verify_hits = 0
+            self._verify_remaining = Config.CALIBRATION_PROFILE_CHECK_FRAMES
+
+    def _verify_profile_sample(self, x: float, y: float):
+        """Conta quantas detecções caem dentro da faixa do perfil (com margem)"""
+        data = self.calibration_data
+        margin_x = (data['max_x'] - data['min_x']) * Config.CALIBRATION_PROFILE_MARGIN
+        margin_y = (data['max_y'] - data['min_y']) * Config.CALIBRATION_PROFILE_MARGIN
+        if (data['min_x'] - margin_x <= x <= data['max_x'] + margin_x and
+                data['min_y'] - margin_y <= y <= data['max_y'] + margin_y):
+            self._verify_hits += 1
+
+        self._verify_remaining -= 1
+        if self._verify_remaining > 0:
+            return
+
+        checked = Config.CALIBRATION_PROFILE_CHECK_FRAMES
+        if self._verify_hits >= checked * Config.CALIBRATION_PROFILE_MIN_HIT_RATIO:
+            self.profile_status = "ok"
+            print("Perfil de calibração verificado")
+        else:
+            self.calibration_data.update(min_x=0.0, max_x=1.0, min_y=0.0, max_y=1.0,
+                                         center_x=0.5, center_y=0.5)
+            self.has_calibration = False
+            self.profile_status = "invalido"
+            print("Perfil de calibração não confere com a posição atual - recalibre")
+
     def _normalize_position(self, x: float, y: float) -> Tuple[float, float]:
         """Normaliza a posição com base nos dados de calibração"""
         x_norm = (x - self.calibration_data['center_x']) / \
@@ -92,53 +592,66 @@ class HeadTracker:
 
         return x_norm, y_norm
 
-    def _update_loop(self):
-        while self.running:
-            try:
-                ret, frame = self.cap.read()
-                if not ret:
-                    continue
+    def _handle_detection(self, new_x: float, new_y: float):
+        """Encaminha uma nova posição detectada para a calibração ou para a publicação"""
+        # Durante calibração, apenas colete amostras
+        if self.is_calibrating:
+            with self._calibration_lock:
+                self.calibration.add(new_x, new_y)
+            return
 
-                # Pré-processamento da imagem
-                frame = cv2.flip(frame, 1)
-                rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        if self._verify_remaining > 0:
+            with self._calibration_lock:
+                if self._verify_remaining > 0:
+                    self._verify_profile_sample(new_x, new_y)
 
-                # Detecção de rosto
-                results = self.face.process(rgb)
+        self._publish_position(new_x, new_y)
 
-                if results.detections:
-                    detection = results.detections[0]
-                    box = detection.location_data.relative_bounding_box
+    def _publish_position(self, new_x: float, new_y: float):
+        """Aplica a suavização e publica um novo snapshot da posição"""
+        last = self._position
+        x, y = last.x, last.y
 
-                    # Nova posição detectada
-                    new_x = box.xmin + box.width / 2
-                    new_y = box.ymin + box.height / 2
+        # Suavização de movimento
+        if abs(new_x - x) > self.min_movement:
+            x += (new_x - x) * self.smoothing_factor
+        if abs(new_y - y) > self.min_movement:
+            y += (new_y - y) * self.smoothing_factor
 
-                    # Durante calibração, apenas colete amostras
-                    if self.is_calibrating:
-                        self.calibration_samples.append((new_x, new_y))
-                        continue
+        with self._position_lock:
+            self._position = HeadPosition(x, y, last.seq + 1, time.perf_counter())
 
-                    # Suavização de movimento
-                    if abs(new_x - self.current_x) > self.min_movement:
-                        self.current_x += (new_x - self.current_x) * self.smoothing_factor
-                    if abs(new_y - self.current_y) > self.min_movement:
-                        self.current_y += (new_y - self.current_y) * self.smoothing_factor
-            except Exception as e:
-                print(f"Erro na captura de vídeo: {e}")
-                self.running = False
-                break
+    def get_position_snapshot(self) -> HeadPosition:
+        """Retorna o último snapshot publicado (posição bruta e número de sequência)"""
+        with self._position_lock:
+            return self._position
+
+    @property
+    def current_x(self) -> float:
+        return self.get_position_snapshot().x
+
+    @property
+    def current_y(self) -> float:
+        return self.get_position_snapshot().y
 
     def get_normalized_position(self) -> Tuple[float, float]:
         """Retorna a posição normalizada e calibrada"""
         if self.is_calibrating:
             return 0.5, 0.5
 
-        x, y = self._normalize_position(self.current_x, self.current_y)
-        return (x, y)
+        snapshot = self.get_position_snapshot()
+        return self._normalize_position(snapshot.x, snapshot.y)
 
     def get_calibration_status(self) -> str:
         """Retorna o status da calibração"""
         if self.is_calibrating:
-            return f"Calibrando... {len(self.calibration_samples)} amostras"
-        return "Calibração concluída"
\ No newline at end of file
+            return f"Calibrando... {self.calibration.count} amostras"
+        if self.profile_status == "verificando":
+            return "Verificando perfil..."
+        if self.profile_status == "ok":
+            return "Perfil carregado"
+        if self.profile_status == "invalido":
+            return "Perfil inválido - recalibre"
+        if not self.has_calibration:
+            return "Sem calibração"
+        return "Calibração concluída"
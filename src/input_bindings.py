@@ -0,0 +1,154 @@
+import math
+import time
+import pygame
+from collections import deque
+from typing import Deque, Dict, List, NamedTuple, Optional
+from .config import Config
+
+
+class MoveCommand(NamedTuple):
+    """Movimento amostrado para um jogador (pixels por quadro) e o instante da amostra"""
+    dx: float
+    dy: float
+    sampled_at: float
+
+
+# Ações de movimento -> teclas, por jogador
+KEYBOARD_BINDINGS: Dict[str, Dict[str, int]] = {
+    'player1': {'up': pygame.K_w, 'down': pygame.K_s, 'left': pygame.K_a, 'right': pygame.K_d},
+    'player2': {'up': pygame.K_UP, 'down': pygame.K_DOWN, 'left': pygame.K_LEFT, 'right': pygame.K_RIGHT},
+}
+
+
+class ActionMap:
+    """
+    Camada de mapeamento de ações sobre teclado e ``pygame.joystick``.
+    A amostragem é feita imediatamente antes do passo da física, e cada mudança
+    de estado recebe um carimbo de tempo para medir a latência entrada -> movimento.
+    """
+
+    def __init__(self, bindings: Optional[Dict[str, Dict[str, int]]] = None):
+        self.bindings = bindings or KEYBOARD_BINDINGS
+        self.players: List[str] = list(self.bindings)
+        self._key_to_player = {
+            key: player for player, actions in self.bindings.items() for key in actions.values()
+        }
+        self.joysticks: Dict[int, "pygame.joystick.Joystick"] = {}
+
+        # Carimbos de tempo de eventos e estado da medição de latência
+        self._pressed_at: Dict[str, Optional[int]] = {player: None for player in self.players}
+        self._was_moving: Dict[str, bool] = {player: False for player in self.players}
+        self.latencies_ms: Deque[float] = deque(maxlen=Config.INPUT_LATENCY_WINDOW)
+        self._estimated: Deque[bool] = deque(maxlen=Config.INPUT_LATENCY_WINDOW)
+        self._last_sample_ms: Optional[int] = None
+
+        pygame.joystick.init()
+        for index in range(pygame.joystick.get_count()):
+            self._add_joystick(index)
+
+    def _add_joystick(self, device_index: int):
+        joystick = pygame.joystick.Joystick(device_index)
+        joystick.init()
+        self.joysticks[joystick.get_instance_id()] = joystick
+        print(f"Controle conectado: {joystick.get_name()}")
+
+    def handle_event(self, event: pygame.event.Event):
+        """
+        Registra conexões de controles e o instante em que cada entrada de movimento chegou.
+        O instante é o carimbo do SDL (ms desde a inicialização, a mesma base de
+        ``pygame.time.get_ticks``), não o momento em que o evento saiu da fila.
+        """
+        if event.type == pygame.JOYDEVICEADDED:
+            self._add_joystick(event.device_index)
+        elif event.type == pygame.JOYDEVICEREMOVED:
+            self.joysticks.pop(event.instance_id, None)
+        elif event.type == pygame.KEYDOWN and event.key in self._key_to_player:
+            self._mark_pressed(self._key_to_player[event.key], event)
+        elif event.type == pygame.JOYAXISMOTION and abs(event.value) > Config.GAMEPAD_DEADZONE:
+            player = self._joystick_player(event.instance_id)
+            if player:
+                self._mark_pressed(player, event)
+
+    def _mark_pressed(self, player: str, event: pygame.event.Event):
+        # Versões do pygame sem ``event.timestamp`` caem na estimativa de _track_latency
+        timestamp = getattr(event, 'timestamp', None)
+        if timestamp is not None and self._pressed_at[player] is None:
+            self._pressed_at[player] = timestamp
+
+    def _joystick_player(self, instance_id: int) -> Optional[str]:
+        """Controles são atribuídos aos jogadores na ordem em que foram conectados"""
+        for index, joystick_id in enumerate(sorted(self.joysticks)):
+            if joystick_id == instance_id and index < len(self.players):
+                return self.players[index]
+        return None
+
+    def _joystick_vector(self, player: str):
+        """Retorna o vetor do analógico esquerdo com zona morta radial, ou None"""
+        for joystick_id in self.joysticks:
+            if self._joystick_player(joystick_id) != player:
+                continue
+            joystick = self.joysticks[joystick_id]
+            x, y = joystick.get_axis(0), joystick.get_axis(1)
+            magnitude = math.hypot(x, y)
+            if magnitude < Config.GAMEPAD_DEADZONE:
+                return None
+            # Reescala para que a borda da zona morta corresponda a zero
+            scale = min(1.0, (magnitude - Config.GAMEPAD_DEADZONE) / (1 - Config.GAMEPAD_DEADZONE)) / magnitude
+            return x * scale, y * scale
+        return None
+
+    def sample(self) -> Dict[str, MoveCommand]:
+        """
+        Atualiza o estado dos dispositivos e amostra o movimento de todos os jogadores.
+        Deve ser chamado imediatamente antes do passo da física.
+        """
+        pygame.event.pump()
+        now = time.perf_counter()
+        now_ms = pygame.time.get_ticks()
+        keys = pygame.key.get_pressed()
+        commands = {}
+
+        for player, actions in self.bindings.items():
+            dx = (keys[actions['right']] - keys[actions['left']]) * Config.PLAYER_SPEED
+            dy = (keys[actions['down']] - keys[actions['up']]) * Config.PLAYER_SPEED
+
+            if not dx and not dy:
+                vector = self._joystick_vector(player)
+                if vector:
+                    dx, dy = vector[0] * Config.PLAYER_SPEED, vector[1] * Config.PLAYER_SPEED
+
+            self._track_latency(player, bool(dx or dy), now_ms)
+            commands[player] = MoveCommand(dx, dy, now)
+        self._last_sample_ms = now_ms
+        return commands
+
+    def _track_latency(self, player: str, moving: bool, now_ms: int):
+        """
+        Mede o tempo entre a chegada da entrada no SDL e o primeiro passo da física com
+        movimento. Sem carimbo do SDL, a entrada chegou em algum momento entre a amostra
+        anterior e esta; usa-se o ponto médio e a medida é contada como estimada.
+        """
+        if moving and not self._was_moving[player] and self._last_sample_ms is not None:
+            pressed_at = self._pressed_at[player]
+            # Eventos anteriores à última amostra (por exemplo, digitação no menu) não contam
+            estimated = pressed_at is None or pressed_at < self._last_sample_ms
+            if estimated:
+                pressed_at = (self._last_sample_ms + now_ms) / 2
+            self.latencies_ms.append(now_ms - pressed_at)
+            self._estimated.append(estimated)
+        if not moving:
+            self._pressed_at[player] = None
+        self._was_moving[player] = moving
+
+    def latency_report(self) -> Optional[Dict[str, float]]:
+        """Resumo da latência entrada -> movimento das últimas amostras"""
+        if not self.latencies_ms:
+            return None
+        ordered = sorted(self.latencies_ms)
+        return {
+            'samples': len(ordered),
+            'estimated': sum(self._estimated),
+            'mean_ms': sum(ordered) / len(ordered),
+            'p95_ms': ordered[min(int(len(ordered) * 0.95), len(ordered) - 1)],
+            'max_ms': ordered[-1],
+        }
@@ -2,6 +2,7 @@ import pygame
 from typing import Tuple
 from .config import Config
 from .game_state import GameState
+from .game_snapshot import GameSnapshot
 from .sound_manager import SoundManager
 
 
@@ -21,7 +22,7 @@ class InputHandler:
 
         elif event.type == pygame.KEYDOWN:
             if state.menu_active and not state.controls_menu_active:
-                InputHandler._handle_menu_key_input(event, state)
+                InputHandler._handle_menu_key_input(event, state, game)
             elif state.is_paused:
                 if event.key == pygame.K_ESCAPE:
                     state.is_paused = False
@@ -41,7 +42,11 @@ class InputHandler:
             state.menu_active = True
             state.game_started = False
             state.is_paused = False
-        elif buttons[1].collidepoint(pos):
+            game.stop_online()
+            # Partida abandonada: não deve ser oferecida pelo --resume
+            GameSnapshot.clear()
+        elif buttons[1].collidepoint(pos) and not game.session:
+            # Partidas online não podem ser pausadas por um dos lados
             state.is_paused = not state.is_paused
             game.sound_manager.play_start_sound()
 
@@ -103,6 +108,8 @@ class InputHandler:
         # Verificação de colisão
         for i, rect in enumerate(name_rects):
             if rect.collidepoint(pos):
+                if state.input_active and state.input_active != f'player{i + 1}':
+                    InputHandler._apply_calibration_profile(state, game)
                 state.input_active = f'player{i + 1}'
                 return
 
@@ -116,9 +123,12 @@ class InputHandler:
                 state.player1_name = "Player 1"
             if not state.player2_name.strip():
                 state.player2_name = "Player 2"
+            InputHandler._apply_calibration_profile(state, game)
 
             # Tocar som de início
             game.sound_manager.play_start_sound()
+            game.start_match_stats()
+            game.start_replay()
 
             # Resetar estado do jogo
             state.player1_score = 0
@@ -153,10 +163,16 @@ class InputHandler:
                 return
 
     @staticmethod
-    def _handle_menu_key_input(event: pygame.event.Event, state: GameState):
+    def _handle_menu_key_input(event: pygame.event.Event, state: GameState, game):
         """
         Lida com a entrada de texto nos campos de nome do menu.
         """
+        if event.key == pygame.K_RETURN:
+            if state.input_active:
+                InputHandler._apply_calibration_profile(state, game)
+            state.input_active = None
+            return
+
         if state.input_active == 'player1':
             if event.key == pygame.K_BACKSPACE:
                 if state.player1_name:
@@ -170,6 +186,35 @@ class InputHandler:
             elif event.unicode.isprintable() and len(state.player2_name) < 15:
                 state.player2_name += event.unicode
 
+    @staticmethod
+    def _apply_calibration_profile(state: GameState, game):
+        """
+        Carrega o perfil de calibração salvo de cada jogador com controle virtual.
+        """
+        if state.player1_control == "virtual" and state.player1_name.strip():
+            game.paddles[0].load_calibration_profile(state.player1_name)
+        if state.player2_control == "virtual" and state.player2_name.strip():
+            game.paddles[1].load_calibration_profile(state.player2_name)
+
+    @staticmethod
+    def _toggle_calibration(state: GameState, game, player: int):
+        """
+        Inicia a calibração do jogador ou, se ela estiver em andamento, a finaliza.
+        """
+        paddle = game.paddles[player]
+        if not state.is_calibrating:
+            if paddle.head_tracker is None:
+                paddle.enable_head_tracking()
+
+            if paddle.head_tracker and paddle.head_tracker.running:
+                paddle.head_tracker.start_calibration()
+                state.is_calibrating = True
+                state.calibrating_player = player
+        elif state.calibrating_player == player:
+            if paddle.finish_calibration((state.player1_name, state.player2_name)[player]):
+                state.is_calibrating = False
+        game.sound_manager.play_button_click_sound()
+
     @staticmethod
     def _handle_controls_menu_click(pos: Tuple[int, int], state: GameState, game):
         menu_width = 780
@@ -192,6 +237,7 @@ class InputHandler:
                 else:
                     game.paddles[0].disable_head_tracking()
                 state.player1_control = new_control
+                InputHandler._apply_calibration_profile(state, game)
                 game.sound_manager.play_button_click_sound()
 
             # Verificar clique no botão de calibração
@@ -204,32 +250,40 @@ class InputHandler:
                 )
 
                 if calibration_rect.collidepoint(pos):
-                    if not state.is_calibrating:
-                        if game.paddles[0].head_tracker is None:
-                            game.paddles[0].enable_head_tracking()
-
-                        if game.paddles[0].head_tracker and game.paddles[0].head_tracker.running:
-                            game.paddles[0].head_tracker.start_calibration()
-                            state.is_calibrating = True
-                    else:
-                        if game.paddles[0].head_tracker and game.paddles[0].head_tracker.end_calibration():
-                            state.is_calibrating = False
-                    game.sound_manager.play_button_click_sound()
+                    InputHandler._toggle_calibration(state, game, 0)
                     return
 
         # Player 2
         player2_y = menu_rect_y + 250
-        for i in range(2):
+        for i in range(3):
             rect = pygame.Rect(
-                Config.WIDTH // 2 - 90 + i * 180,
+                Config.WIDTH // 2 - 200 + i * 180,
                 player2_y + 5,
                 170,
                 30
             )
             if rect.collidepoint(pos):
-                state.player2_control = ["arrows", "cpu"][i]
+                new_control = ["arrows", "cpu", "virtual"][i]
+                # Os dois jogadores compartilham a câmera e uma única detecção por quadro
+                if new_control == "virtual":
+                    game.paddles[1].enable_head_tracking()
+                else:
+                    game.paddles[1].disable_head_tracking()
+                state.player2_control = new_control
+                InputHandler._apply_calibration_profile(state, game)
                 game.sound_manager.play_button_click_sound()
 
+        if state.player2_control == "virtual":
+            calibration_rect = pygame.Rect(
+                Config.WIDTH // 2 - 100,
+                player2_y + 45,
+                200,
+                40
+            )
+            if calibration_rect.collidepoint(pos):
+                InputHandler._toggle_calibration(state, game, 1)
+                return
+
         # Botão Voltar
         back_rect = pygame.Rect(
             Config.WIDTH // 2 - 100,
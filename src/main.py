@@ -1,4 +1,52 @@
+import time
+STARTED_AT = time.perf_counter()
+
+import argparse
+from src.config import Config
 from src.game import Game
 
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Futebol Game Desktop")
+    parser.add_argument("--online", action="store_true", help="partida online ponto a ponto com rollback")
+    parser.add_argument("--local-port", type=int, default=7777, help="porta UDP local")
+    parser.add_argument("--remote", default="127.0.0.1:7778", help="endereço do outro jogador (host:porta)")
+    parser.add_argument("--player", type=int, choices=(1, 2), default=1, help="lado controlado por este jogador")
+    parser.add_argument("--spectators", type=int, nargs="?", const=0, default=None, metavar="PORTA",
+                        help="transmite a partida para espectadores (porta padrão em Config)")
+    parser.add_argument("--telemetry", nargs="?", const="", default=None, metavar="ARQUIVO",
+                        help="publica o estado em memória compartilhada (arquivo padrão em Config)")
+    parser.add_argument("--resume", action="store_true", help="retoma a última partida salva")
+    parser.add_argument("--quality", choices=("auto", "low", "medium", "high", "ultra"),
+                        help="preset de qualidade (\"auto\" mede o hardware novamente)")
+    return parser.parse_args()
+
+
+def start_online(game: Game, args):
+    """
+    Conecta ao outro jogador e entrega a simulação à sessão de rollback.
+    """
+    from src.netplay import RollbackSession, UdpTransport, connect
+
+    host, port = args.remote.rsplit(":", 1)
+    transport = UdpTransport(args.local_port, (host, int(port)))
+    local_index = args.player - 1
+    print(f"Aguardando o outro jogador em {args.remote}...")
+    seed = connect(transport, local_index)
+    game.state.reset()
+    game.start_online(RollbackSession(game.state, game.ball, game.paddles, game.events,
+                                      transport, local_index, seed))
+
+
 if __name__ == "__main__":
-    Game().run()
\ No newline at end of file
+    args = parse_args()
+    game = Game(started_at=STARTED_AT, quality=args.quality)
+    if args.spectators is not None:
+        game.start_spectator_server(args.spectators or Config.SPECTATOR_PORT)
+    if args.telemetry is not None:
+        game.start_telemetry(args.telemetry or Config.TELEMETRY_PATH)
+    if args.online:
+        start_online(game, args)
+    elif args.resume:
+        game.resume_match()
+    game.run()
@@ -0,0 +1,137 @@
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+import pygame
+from .config import Config
+from .sim_events import GOAL, PADDLE_HIT, WALL_BOUNCE
+
+
+class MatchStats:
+    """
+    Estatísticas de uma partida com custo constante por tick: posse de bola, toques,
+    velocidade dos chutes, rebotes nas paredes, local dos gols e mapas de calor da
+    bola e dos jogadores em histogramas pré-alocados.
+    """
+    HEATMAPS = ('ball', 'player1', 'player2')
+
+    def __init__(self, bins: Tuple[int, int] = Config.STATS_BINS):
+        self.bins = bins
+        self.heatmaps: Dict[str, np.ndarray] = {name: np.zeros(bins, dtype=np.int32) for name in self.HEATMAPS}
+        self._scale_x = bins[0] / Config.FIELD_WIDTH
+        self._scale_y = bins[1] / Config.FIELD_HEIGHT
+        self._surfaces: Dict[tuple, pygame.Surface] = {}
+        self.reset()
+
+    def reset(self):
+        """Zera os acumuladores para uma nova partida, sem realocar os histogramas"""
+        for heatmap in self.heatmaps.values():
+            heatmap.fill(0)
+        self.ticks = 0
+        self.possession_ticks = [0, 0]
+        self.touches = [0, 0]
+        self.top_shot_speed = [0.0, 0.0]  # pixels por segundo, medida na saída do toque
+        self.wall_bounces = 0
+        self.goals: List[Tuple[int, int, int]] = []  # (jogador, x, y)
+        self.last_touch: Optional[int] = None
+        self.finished = False
+        self._surfaces.clear()
+
+    # --- Coleta (a cada tick e pelos eventos da física) ------------------------
+
+    def _bin(self, heatmap: np.ndarray, x: float, y: float):
+        ix = int((x - Config.FIELD_OFFSET_X) * self._scale_x)
+        iy = int((y - Config.FIELD_OFFSET_Y) * self._scale_y)
+        heatmap[min(max(ix, 0), self.bins[0] - 1), min(max(iy, 0), self.bins[1] - 1)] += 1
+
+    def record_tick(self, ball, paddles):
+        self.ticks += 1
+        self._bin(self.heatmaps['ball'], ball.rect.centerx, ball.rect.centery)
+        self._bin(self.heatmaps['player1'], paddles[0].rect.centerx, paddles[0].rect.centery)
+        self._bin(self.heatmaps['player2'], paddles[1].rect.centerx, paddles[1].rect.centery)
+
+        if self.last_touch is not None:
+            self.possession_ticks[self.last_touch] += 1
+
+    def record_touch(self, player: int, shot_speed: float = 0.0):
+        """Conta o toque; ``shot_speed`` é a velocidade da bola ao sair do jogador (pixels por tick)"""
+        self.touches[player] += 1
+        self.last_touch = player
+        speed = shot_speed * Config.SIMULATION_RATE  # pixels por tick -> pixels por segundo
+        if speed > self.top_shot_speed[player]:
+            self.top_shot_speed[player] = speed
+
+    def record_wall_bounce(self):
+        self.wall_bounces += 1
+
+    def record_goal(self, scorer: int, x: int, y: int):
+        self.goals.append((scorer, x, y))
+        self.last_touch = None
+
+    def on_sim_events(self, events):
+        """Assinante do barramento da física"""
+        for i in range(events.count):
+            kind = events.kinds[i]
+            if kind == WALL_BOUNCE:
+                self.record_wall_bounce()
+            elif kind == PADDLE_HIT:
+                self.record_touch(events.players[i], events.exit_speeds[i])
+            elif kind == GOAL:
+                self.record_goal(events.players[i], events.xs[i], events.ys[i])
+
+    # --- Fim de partida ---------------------------------------------------------
+
+    def finish(self, player_names: Tuple[str, str] = ("", "")):
+        """Marca o fim da partida e exporta os acumuladores"""
+        if self.finished:
+            return
+        self.finished = True
+        if Config.STATS_EXPORT and self.ticks:
+            self.export(player_names)
+
+    def possession_share(self) -> Tuple[float, float]:
+        total = sum(self.possession_ticks)
+        if not total:
+            return 0.5, 0.5
+        return self.possession_ticks[0] / total, self.possession_ticks[1] / total
+
+    def export(self, player_names: Tuple[str, str] = ("", ""), directory: str = Config.STATS_DIR) -> Optional[str]:
+        """
+        Salva os histogramas e contadores em um ``.npz`` para análise entre partidas.
+        """
+        try:
+            os.makedirs(directory, exist_ok=True)
+            path = os.path.join(directory, time.strftime("partida-%Y%m%d-%H%M%S.npz"))
+            np.savez_compressed(
+                path,
+                **{f"heatmap_{name}": heatmap for name, heatmap in self.heatmaps.items()},
+                ticks=self.ticks,
+                possession_ticks=np.array(self.possession_ticks),
+                touches=np.array(self.touches),
+                top_shot_speed=np.array(self.top_shot_speed),
+                wall_bounces=self.wall_bounces,
+                goals=np.array(self.goals, dtype=np.int32).reshape(-1, 3),
+                player_names=np.array(player_names),
+            )
+            return path
+        except OSError as e:
+            print(f"Erro ao exportar estatísticas: {e}")
+            return None
+
+    def heatmap_surface(self, name: str, size: Tuple[int, int], color: Tuple[int, int, int]) -> pygame.Surface:
+        """
+        Converte o histograma em uma superfície via ``pygame.surfarray``.
+        A conversão é feita uma única vez por partida e tamanho.
+        """
+        key = (name, size, color)
+        surface = self._surfaces.get(key)
+        if surface is None:
+            counts = self.heatmaps[name].astype(np.float32)
+            peak = counts.max()
+            # Raiz quadrada realça regiões pouco visitadas
+            intensity = np.sqrt(counts / peak) if peak else counts
+            base = np.array((20, 60, 20), dtype=np.float32)
+            rgb = base + intensity[..., None] * (np.array(color, dtype=np.float32) - base)
+            surface = pygame.transform.scale(pygame.surfarray.make_surface(rgb.astype(np.uint8)), size)
+            self._surfaces[key] = surface
+        return surface
@@ -0,0 +1,198 @@
+"""
+Emulação de rede em loopback para o modo online.
+
+O ``NetworkEmulator`` é um relay UDP local que injeta latência, jitter e perda
+entre os dois jogadores. ``run_loopback_match`` usa o relay para simular uma
+partida sem janela e verifica se os dois lados terminam no mesmo estado:
+
+    SDL_VIDEODRIVER=dummy SDL_AUDIODRIVER=dummy python -m src.net_emulator --latency 50 --jitter 10 --loss 0.05
+"""
+import argparse
+import heapq
+import itertools
+import random
+import select
+import socket
+import sys
+import threading
+import time
+from typing import List, Tuple
+from .config import Config
+
+
+class NetworkEmulator:
+    """
+    Relay UDP em loopback. O jogador A envia para ``port_a`` e o pacote chega ao
+    jogador B (e vice-versa) depois de ``latency_ms`` ± ``jitter_ms``, salvo se for
+    descartado com probabilidade ``loss``.
+    """
+
+    def __init__(self, addr_a: Tuple[str, int], addr_b: Tuple[str, int], latency_ms: float = 50,
+                 jitter_ms: float = 0, loss: float = 0.0, seed: int = 0):
+        self.latency = latency_ms / 1000
+        self.jitter = jitter_ms / 1000
+        self.loss = loss
+        self._rng = random.Random(seed)
+        self._sock_a = self._bind()
+        self._sock_b = self._bind()
+        self.port_a = self._sock_a.getsockname()[1]
+        self.port_b = self._sock_b.getsockname()[1]
+        # Pacotes de A saem pelo socket de B (e vice-versa) em direção ao outro jogador
+        self._routes = {self._sock_a: (self._sock_b, addr_b), self._sock_b: (self._sock_a, addr_a)}
+        self._queue: List[tuple] = []
+        self._counter = itertools.count()
+        self._running = False
+        self._thread = None
+        self.delivered = 0
+        self.dropped = 0
+
+    @staticmethod
+    def _bind() -> socket.socket:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.bind(("127.0.0.1", 0))
+        sock.setblocking(False)
+        return sock
+
+    def start(self):
+        self._running = True
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._running = False
+        if self._thread:
+            self._thread.join()
+        self._sock_a.close()
+        self._sock_b.close()
+
+    def _loop(self):
+        sockets = list(self._routes)
+        while self._running:
+            now = time.perf_counter()
+            timeout = 0.01
+            if self._queue:
+                timeout = max(0.0, min(timeout, self._queue[0][0] - now))
+            readable, _, _ = select.select(sockets, [], [], timeout)
+
+            for sock in readable:
+                try:
+                    data, _ = sock.recvfrom(2048)
+                except OSError:
+                    continue
+                if self._rng.random() < self.loss:
+                    self.dropped += 1
+                    continue
+                delay = max(0.0, self.latency + self._rng.uniform(-self.jitter, self.jitter))
+                out_sock, dest = self._routes[sock]
+                heapq.heappush(self._queue, (time.perf_counter() + delay, next(self._counter), out_sock, dest, data))
+
+            now = time.perf_counter()
+            while self._queue and self._queue[0][0] <= now:
+                _, _, out_sock, dest, data = heapq.heappop(self._queue)
+                try:
+                    out_sock.sendto(data, dest)
+                    self.delivered += 1
+                except OSError:
+                    self.dropped += 1
+
+
+def _free_port() -> int:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.bind(("127.0.0.1", 0))
+    port = sock.getsockname()[1]
+    sock.close()
+    return port
+
+
+def run_loopback_match(ticks: int = 600, latency_ms: float = 50, jitter_ms: float = 10,
+                       loss: float = 0.05, seed: int = 1) -> dict:
+    """
+    Executa dois jogadores sem janela, com entradas roteirizadas, através do emulador.
+    Retorna as estatísticas e se os estados finais coincidem.
+    """
+    import pygame
+    from .ball import Ball
+    from .game import Game
+    from .game_state import GameState
+    from .netplay import RollbackSession, UdpTransport, connect
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    ports = [_free_port(), _free_port()]
+    emulator = NetworkEmulator(("127.0.0.1", ports[0]), ("127.0.0.1", ports[1]),
+                               latency_ms, jitter_ms, loss, seed)
+    emulator.start()
+    transports = [
+        UdpTransport(ports[0], ("127.0.0.1", emulator.port_a), "127.0.0.1"),
+        UdpTransport(ports[1], ("127.0.0.1", emulator.port_b), "127.0.0.1"),
+    ]
+
+    # Aperto de mão em paralelo (o jogador 2 responde em uma thread)
+    seeds = [None, None]
+    guest = threading.Thread(target=lambda: seeds.__setitem__(1, connect(transports[1], 1, timeout=10)))
+    guest.start()
+    seeds[0] = connect(transports[0], 0, timeout=10)
+    guest.join()
+
+    # A partida online dura segundos inteiros: ``ticks`` é arredondado para o segundo
+    duration = max(1, round(ticks / Config.NET_TICK_RATE))
+    sessions = []
+    for index in range(2):
+        state = GameState()
+        state.game_started, state.menu_active = True, False
+        state.time_remaining = state.selected_duration = duration
+        ball = Ball()
+        sessions.append(RollbackSession(state, ball, Game.create_paddles(ball), None,
+                                        transports[index], index, seeds[index]))
+
+    # Entradas pseudoaleatórias independentes para cada jogador. Cada lado faz o mesmo
+    # que Game._advance_online: avança até o fim da partida e depois continua trocando
+    # pacotes até o outro lado confirmar as últimas entradas
+    scripts = [random.Random(seed * 10 + i) for i in range(2)]
+    moves = [(0, 0)] * 2
+    lingering = [True, True]
+    frame = 1 / Config.NET_TICK_RATE
+    next_frame = time.perf_counter()
+    while any(not s.state.game_over or lingering[i] for i, s in enumerate(sessions)):
+        for index, session in enumerate(sessions):
+            if session.state.game_over:
+                lingering[index] = lingering[index] and session.linger()
+                continue
+            if scripts[index].random() < 0.1:
+                moves[index] = (scripts[index].choice((-7, 0, 7)), scripts[index].choice((-7, 0, 7)))
+            session.advance(moves[index])
+        next_frame += frame
+        time.sleep(max(0.0, next_frame - time.perf_counter()))
+
+    emulator.stop()
+    for transport in transports:
+        transport.close()
+
+    return {
+        'in_sync': sessions[0].checksum() == sessions[1].checksum(),
+        'checksums': [s.checksum() for s in sessions],
+        'rollbacks': [s.rollbacks for s in sessions],
+        'resimulated_ticks': [s.resimulated_ticks for s in sessions],
+        'stalls': [s.stalls for s in sessions],
+        'delivered': emulator.delivered,
+        'dropped': emulator.dropped,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--ticks", type=int, default=600)
+    parser.add_argument("--latency", type=float, default=50, help="latência de ida em ms")
+    parser.add_argument("--jitter", type=float, default=10, help="jitter em ms")
+    parser.add_argument("--loss", type=float, default=0.05, help="probabilidade de perda de pacote")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    result = run_loopback_match(args.ticks, args.latency, args.jitter, args.loss, args.seed)
+    for key, value in result.items():
+        print(f"{key}: {value}")
+    sys.exit(0 if result['in_sync'] else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,319 @@
+import random
+import socket
+import struct
+import time
+import zlib
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional, Tuple
+from .config import Config
+from .game_snapshot import GameSnapshot
+from .game_state import GameState
+from .physics_engine import PhysicsEngine
+from .sim_events import EventBus
+
+# Entrada de um jogador em um tick: deslocamento (dx, dy) em pixels
+NetInput = Tuple[int, int]
+NEUTRAL: NetInput = (0, 0)
+
+_MAGIC = b"GAG1"
+_HEADER = struct.Struct("<4sB")
+_HELLO = struct.Struct("<I")            # semente da partida
+_INPUTS = struct.Struct("<IIB")         # ack (+1), primeiro tick, quantidade
+_INPUT = struct.Struct("<bb")
+
+_TYPE_INPUTS = 1
+_TYPE_HELLO = 2
+_TYPE_HELLO_ACK = 3
+
+
+class UdpTransport:
+    """Socket UDP não bloqueante para a troca de entradas entre os dois jogadores"""
+
+    def __init__(self, local_port: int, remote_addr: Tuple[str, int], bind_host: str = "0.0.0.0"):
+        self.remote_addr = remote_addr
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind((bind_host, local_port))
+        self.sock.setblocking(False)
+
+    def send(self, data: bytes):
+        try:
+            self.sock.sendto(data, self.remote_addr)
+        except OSError:
+            # Perdas são toleradas: as entradas são reenviadas nos próximos pacotes
+            pass
+
+    def receive(self) -> List[bytes]:
+        packets = []
+        while True:
+            try:
+                data, _ = self.sock.recvfrom(2048)
+            except (BlockingIOError, ConnectionResetError):
+                return packets
+            packets.append(data)
+
+    def close(self):
+        self.sock.close()
+
+
+def connect(transport: UdpTransport, local_index: int, timeout: float = 30.0) -> int:
+    """
+    Aperto de mão: o jogador 1 sorteia a semente da partida e a envia até receber
+    confirmação. O jogador 2 continua confirmando enquanto o jogador 1 insistir,
+    pois a confirmação também pode se perder. Retorna a semente compartilhada.
+    """
+    deadline = time.perf_counter() + timeout
+    seed = random.getrandbits(32) if local_index == 0 else None
+    last_hello = None
+    while time.perf_counter() < deadline:
+        if local_index == 0:
+            transport.send(_HEADER.pack(_MAGIC, _TYPE_HELLO) + _HELLO.pack(seed))
+        for packet in transport.receive():
+            if len(packet) < _HEADER.size or packet[:4] != _MAGIC:
+                continue
+            kind = packet[4]
+            if local_index == 0 and kind == _TYPE_HELLO_ACK:
+                return seed
+            if local_index == 1 and kind == _TYPE_HELLO:
+                seed = _HELLO.unpack_from(packet, _HEADER.size)[0]
+                transport.send(_HEADER.pack(_MAGIC, _TYPE_HELLO_ACK))
+                last_hello = time.perf_counter()
+        if last_hello is not None and time.perf_counter() - last_hello > 0.5:
+            return seed
+        time.sleep(0.05)
+    if seed is not None and local_index == 1:
+        return seed
+    raise TimeoutError("o outro jogador não respondeu")
+
+
+class RollbackSession:
+    """
+    Sessão ponto a ponto com rollback: só as entradas de cada tick trafegam pela rede.
+    A entrada remota é prevista (repete a última conhecida); quando a real chega e
+    difere, o estado salvo do tick é restaurado e os ticks seguintes são ressimulados.
+
+    A partida só termina quando a entrada remota do último tick (``final_tick``) foi
+    confirmada, para que uma previsão errada no fim ainda seja corrigida e os dois
+    lados fechem com o mesmo placar. Depois disso ``linger`` continua reenviando as
+    entradas locais até o outro lado confirmá-las, senão ele ficaria parado esperando.
+    """
+
+    def __init__(self, state: GameState, ball, paddles, events: Optional[EventBus], transport: UdpTransport,
+                 local_index: int, seed: int, input_delay: int = Config.NET_INPUT_DELAY,
+                 max_rollback: int = Config.NET_MAX_ROLLBACK):
+        self.state = state
+        self.ball = ball
+        self.paddles = paddles
+        self.events = events
+        self.transport = transport
+        self.local_index = local_index
+        self.remote_index = 1 - local_index
+        self.input_delay = input_delay
+        self.max_rollback = max_rollback
+
+        self.tick = 0
+        self.inputs: List[Dict[int, NetInput]] = [{}, {}]
+        for t in range(input_delay):
+            self.inputs[0][t] = self.inputs[1][t] = NEUTRAL
+        self.confirmed_remote = input_delay - 1
+        self.remote_ack = input_delay - 1
+        self.predicted: Dict[int, NetInput] = {}
+        self.saved: Dict[int, bytes] = {}
+        self._mispredicted_at: Optional[int] = None
+        # Chamado ao fim de cada tick simulado, inclusive nos ressimulados pelo rollback
+        self.on_tick: Optional[Callable[[int], None]] = None
+
+        # Cada sessão tem seu próprio fluxo aleatório, idêntico nos dois jogadores
+        self.rng_state = random.Random(seed).getstate()
+        self.duration = state.selected_duration
+        self.final_tick = self.duration * Config.NET_TICK_RATE - 1
+        self._waiting_since: Optional[float] = None
+        self._finished_at: Optional[float] = None
+
+        # A simulação precisa ser idêntica nos dois lados: nada de câmera nem de
+        # frações de pixel herdadas da partida local
+        for paddle in self.paddles:
+            paddle.disable_head_tracking()
+            paddle.reset_motion()
+
+        # Estado inicial idêntico nos dois jogadores
+        self.state.player1_score = self.state.player2_score = 0
+        self.state.time_remaining = self.duration
+        with self._session_rng():
+            self.ball.reset()
+
+        # Estatísticas
+        self.rollbacks = 0
+        self.resimulated_ticks = 0
+        self.stalls = 0
+
+    # --- Estado ---------------------------------------------------------------
+
+    def save_state(self) -> bytes:
+        return GameSnapshot.snapshot(self.state, self.ball, self.paddles, self.rng_state, include_meta=False)
+
+    def load_state(self, saved: bytes):
+        self.rng_state = GameSnapshot.restore(saved, self.state, self.ball, self.paddles, restore_rng=False)
+
+    def checksum(self) -> int:
+        """Soma de verificação do estado simulado (para detectar dessincronização)"""
+        return zlib.crc32(self.save_state())
+
+    # --- Simulação ------------------------------------------------------------
+
+    @contextmanager
+    def _session_rng(self):
+        """Usa o fluxo aleatório da sessão sem afetar o restante do processo"""
+        outer_rng = random.getstate()
+        random.setstate(self.rng_state)
+        try:
+            yield
+            self.rng_state = random.getstate()
+        finally:
+            random.setstate(outer_rng)
+
+    def _remote_input(self, tick: int) -> NetInput:
+        known = self.inputs[self.remote_index]
+        if tick in known:
+            return known[tick]
+        guess = known.get(self.confirmed_remote, NEUTRAL)
+        self.predicted[tick] = guess
+        return guess
+
+    def _simulate(self, tick: int, silent: bool = False):
+        self.saved[tick] = self.save_state()
+        frame_inputs = [NEUTRAL, NEUTRAL]
+        frame_inputs[self.local_index] = self.inputs[self.local_index].get(tick, NEUTRAL)
+        frame_inputs[self.remote_index] = self._remote_input(tick)
+
+        with self._session_rng():
+            for paddle, (dx, dy) in zip(self.paddles, frame_inputs):
+                paddle.move(dx, dy)
+            # Na ressimulação os eventos já foram entregues: a física roda sem barramento
+            events = None if silent else self.events
+            PhysicsEngine.step(self.state, self.ball, self.paddles, events)
+        if events is not None:
+            events.dispatch()
+
+        # O tempo da partida deriva do tick para ser idêntico nos dois jogadores; o fim
+        # é declarado em advance, depois que o último tick foi confirmado
+        self.state.time_remaining = max(0, self.duration - (tick + 1) // Config.NET_TICK_RATE)
+        if self.on_tick:
+            self.on_tick(tick)
+
+    def advance(self, local_input: NetInput) -> bool:
+        """
+        Processa a rede e avança um tick. Retorna False se a sessão precisou esperar
+        pelo outro jogador (previsão além de ``max_rollback`` ticks).
+        """
+        self._receive()
+        self._rollback()
+
+        if self.tick > self.final_tick:
+            self._send()
+            self._finish_when_confirmed()
+            return False
+
+        if self.tick - self.confirmed_remote > self.max_rollback:
+            self.stalls += 1
+            self._send()
+            return False
+
+        self.inputs[self.local_index][self.tick + self.input_delay] = (
+            int(max(-127, min(127, local_input[0]))), int(max(-127, min(127, local_input[1])))
+        )
+        self._send()
+        self._simulate(self.tick)
+        self.tick += 1
+        self._prune()
+        return True
+
+    def _finish_when_confirmed(self):
+        """Todos os ticks foram simulados: encerra quando a última entrada remota chegar"""
+        now = time.perf_counter()
+        if self._waiting_since is None:
+            self._waiting_since = now
+        confirmed = self.confirmed_remote >= self.final_tick
+        if not confirmed and now - self._waiting_since < Config.NET_FINISH_TIMEOUT:
+            return
+        if not confirmed:
+            print("O outro jogador não enviou as últimas entradas; o resultado pode divergir")
+        self.state.game_over = True
+        self.state.game_started = False
+        self._finished_at = now
+
+    def linger(self) -> bool:
+        """
+        Depois do fim, continua recebendo e reenviando as últimas entradas locais (com a
+        confirmação das remotas) até o outro lado confirmá-las e passar ``NET_FINISH_GRACE``,
+        ou até ``NET_FINISH_TIMEOUT``. Retorna False quando não há mais nada a fazer.
+        """
+        if self._finished_at is None:
+            return False
+        self._receive()
+        elapsed = time.perf_counter() - self._finished_at
+        if elapsed > Config.NET_FINISH_TIMEOUT or (
+                self.remote_ack >= self.final_tick and elapsed >= Config.NET_FINISH_GRACE):
+            return False
+        self._send()
+        return True
+
+    def _rollback(self):
+        start = self._mispredicted_at
+        self._mispredicted_at = None
+        if start is None or start >= self.tick:
+            return
+        self.rollbacks += 1
+        self.load_state(self.saved[start])
+        for tick in range(start, self.tick):
+            self.predicted.pop(tick, None)
+            self._simulate(tick, silent=True)
+            self.resimulated_ticks += 1
+
+    def _prune(self):
+        """Descarta estados e entradas que não podem mais ser revertidos"""
+        horizon = min(self.confirmed_remote, self.remote_ack, self.tick - self.max_rollback) - 1
+        for table in (self.saved, self.predicted, self.inputs[0], self.inputs[1]):
+            for tick in [t for t in table if t < horizon]:
+                del table[tick]
+
+    # --- Rede -----------------------------------------------------------------
+
+    def _send(self):
+        local = self.inputs[self.local_index]
+        last = self.tick + self.input_delay
+        first = max(self.remote_ack + 1, last - Config.NET_INPUTS_PER_PACKET + 1, 0)
+        payload = b"".join(_INPUT.pack(*local.get(t, NEUTRAL)) for t in range(first, last + 1))
+        count = last - first + 1
+        self.transport.send(
+            _HEADER.pack(_MAGIC, _TYPE_INPUTS) + _INPUTS.pack(self.confirmed_remote + 1, first, count) + payload
+        )
+
+    def _receive(self):
+        remote = self.inputs[self.remote_index]
+        for packet in self.transport.receive():
+            if len(packet) < _HEADER.size or packet[:4] != _MAGIC:
+                continue
+            kind = packet[4]
+            if kind == _TYPE_HELLO:
+                # O ACK do aperto de mão se perdeu: confirma novamente
+                self.transport.send(_HEADER.pack(_MAGIC, _TYPE_HELLO_ACK))
+                continue
+            if kind != _TYPE_INPUTS:
+                continue
+
+            ack, first, count = _INPUTS.unpack_from(packet, _HEADER.size)
+            self.remote_ack = max(self.remote_ack, ack - 1)
+            offset = _HEADER.size + _INPUTS.size
+            for i in range(count):
+                tick = first + i
+                if tick in remote or tick <= self.confirmed_remote:
+                    continue
+                actual = _INPUT.unpack_from(packet, offset + i * _INPUT.size)
+                remote[tick] = actual
+                guess = self.predicted.pop(tick, None)
+                if guess is not None and guess != actual:
+                    if self._mispredicted_at is None or tick < self._mispredicted_at:
+                        self._mispredicted_at = tick
+
+        while self.confirmed_remote + 1 in remote:
+            self.confirmed_remote += 1
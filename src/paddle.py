@@ -1,23 +1,30 @@
 import pygame
-import random
-import math
-from typing import Tuple
+from typing import Optional, Tuple
 from .asset_loader import AssetLoader
 from .config import Config
-from .head_tracker import HeadTracker
+from .camera_stack import TrackerLoader
+from .calibration_profiles import CalibrationProfiles
+from .cpu_ai import CpuController
+from .collision_shape import CollisionShape
 
 
 class Paddle:
-    def __init__(self, image_path: str, constraints: Tuple[int, int, int, int], ball=None):
+    def __init__(self, image_path: str, constraints: Tuple[int, int, int, int], ball=None, side: int = 0):
         self.image = AssetLoader.load_image(image_path, (Config.PADDLE_WIDTH, Config.PADDLE_HEIGHT))
+        self.shape = CollisionShape.load(image_path, (Config.PADDLE_WIDTH, Config.PADDLE_HEIGHT))
         self.rect = pygame.Rect(0, 0, Config.PADDLE_WIDTH, Config.PADDLE_HEIGHT)
         self.constraints = constraints
         self.ball = ball
+        self.side = side  # lado do campo; no controle "Virtual", escolhe o rosto seguido
 
         # Configurações de movimento
         self.cpu_speed = Config.PLAYER_SPEED * 0.75
-        self.prediction_error = 0
+        self.cpu_controller: Optional[CpuController] = None
         self.head_tracker = None
+        self.tracker_loader: Optional[TrackerLoader] = None
+        self.tracking_requested = False
+        self.profile_name = None
+        self.pending_profile = None
 
         # Parâmetros para suavização e controle
         self.smoothing_factor = 0.3
@@ -27,25 +34,104 @@ class Paddle:
         self.edge_margin = 50
         self.smoothed_x = constraints[0] + (constraints[1] - constraints[0]) // 2
         self.smoothed_y = constraints[2] + (constraints[3] - constraints[2]) // 2
+        # Fração de pixel ainda não aplicada (o Rect só guarda inteiros)
+        self._remainder_x = 0.0
+        self._remainder_y = 0.0
 
     def enable_head_tracking(self):
-        """Inicia o rastreamento de cabeça com webcam"""
-        try:
-            self.head_tracker = HeadTracker()
-            self.head_tracker.start()
-            print("Rastreamento de cabeça ativado com sucesso!")
-        except Exception as e:
-            print(f"Erro ao iniciar webcam: {e}")
-            self.head_tracker = None
+        """Inicia o rastreamento de cabeça com webcam (carregado em segundo plano)"""
+        self.tracking_requested = True
+        if self.head_tracker:
+            return
+        if self.tracker_loader is None or self.tracker_loader.status == TrackerLoader.ERROR:
+            self.tracker_loader = TrackerLoader(self.side)
+            self.tracker_loader.start()
+        self.poll_head_tracking()
+
+    def prewarm_head_tracking(self):
+        """Carrega o modelo e abre a câmera antecipadamente, sem ativar o controle"""
+        if self.head_tracker or self.tracker_loader:
+            return
+        self.tracker_loader = TrackerLoader(self.side)
+        self.tracker_loader.start()
+
+    def poll_head_tracking(self):
+        """Ativa o rastreador assim que o carregamento em segundo plano termina"""
+        loader = self.tracker_loader
+        if not self.tracking_requested or self.head_tracker or not loader:
+            return
+
+        if loader.status == TrackerLoader.READY:
+            self.head_tracker = loader.tracker
+            self.tracker_loader = None
+            try:
+                self.head_tracker.start()
+                print("Rastreamento de cabeça ativado com sucesso!")
+            except Exception as e:
+                print(f"Erro ao iniciar webcam: {e}")
+                self.head_tracker.stop()
+                self.head_tracker = None
+                return
+            if self.pending_profile:
+                pending, self.pending_profile = self.pending_profile, None
+                self.load_calibration_profile(pending)
+        elif loader.status == TrackerLoader.ERROR:
+            self.tracking_requested = False
+
+    def tracking_status(self) -> Optional[str]:
+        """Retorna o progresso do carregamento da câmera, se houver um em andamento"""
+        loader = self.tracker_loader
+        if self.head_tracker or not loader:
+            return None
+        if self.tracking_requested or loader.status == TrackerLoader.ERROR:
+            return loader.progress
+        return None
+
+    def load_calibration_profile(self, player_name: str) -> bool:
+        """Reaplica a calibração salva do jogador, evitando uma nova calibração"""
+        if not self.head_tracker and self.tracker_loader:
+            # Aplicado quando o rastreador terminar de carregar
+            self.pending_profile = player_name
+            return False
+        if not self.head_tracker or self.head_tracker.is_calibrating:
+            return False
+        if self.profile_name == player_name.strip():
+            return True
+        data = CalibrationProfiles.load(player_name)
+        if not data:
+            return False
+        self.head_tracker.apply_profile(data)
+        self.profile_name = player_name.strip()
+        print(f"Perfil de calibração de {player_name.strip()} carregado")
+        return True
+
+    def finish_calibration(self, player_name: str) -> bool:
+        """Finaliza a calibração e salva o perfil do jogador"""
+        if not self.head_tracker or not self.head_tracker.end_calibration():
+            return False
+        if CalibrationProfiles.save(player_name, self.head_tracker.calibration_data):
+            self.profile_name = player_name.strip()
+        return True
 
     def disable_head_tracking(self):
         """Desativa o rastreamento de cabeça"""
+        self.tracking_requested = False
+        self.pending_profile = None
+        if self.tracker_loader:
+            self.tracker_loader.cancel()
+            self.tracker_loader = None
         if self.head_tracker:
             self.head_tracker.stop()
             self.head_tracker = None
+            self.profile_name = None
             print("Rastreamento de cabeça desativado")
 
-    def move(self, dx: int, dy: int):
+    def reset_motion(self):
+        """Descarta a fração de pixel acumulada (por exemplo, ao entrar em uma sessão online)"""
+        self._remainder_x = 0.0
+        self._remainder_y = 0.0
+
+    def move(self, dx: float, dy: float):
         """Movimenta o paddle mantendo a velocidade consistente com o controle por teclado"""
         if self.head_tracker and self.head_tracker.running:
             try:
@@ -85,86 +171,34 @@ class Paddle:
                     center_x = self.constraints[0] + (self.constraints[1] - self.constraints[0]) // 2
                     dx = (center_x - self.rect.x) * 0.05
 
-                # Aplica movimento
-                self.rect.x += dx
-                self.rect.y += dy
-
             except Exception as e:
                 print(f"Erro no rastreamento: {e}")
-                self.rect.x += dx
-                self.rect.y += dy
-        else:
-            # Movimento padrão por teclado (inalterado)
-            self.rect.x += dx
-            self.rect.y += dy
 
-        # Garante que o paddle não saia dos limites
-        self.rect.x = max(min(self.rect.x, self.constraints[1] - self.rect.width), self.constraints[0])
-        self.rect.y = max(min(self.rect.y, self.constraints[3] - self.rect.height), self.constraints[2])
+        # Teclado, analógico ou rastreamento: acumula a fração para que deslocamentos
+        # menores que um pixel (analógico pouco inclinado) não se percam no truncamento
+        self._remainder_x += dx
+        self._remainder_y += dy
+        step_x, step_y = round(self._remainder_x), round(self._remainder_y)
+        self._remainder_x -= step_x
+        self._remainder_y -= step_y
+        x, y = self.rect.x + step_x, self.rect.y + step_y
+
+        # Garante que o paddle não saia dos limites (encostado na borda, a fração é descartada)
+        min_x, max_x = self.constraints[0], self.constraints[1] - self.rect.width
+        min_y, max_y = self.constraints[2], self.constraints[3] - self.rect.height
+        if not min_x <= x <= max_x:
+            self._remainder_x = 0.0
+        if not min_y <= y <= max_y:
+            self._remainder_y = 0.0
+        self.rect.x = max(min(x, max_x), min_x)
+        self.rect.y = max(min(y, max_y), min_y)
 
     def cpu_move(self):
-        """Movimento controlado pela IA com comportamento mais orgânico"""
+        """Movimento controlado pela IA, que intercepta a trajetória prevista da bola"""
         if not self.ball:
             return
 
-        # Comportamento diferente perto das paredes
-        near_wall = (
-                self.ball.rect.left <= Config.FIELD_OFFSET_X + 20 or
-                self.ball.rect.right >= Config.FIELD_OFFSET_X + Config.FIELD_WIDTH - 20
-        )
-
-        if near_wall:
-            target_x = self.rect.centerx
-            target_y = self.rect.centery - 50
-        else:
-            # Previsão de posição com erro simulado
-            ball_speed_factor = 1 + (self.ball.speed_x / Config.BALL_SPEED)
-            target_x = self.ball.rect.centerx + self.ball.speed_x * ball_speed_factor
-            target_y = self.ball.rect.centery + self.ball.speed_y * ball_speed_factor
-
-            # Adiciona erro humano simulado
-            prediction_error = random.randint(-int(abs(self.ball.speed_y) * 5), int(abs(self.ball.speed_y) * 5))
-            target_y += prediction_error
-
-        # Suavização com momentum variável
-        momentum = random.uniform(0.7, 1.3)
-        dx = (target_x - self.rect.centerx) * 0.1 * momentum
-        dy = (target_y - self.rect.centery) * 0.1 * momentum
-
-        # Limita velocidade máxima
-        dx = max(min(dx, self.cpu_speed), -self.cpu_speed)
-        dy = max(min(dy, self.cpu_speed), -self.cpu_speed)
-
-        # Movimento ocasionalmente errático
-        if random.random() < 0.2:
-            dx += random.uniform(-2, 2)
-            dy += random.uniform(-2, 2)
-
+        if self.cpu_controller is None:
+            self.cpu_controller = CpuController(self)
+        dx, dy = self.cpu_controller.update(self.ball)
         self.move(int(dx), int(dy))
-
-    def check_and_reposition_ball(self):
-        """Corrige colisões persistentes com a bola"""
-        if not self.ball or not self.rect.colliderect(self.ball.rect):
-            return
-
-        near_wall = (
-                self.ball.rect.left <= Config.FIELD_OFFSET_X + 5 or
-                self.ball.rect.right >= Config.FIELD_OFFSET_X + Config.FIELD_WIDTH - 5
-        )
-
-        if near_wall:
-            # Reposicionamento radical perto das paredes
-            self.ball.rect.center = (Config.WIDTH // 2, Config.HEIGHT // 2)
-            self.ball.speed_x = Config.BALL_SPEED * (-1 if self.ball.speed_x > 0 else 1)
-            self.ball.speed_y = Config.BALL_SPEED * random.uniform(-0.5, 0.5)
-        else:
-            # Reposicionamento normal
-            overlap_x = min(self.ball.rect.right - self.rect.left, self.rect.right - self.ball.rect.left)
-            overlap_y = min(self.ball.rect.bottom - self.rect.top, self.rect.bottom - self.ball.rect.top)
-
-            if overlap_x < overlap_y:
-                self.ball.speed_x *= -1.1
-                self.ball.rect.x += math.copysign(overlap_x, self.ball.speed_x)
-            else:
-                self.ball.speed_y *= -1.1
-                self.ball.rect.y += math.copysign(overlap_y, self.ball.speed_y)
\ No newline at end of file
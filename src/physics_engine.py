@@ -4,12 +4,69 @@ from typing import List, Optional
 from .config import Config
 from .ball import Ball
 from .paddle import Paddle
-from .sound_manager import SoundManager
+from .game_state import GameState
+from .sim_events import EventBus, GOAL, PADDLE_HIT, WALL_BOUNCE
 
 
 class PhysicsEngine:
     @staticmethod
-    def handle_collisions(ball: Ball, paddles: List[Paddle], sound_manager: SoundManager, game) -> Optional[str]:
+    def step(state: GameState, ball: Ball, paddles: List[Paddle],
+             events: Optional[EventBus] = None) -> Optional[str]:
+        """
+        Avança a bola um quadro, resolve as colisões e contabiliza gols.
+        Colisões e gols são gravados em ``events``, se informado.
+        """
+        ball.update()
+        result = PhysicsEngine.handle_collisions(ball, paddles, events)
+        if result and events is not None:
+            events.emit(GOAL, player=0 if result == "player1" else 1, x=ball.rect.centerx, y=ball.rect.centery)
+        if result == "player1":
+            state.player1_score += 1
+            ball.reset(-1)
+        elif result == "player2":
+            state.player2_score += 1
+            ball.reset(1)
+        return result
+
+    @staticmethod
+    def _bounce_off_paddle(ball: Ball, paddle: Paddle, contact, offset):
+        """
+        Reflete a bola na normal do contorno do jogador no ponto de contato e a
+        empurra para fora da sobreposição.
+        """
+        nx, ny = paddle.shape.normal_at(contact)
+
+        near_wall = (
+                ball.rect.left <= Config.FIELD_OFFSET_X + 15 or
+                ball.rect.right >= Config.FIELD_OFFSET_X + Config.FIELD_WIDTH - 15
+        )
+        if near_wall:
+            angle = math.radians(random.choice([75, 105, 255, 285]))
+            vx, vy = math.cos(angle), math.sin(angle)
+        else:
+            dot = ball.speed_x * nx + ball.speed_y * ny
+            if dot < 0:
+                # Bola vindo em direção ao jogador: reflexão especular
+                vx, vy = ball.speed_x - 2 * dot * nx, ball.speed_y - 2 * dot * ny
+            else:
+                # O jogador alcançou a bola: ela sai na direção da normal
+                vx, vy = nx, ny
+        speed = math.hypot(vx, vy) or 1
+        ball.speed_x = Config.BALL_SPEED * vx / speed
+        ball.speed_y = Config.BALL_SPEED * vy / speed
+
+        # Empurrar a bola para fora ao longo da normal até não haver sobreposição
+        for step in range(1, Config.BALL_SIZE // 2, 2):
+            push = (round(nx * step), round(ny * step))
+            if paddle.shape.mask.overlap(ball.mask, (offset[0] + push[0], offset[1] + push[1])) is None:
+                break
+        ball.rect.x += push[0]
+        ball.rect.y += push[1]
+
+        ball.rotation_speed = random.uniform(-8, 8)
+
+    @staticmethod
+    def handle_collisions(ball: Ball, paddles: List[Paddle], events: Optional[EventBus] = None) -> Optional[str]:
         """
         Versão melhorada com prevenção de travamento e física mais estável
         """
@@ -24,68 +81,56 @@ class PhysicsEngine:
                     # Dar leve impulso vertical
                     ball.speed_y += random.uniform(-1, 1) * Config.BALL_SPEED / 2
 
+        # Velocidade antes de qualquer rebote (intensidade do impacto nos eventos)
+        impact_speed = math.hypot(ball.speed_x, ball.speed_y)
+
         # Colisão com as bordas superior/inferior
         if ball.rect.top <= Config.FIELD_OFFSET_Y:
             ball.rect.top = Config.FIELD_OFFSET_Y + 1
             ball.speed_y = abs(ball.speed_y) * 1.1
-            sound_manager.play_collision_sound()
+            if events is not None:
+                events.emit(WALL_BOUNCE, impact_speed, x=ball.rect.centerx, y=ball.rect.centery)
         elif ball.rect.bottom >= Config.FIELD_OFFSET_Y + Config.FIELD_HEIGHT:
             ball.rect.bottom = Config.FIELD_OFFSET_Y + Config.FIELD_HEIGHT - 1
             ball.speed_y = -abs(ball.speed_y) * 1.1
-            sound_manager.play_collision_sound()
-
-        # Colisão com raquetes
-        for paddle in paddles:
-            dx = ball.rect.centerx - paddle.rect.centerx
-            dy = ball.rect.centery - paddle.rect.centery
-            distance = math.hypot(dx, dy)
-            min_distance = (Config.BALL_SIZE // 2 + max(paddle.rect.width, paddle.rect.height) // 2)
-
-            if distance < min_distance:
-                angle = math.atan2(dy, dx)
-
-                near_wall = (
-                        ball.rect.left <= Config.FIELD_OFFSET_X + 15 or
-                        ball.rect.right >= Config.FIELD_OFFSET_X + Config.FIELD_WIDTH - 15
-                )
-
-                if near_wall:
-                    angle = math.radians(random.choice([75, 105, 255, 285]))
-
-                ball.speed_x = Config.BALL_SPEED * math.cos(angle)
-                ball.speed_y = Config.BALL_SPEED * math.sin(angle)
-
-                # Empurrar a bola para fora se colada
-                if distance < min_distance / 2:
-                    push_force = 1 + (min_distance - distance) / min_distance
-                    ball.rect.x += math.cos(angle) * push_force
-                    ball.rect.y += math.sin(angle) * push_force
+            if events is not None:
+                events.emit(WALL_BOUNCE, impact_speed, x=ball.rect.centerx, y=ball.rect.centery)
 
-                ball.rotation_speed = random.uniform(-8, 8)
-                sound_manager.play_collision_sound()
+        # Colisão com raquetes: descarte pelo retângulo e, se sobrepostos, teste por pixel
+        for index, paddle in enumerate(paddles):
+            if not ball.rect.colliderect(paddle.rect):
+                continue
+            offset = (ball.rect.x - paddle.rect.x, ball.rect.y - paddle.rect.y)
+            contact = paddle.shape.contact(offset, ball.mask)
+            if contact is None:
+                continue
+            PhysicsEngine._bounce_off_paddle(ball, paddle, contact, offset)
+            if events is not None:
+                events.emit(PADDLE_HIT, impact_speed, index, ball.rect.centerx, ball.rect.centery,
+                            math.hypot(ball.speed_x, ball.speed_y))
 
         # Colisão com laterais + verificação de travamento
         result = None
         if ball.rect.left <= Config.FIELD_OFFSET_X:
             if (Config.HEIGHT - Config.GOAL_HEIGHT) // 2 < ball.rect.centery < (
                     Config.HEIGHT + Config.GOAL_HEIGHT) // 2:
-                sound_manager.play_goal_sound()
                 result = "player2"
             else:
                 ball.rect.left = Config.FIELD_OFFSET_X + 1
                 ball.speed_x = abs(ball.speed_x)
                 _check_wall_collision_stuck()
-                sound_manager.play_collision_sound()
+                if events is not None:
+                    events.emit(WALL_BOUNCE, impact_speed, x=ball.rect.centerx, y=ball.rect.centery)
 
         elif ball.rect.right >= Config.FIELD_OFFSET_X + Config.FIELD_WIDTH:
             if (Config.HEIGHT - Config.GOAL_HEIGHT) // 2 < ball.rect.centery < (
                     Config.HEIGHT + Config.GOAL_HEIGHT) // 2:
-                sound_manager.play_goal_sound()
                 result = "player1"
             else:
                 ball.rect.right = Config.FIELD_OFFSET_X + Config.FIELD_WIDTH - 1
                 ball.speed_x = -abs(ball.speed_x)
                 _check_wall_collision_stuck()
-                sound_manager.play_collision_sound()
+                if events is not None:
+                    events.emit(WALL_BOUNCE, impact_speed, x=ball.rect.centerx, y=ball.rect.centery)
 
         return result
\ No newline at end of file
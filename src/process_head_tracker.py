@@ -0,0 +1,203 @@
+import cv2
+import struct
+import multiprocessing as mproc
+from multiprocessing import shared_memory
+from typing import List, Optional, Tuple
+import numpy as np
+from .config import Config
+from .head_tracker import DetectorSettings, FaceSource
+
+# Layout do bloco de controle compartilhado:
+#   slot_seqs[RING]  -> sequência do quadro gravado em cada slot
+#   latest_seq       -> último quadro publicado pelo processo do jogo
+#   result_seq       -> seqlock do resultado (ímpar = escrita em andamento)
+#   frame_seq        -> quadro que originou o resultado
+#   found            -> quantidade de rostos encontrados (até HEAD_TRACKER_MAX_FACES)
+#   x1, y1, x2, ...  -> centro de cada rosto
+_HEADER = struct.Struct("<Q")
+_RESULT = struct.Struct("<QQi" + "dd" * Config.HEAD_TRACKER_MAX_FACES)
+
+
+def _control_size(slots: int) -> int:
+    return _HEADER.size * (slots + 1) + _RESULT.size
+
+
+def _result_offset(slots: int) -> int:
+    return _HEADER.size * (slots + 1)
+
+
+def _inference_worker(frames_name: str, control_name: str, shape: Tuple[int, int, int],
+                      slots: int, frame_ready, stop_event, model_selection: int = 1):
+    """Processo de inferência: lê quadros do anel compartilhado e publica o centro dos rostos"""
+    import mediapipe as mp
+
+    frames_shm = shared_memory.SharedMemory(name=frames_name)
+    control_shm = shared_memory.SharedMemory(name=control_name)
+    ring = np.ndarray((slots,) + tuple(shape), dtype=np.uint8, buffer=frames_shm.buf)
+    control = control_shm.buf
+    result_at = _result_offset(slots)
+
+    face = mp.solutions.face_detection.FaceDetection(
+        min_detection_confidence=0.7,
+        model_selection=model_selection
+    )
+    processed = 0
+    result_seq = 0
+    try:
+        while not stop_event.is_set():
+            if not frame_ready.wait(0.1):
+                continue
+            frame_ready.clear()
+
+            latest = _HEADER.unpack_from(control, _HEADER.size * slots)[0]
+            if latest <= processed:
+                continue
+            slot = latest % slots
+
+            rgb = cv2.cvtColor(ring[slot], cv2.COLOR_BGR2RGB)
+            # O produtor pode ter sobrescrito o slot durante a cópia
+            if _HEADER.unpack_from(control, _HEADER.size * slot)[0] != latest:
+                continue
+            processed = latest
+
+            results = face.process(rgb)
+            centers = [0.0] * (2 * Config.HEAD_TRACKER_MAX_FACES)
+            found = 0
+            for detection in (results.detections or [])[:Config.HEAD_TRACKER_MAX_FACES]:
+                box = detection.location_data.relative_bounding_box
+                centers[2 * found:2 * found + 2] = box.xmin + box.width / 2, box.ymin + box.height / 2
+                found += 1
+
+            result_seq += 1
+            _HEADER.pack_into(control, result_at, 2 * result_seq - 1)
+            _RESULT.pack_into(control, result_at, 2 * result_seq - 1, latest, found, *centers)
+            _HEADER.pack_into(control, result_at, 2 * result_seq)
+    finally:
+        face.close()
+        del ring, control
+        frames_shm.close()
+        control_shm.close()
+
+
+class ProcessFaceSource(FaceSource):
+    """
+    Variante da FaceSource que executa a inferência do MediaPipe em outro processo.
+    Os quadros passam por slots de memória compartilhada e o resultado volta por uma
+    pequena estrutura compartilhada, sem disputar o GIL com o loop de renderização.
+    """
+
+    def __init__(self, slots: int = Config.HEAD_TRACKER_RING_SLOTS):
+        self.slots = slots
+        self._process = None
+        self._frames_shm = None
+        self._control_shm = None
+        self._ring = None
+        self._frame_ready = None
+        self._stop_event = None
+        self._frame_seq = 0
+        self._last_result_seq = 0
+        super().__init__()
+        if self.selector:
+            # O tempo de inferência fica no outro processo: usa a combinação configurada
+            print("Escolha automática do detector indisponível no backend 'process'")
+            self.selector = None
+            self.settings = DetectorSettings.configured()
+
+    def _create_detector(self, model_selection: int):
+        # O modelo é carregado apenas no processo de inferência
+        return None
+
+    def _start_worker(self, shape: Tuple[int, int, int]):
+        """Aloca o anel de quadros e inicia o processo de inferência"""
+        frame_bytes = int(np.prod(shape))
+        self._frames_shm = shared_memory.SharedMemory(create=True, size=frame_bytes * self.slots)
+        self._control_shm = shared_memory.SharedMemory(create=True, size=_control_size(self.slots))
+        self._control_shm.buf[:] = bytes(self._control_shm.size)
+        self._ring = np.ndarray((self.slots,) + tuple(shape), dtype=np.uint8, buffer=self._frames_shm.buf)
+
+        ctx = mproc.get_context("spawn")
+        self._frame_ready = ctx.Event()
+        self._stop_event = ctx.Event()
+        self._process = ctx.Process(
+            target=_inference_worker,
+            args=(self._frames_shm.name, self._control_shm.name, shape, self.slots,
+                  self._frame_ready, self._stop_event, self.settings.model_selection),
+            daemon=True
+        )
+        self._process.start()
+
+    def _stop_worker(self):
+        if self._process:
+            self._stop_event.set()
+            self._frame_ready.set()
+            self._process.join(timeout=2)
+            if self._process.is_alive():
+                self._process.terminate()
+            self._process = None
+
+        self._ring = None
+        for shm in (self._frames_shm, self._control_shm):
+            if shm:
+                shm.close()
+                shm.unlink()
+        self._frames_shm = None
+        self._control_shm = None
+
+    def stop(self):
+        super().stop()
+        self._stop_worker()
+
+    def _update_loop(self):
+        while self.running:
+            try:
+                ret, frame = self.cap.read()
+                if not ret:
+                    continue
+
+                frame = cv2.flip(frame, 1)
+                # Reduzido antes do anel: a cópia para a memória compartilhada também fica menor
+                if self.settings.input_size:
+                    frame = cv2.resize(frame, self.settings.input_size, interpolation=cv2.INTER_AREA)
+                if self._process is None:
+                    self._start_worker(frame.shape)
+                elif not self._process.is_alive():
+                    raise RuntimeError("processo de inferência encerrado")
+
+                if self._needs_detection(frame):
+                    self._submit_frame(frame)
+                faces = self._poll_result()
+                if faces is not None:
+                    self._dispatch(faces)
+            except Exception as e:
+                print(f"Erro na captura de vídeo: {e}")
+                self.running = False
+                break
+
+    def _submit_frame(self, frame):
+        """Copia o quadro para o próximo slot do anel e sinaliza o processo de inferência"""
+        self._frame_seq += 1
+        slot = self._frame_seq % self.slots
+        control = self._control_shm.buf
+
+        # Invalida o slot antes de sobrescrevê-lo
+        _HEADER.pack_into(control, _HEADER.size * slot, 0)
+        np.copyto(self._ring[slot], frame)
+        _HEADER.pack_into(control, _HEADER.size * slot, self._frame_seq)
+        _HEADER.pack_into(control, _HEADER.size * self.slots, self._frame_seq)
+        self._frame_ready.set()
+
+    def _poll_result(self) -> Optional[List[Tuple[float, float]]]:
+        """Lê os rostos do resultado mais recente da estrutura compartilhada, se houver um novo"""
+        control = self._control_shm.buf
+        offset = _result_offset(self.slots)
+        for _ in range(3):
+            seq, _frame_seq, found, *centers = _RESULT.unpack_from(control, offset)
+            if seq & 1:
+                continue
+            if _HEADER.unpack_from(control, offset)[0] != seq:
+                continue
+            if seq == self._last_result_seq:
+                return None
+            self._last_result_seq = seq
+            return [(centers[2 * i], centers[2 * i + 1]) for i in range(found)]
+        return None
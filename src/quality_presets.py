@@ -0,0 +1,140 @@
+import json
+import os
+import time
+from typing import Dict, NamedTuple, Optional
+import pygame
+from .config import Config
+
+
+class QualityPreset(NamedTuple):
+    """Parâmetros de desempenho que variam conforme o hardware"""
+    name: str
+    mixer_buffer: int        # amostras; buffers menores reduzem a latência do áudio
+    camera_size: tuple       # resolução de captura da webcam
+    camera_fps: int
+    model_selection: int     # 0 = modelo curto do MediaPipe (rápido), 1 = alcance completo
+    smooth_scaling: bool     # smoothscale (filtrado) ou scale (vizinho mais próximo)
+    fps: int                 # quadros desenhados por segundo; deve dividir SIMULATION_RATE
+
+
+PRESETS: Dict[str, QualityPreset] = {
+    'low': QualityPreset('low', 1024, (320, 240), 15, 0, False, 30),
+    'medium': QualityPreset('medium', 512, (640, 480), 15, 0, True, 60),
+    'high': QualityPreset('high', 512, (640, 480), 30, 1, True, 60),
+    'ultra': QualityPreset('ultra', 256, (1280, 720), 30, 1, True, 60),
+}
+
+# Pontuação mínima do micro-benchmark (iterações por segundo) para cada preset
+_SCORE_THRESHOLDS = (('ultra', 5000), ('high', 2500), ('medium', 1200), ('low', 0))
+
+
+class QualitySettings:
+    """
+    Escolhe o preset de qualidade: manual (``Config.QUALITY_PRESET`` ou ``--quality``),
+    o salvo em disco ou o indicado por um micro-benchmark de um segundo no primeiro uso.
+    O benchmark não atrasa a primeira tela: o jogo começa com um preset conservador e
+    ``measure`` é chamado depois do primeiro quadro, com o menu parado na tela.
+    """
+    _current: QualityPreset = PRESETS['high']
+    _pending = False
+
+    @staticmethod
+    def current() -> QualityPreset:
+        return QualitySettings._current
+
+    @staticmethod
+    def benchmark(duration: float = 1.0) -> float:
+        """
+        Mede quantas vezes por segundo a máquina executa uma amostra do trabalho de
+        um quadro: redimensionar, rotacionar e compor superfícies e um pouco de física.
+        """
+        sprite = pygame.Surface((64, 64), pygame.SRCALPHA)
+        sprite.fill((200, 200, 200, 255))
+        canvas = pygame.Surface((400, 300))
+        iterations = 0
+        start = time.perf_counter()
+        deadline = start + duration
+        while time.perf_counter() < deadline:
+            scaled = pygame.transform.smoothscale(sprite, (96, 96))
+            rotated = pygame.transform.rotate(scaled, iterations % 360)
+            canvas.blit(rotated, (iterations % 300, iterations % 200))
+            x, y = 0.0, 0.0
+            for step in range(50):
+                x, y = (x + step * 0.5) % 400, (y + step * 0.25) % 300
+            iterations += 1
+        return iterations / (time.perf_counter() - start)
+
+    @staticmethod
+    def preset_for_score(score: float) -> QualityPreset:
+        for name, minimum in _SCORE_THRESHOLDS:
+            if score >= minimum:
+                return PRESETS[name]
+        return PRESETS['low']
+
+    @staticmethod
+    def _load() -> Optional[dict]:
+        try:
+            with open(Config.QUALITY_FILE, encoding="utf-8") as f:
+                data = json.load(f)
+            return data if data.get("preset") in PRESETS else None
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, AttributeError) as e:
+            print(f"Configuração de qualidade inválida: {e}")
+            return None
+
+    @staticmethod
+    def _save(data: dict):
+        try:
+            os.makedirs(os.path.dirname(Config.QUALITY_FILE), exist_ok=True)
+            tmp_path = Config.QUALITY_FILE + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp_path, Config.QUALITY_FILE)
+        except OSError as e:
+            print(f"Erro ao salvar a configuração de qualidade: {e}")
+
+    @staticmethod
+    def select(override: Optional[str] = None) -> QualityPreset:
+        """
+        Define o preset atual. ``override`` (da linha de comando) pode ser um nome de
+        preset, salvo como escolha manual, ou "auto", que descarta a escolha salva e
+        mede novamente. ``Config.QUALITY_PRESET`` fixa o preset sem salvá-lo.
+        """
+        if override is None and Config.QUALITY_PRESET in PRESETS:
+            QualitySettings._current = PRESETS[Config.QUALITY_PRESET]
+            return QualitySettings._current
+
+        stored = None if override == "auto" else QualitySettings._load()
+        if override in PRESETS:
+            preset = PRESETS[override]
+            QualitySettings._save({"preset": preset.name, "manual": True,
+                                   "score": stored.get("score") if stored else None})
+        elif stored:
+            preset = PRESETS[stored["preset"]]
+        else:
+            preset = PRESETS[Config.QUALITY_PROVISIONAL_PRESET]
+            QualitySettings._pending = True
+
+        QualitySettings._current = preset
+        return preset
+
+    @staticmethod
+    def benchmark_pending() -> bool:
+        """Indica que ``select`` usou o preset provisório e a medição ainda não foi feita"""
+        return QualitySettings._pending
+
+    @staticmethod
+    def measure() -> QualityPreset:
+        """
+        Executa o benchmark, salva e aplica o preset indicado. Chamado na thread
+        principal depois que o menu aparece, sem nada desenhando ou simulando ao mesmo
+        tempo, para que a medição reflita a máquina e não a disputa com o jogo.
+        """
+        score = QualitySettings.benchmark()
+        preset = QualitySettings.preset_for_score(score)
+        QualitySettings._save({"preset": preset.name, "manual": False, "score": round(score)})
+        QualitySettings._current = preset
+        QualitySettings._pending = False
+        print(f"Qualidade escolhida automaticamente: {preset.name} ({score:.0f} iterações/s)")
+        return preset
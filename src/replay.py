@@ -0,0 +1,111 @@
+import os
+import struct
+import time
+from typing import List, NamedTuple, Optional, Tuple
+from .config import Config
+
+_MAGIC = b"GAGR"
+_VERSION = 1
+_HEADER = struct.Struct("<4sBBxxI")   # magic, versão, ticks por segundo, quantidade de quadros
+_NAME = struct.Struct("<B")
+# bola (canto superior esquerdo, ângulo), jogadores (canto superior esquerdo), placar, tempo restante
+_FRAME = struct.Struct("<hhfhhhhBBh")
+
+
+class ReplayFrame(NamedTuple):
+    """Estado visível da partida em um tick"""
+    ball_x: int
+    ball_y: int
+    ball_angle: float
+    player1_x: int
+    player1_y: int
+    player2_x: int
+    player2_y: int
+    player1_score: int
+    player2_score: int
+    time_remaining: int
+
+
+class Replay:
+    """
+    Gravação de uma partida: um registro de tamanho fixo por tick com tudo o que é
+    desenhado. Qualquer trecho pode ser renderizado sem ressimular a partida.
+    """
+
+    def __init__(self, player_names: Tuple[str, str] = ("", ""), tick_rate: int = Config.SIMULATION_RATE,
+                 frames: bytes = b""):
+        self.player_names = player_names
+        self.tick_rate = tick_rate
+        self._frames = bytearray(frames)
+
+    def __len__(self) -> int:
+        return len(self._frames) // _FRAME.size
+
+    @property
+    def duration(self) -> float:
+        return len(self) / self.tick_rate
+
+    def record(self, state, ball, paddles, tick: Optional[int] = None):
+        """
+        Grava o estado de um tick no fim do replay, ou sobrescreve ``tick`` se ele já
+        foi gravado (ticks ressimulados pelo rollback no modo online).
+        """
+        frame = _FRAME.pack(
+            ball.rect.x, ball.rect.y, ball.angle % 360,
+            paddles[0].rect.x, paddles[0].rect.y, paddles[1].rect.x, paddles[1].rect.y,
+            min(state.player1_score, 255), min(state.player2_score, 255), max(0, state.time_remaining),
+        )
+        if tick is not None and tick < len(self):
+            self._frames[tick * _FRAME.size:(tick + 1) * _FRAME.size] = frame
+        else:
+            self._frames += frame
+
+    def truncate(self, count: int):
+        """Descarta os quadros a partir de ``count``"""
+        del self._frames[count * _FRAME.size:]
+
+    def frame(self, index: int) -> ReplayFrame:
+        return ReplayFrame(*_FRAME.unpack_from(self._frames, index * _FRAME.size))
+
+    def to_bytes(self) -> bytes:
+        names = b"".join(
+            _NAME.pack(len(encoded)) + encoded
+            for encoded in (name.encode("utf-8")[:255] for name in self.player_names)
+        )
+        return _HEADER.pack(_MAGIC, _VERSION, self.tick_rate, len(self)) + names + bytes(self._frames)
+
+    @staticmethod
+    def from_bytes(data: bytes) -> "Replay":
+        magic, version, tick_rate, count = _HEADER.unpack_from(data)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("replay inválido ou de outra versão")
+        offset = _HEADER.size
+        names: List[str] = []
+        for _ in range(2):
+            (length,) = _NAME.unpack_from(data, offset)
+            offset += _NAME.size
+            names.append(data[offset:offset + length].decode("utf-8"))
+            offset += length
+        frames = data[offset:offset + count * _FRAME.size]
+        if len(frames) != count * _FRAME.size:
+            raise ValueError("replay truncado")
+        return Replay((names[0], names[1]), tick_rate, frames)
+
+    def save(self, directory: str = Config.REPLAY_DIR) -> Optional[str]:
+        """Grava o replay (de forma atômica) e retorna o caminho do arquivo"""
+        try:
+            os.makedirs(directory, exist_ok=True)
+            path = os.path.join(directory, time.strftime("partida-%Y%m%d-%H%M%S.replay"))
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(self.to_bytes())
+            os.replace(tmp_path, path)
+            return path
+        except OSError as e:
+            print(f"Erro ao salvar o replay: {e}")
+            return None
+
+    @staticmethod
+    def load(path: str) -> "Replay":
+        with open(path, "rb") as f:
+            return Replay.from_bytes(f.read())
@@ -0,0 +1,207 @@
+"""
+Exporta um replay gravado para vídeo MP4, sem janela e sem placa de vídeo.
+
+Cada quadro é desenhado pelo mesmo código do jogo (``UIManager`` e ``Ball.draw``)
+em uma janela virtual do SDL (driver "dummy") e codificado com o OpenCV. O replay é
+dividido em trechos de tempo consecutivos, renderizados e codificados em paralelo por
+processos separados; ao final o ffmpeg concatena os trechos sem recodificar. Com mais
+de um processo o ``ffmpeg`` precisa estar no PATH; ``--workers 1`` grava o vídeo
+direto, sem ele.
+
+    python -m src.replay_video partida.replay [--output video.mp4] [--fps 30]
+                               [--scale 1.0] [--workers N]
+"""
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Sequence, Tuple
+from .config import Config
+from .replay import Replay, ReplayFrame
+
+_FOURCC = "mp4v"
+
+# Estado de cada processo de renderização (criado uma vez em _init_worker)
+_replay: Optional[Replay] = None
+_renderer: Optional["ReplayRenderer"] = None
+
+
+class ReplayRenderer:
+    """Desenha quadros do replay com os mesmos elementos da tela de jogo"""
+
+    def __init__(self, replay: Replay, scale: float = 1.0):
+        import numpy as np
+        import pygame
+        from .ball import Ball
+        from .game import Game
+        from .game_state import GameState
+        from .ui_manager import UIManager
+
+        self._np = np
+        self._pygame = pygame
+        self._cv2 = _import_cv2()
+        self.surface = pygame.display.set_mode((Config.WIDTH, Config.HEIGHT))
+        self.state = GameState()
+        self.state.player1_name, self.state.player2_name = replay.player_names
+        self.state.menu_active = False
+        self.state.game_started = True
+        self.ui = UIManager(self.state, None)
+        self.ball = Ball()
+        self.paddles = Game.create_paddles(self.ball)
+        self.size = ReplayRenderer.video_size(scale)
+
+    @staticmethod
+    def video_size(scale: float) -> Tuple[int, int]:
+        # Os codificadores exigem dimensões pares
+        return (max(2, int(Config.WIDTH * scale) // 2 * 2), max(2, int(Config.HEIGHT * scale) // 2 * 2))
+
+    def render(self, frame: ReplayFrame):
+        """Retorna o quadro como array BGR pronto para o ``VideoWriter``"""
+        state, ball = self.state, self.ball
+        state.player1_score, state.player2_score = frame.player1_score, frame.player2_score
+        state.time_remaining = frame.time_remaining
+        ball.rect.topleft = (frame.ball_x, frame.ball_y)
+        ball.angle = frame.ball_angle
+        self.paddles[0].rect.topleft = (frame.player1_x, frame.player1_y)
+        self.paddles[1].rect.topleft = (frame.player2_x, frame.player2_y)
+
+        surface = self.surface
+        surface.fill(Config.BLACK)
+        self.ui.draw_field(surface)
+        for paddle in self.paddles:
+            surface.blit(paddle.image, paddle.rect)
+        ball.draw(surface)
+        self.ui.draw_scoreboard(surface)
+
+        rgb = self._np.frombuffer(self._pygame.image.tobytes(surface, "RGB"), dtype=self._np.uint8)
+        bgr = self._cv2.cvtColor(rgb.reshape(Config.HEIGHT, Config.WIDTH, 3), self._cv2.COLOR_RGB2BGR)
+        if self.size != (Config.WIDTH, Config.HEIGHT):
+            bgr = self._cv2.resize(bgr, self.size, interpolation=self._cv2.INTER_AREA)
+        return bgr
+
+
+def _import_cv2():
+    import cv2
+    return cv2
+
+
+def _init_worker(replay_path: str, scale: float):
+    """Prepara o SDL sem janela e sem áudio e carrega os recursos uma vez por processo"""
+    global _renderer, _replay
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    import pygame
+    pygame.init()
+    _replay = Replay.load(replay_path)
+    _renderer = ReplayRenderer(_replay, scale)
+
+
+def render_segment(indices: Sequence[int], output_path: str, fps: float) -> int:
+    """Renderiza os ticks ``indices`` do replay em ``output_path``; retorna os quadros gravados"""
+    cv2 = _import_cv2()
+    writer = cv2.VideoWriter(output_path, cv2.VideoWriter_fourcc(*_FOURCC), fps, _renderer.size)
+    if not writer.isOpened():
+        raise RuntimeError(f"não foi possível criar {output_path}")
+    try:
+        for index in indices:
+            writer.write(_renderer.render(_replay.frame(index)))
+    finally:
+        writer.release()
+    return len(indices)
+
+
+def _render_segment_task(args) -> int:
+    return render_segment(*args)
+
+
+def split_segments(frame_indices: Sequence[int], count: int) -> List[Sequence[int]]:
+    """Divide os quadros em ``count`` trechos consecutivos de tamanho quase igual"""
+    count = max(1, min(count, len(frame_indices)))
+    size, extra = divmod(len(frame_indices), count)
+    segments, start = [], 0
+    for i in range(count):
+        end = start + size + (1 if i < extra else 0)
+        segments.append(frame_indices[start:end])
+        start = end
+    return segments
+
+
+def concatenate(ffmpeg: str, segment_paths: Sequence[str], output_path: str):
+    """Junta os trechos na ordem copiando os pacotes já codificados (sem perda nem recodificação)"""
+    list_path = output_path + ".txt"
+    with open(list_path, "w", encoding="utf-8") as f:
+        for path in segment_paths:
+            f.write("file '{}'\n".format(os.path.abspath(path).replace("'", "'\\''")))
+    try:
+        subprocess.run([ffmpeg, "-y", "-loglevel", "error", "-f", "concat", "-safe", "0",
+                        "-i", list_path, "-c", "copy", output_path], check=True)
+    finally:
+        os.remove(list_path)
+
+
+def render_replay(replay_path: str, output_path: str, fps: float = Config.REPLAY_VIDEO_FPS,
+                  scale: float = 1.0, workers: Optional[int] = None) -> int:
+    """
+    Renderiza o replay inteiro em ``output_path`` usando ``workers`` processos.
+    Retorna a quantidade de quadros do vídeo.
+    """
+    replay = Replay.load(replay_path)
+    stride = max(1, round(replay.tick_rate / fps))
+    fps = replay.tick_rate / stride
+    frame_indices = range(0, len(replay), stride)
+    if not frame_indices:
+        raise ValueError("replay vazio")
+
+    workers = workers or os.cpu_count() or 1
+    segments = split_segments(frame_indices, workers)
+
+    if len(segments) == 1:
+        _init_worker(replay_path, scale)
+        return render_segment(segments[0], output_path, fps)
+
+    # Verificado antes de renderizar: reencodar os trechos em série anularia o paralelismo
+    ffmpeg = shutil.which("ffmpeg")
+    if not ffmpeg:
+        raise RuntimeError("o ffmpeg não foi encontrado no PATH; instale-o para renderizar em "
+                           "paralelo ou use --workers 1")
+
+    # "spawn": cada processo inicia o SDL do zero, sem herdar o estado do pai
+    context = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory(prefix="replay-", dir=os.path.dirname(os.path.abspath(output_path))) as tmp:
+        paths = [os.path.join(tmp, f"trecho-{i:03d}.mp4") for i in range(len(segments))]
+        with ProcessPoolExecutor(len(segments), mp_context=context,
+                                 initializer=_init_worker, initargs=(replay_path, scale)) as pool:
+            total = sum(pool.map(_render_segment_task, [(segment, path, fps) for segment, path in zip(segments, paths)]))
+        concatenate(ffmpeg, paths, output_path)
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("replay")
+    parser.add_argument("--output", help="arquivo de saída (padrão: o nome do replay com .mp4)")
+    parser.add_argument("--fps", type=float, default=Config.REPLAY_VIDEO_FPS)
+    parser.add_argument("--scale", type=float, default=1.0, help="escala da resolução do vídeo")
+    parser.add_argument("--workers", type=int, default=None, help="processos de renderização (padrão: núcleos)")
+    args = parser.parse_args()
+
+    output = args.output or os.path.splitext(args.replay)[0] + ".mp4"
+    started = time.perf_counter()
+    try:
+        frames = render_replay(args.replay, output, args.fps, args.scale, args.workers)
+    except (RuntimeError, ValueError, subprocess.CalledProcessError) as e:
+        print(f"Erro ao renderizar o replay: {e}")
+        sys.exit(1)
+    elapsed = time.perf_counter() - started
+    duration = Replay.load(args.replay).duration
+    print(f"{output}: {frames} quadros em {elapsed:.1f} s ({duration / elapsed:.1f}x o tempo real)")
+
+
+if __name__ == "__main__":
+    main()
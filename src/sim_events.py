@@ -0,0 +1,59 @@
+from typing import Callable, List
+from .config import Config
+
+# Tipos de evento emitidos pela física
+WALL_BOUNCE = 0
+PADDLE_HIT = 1
+GOAL = 2
+
+
+class EventBus:
+    """
+    Eventos de um tick da simulação em um buffer pré-alocado (colunas paralelas).
+    A física apenas grava os campos; depois do passo, ``dispatch`` entrega o buffer
+    inteiro a cada assinante (som, estatísticas, rede...) e o reaproveita no tick
+    seguinte. Simulações sem interface simplesmente não passam um barramento.
+    """
+    __slots__ = ("capacity", "count", "dropped", "kinds", "players", "speeds", "exit_speeds", "xs", "ys", "_subscribers")
+
+    def __init__(self, capacity: int = Config.SIM_EVENT_CAPACITY):
+        self.capacity = capacity
+        self.count = 0
+        self.dropped = 0
+        self.kinds = [0] * capacity
+        self.players = [-1] * capacity   # índice do jogador (-1 para paredes)
+        self.speeds = [0.0] * capacity   # velocidade da bola antes do impacto
+        self.exit_speeds = [0.0] * capacity  # velocidade da bola logo depois do toque (chute)
+        self.xs = [0] * capacity         # posição da bola no evento
+        self.ys = [0] * capacity
+        self._subscribers: List[Callable[["EventBus"], None]] = []
+
+    def subscribe(self, callback: Callable[["EventBus"], None]):
+        if callback not in self._subscribers:
+            self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[["EventBus"], None]):
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    def emit(self, kind: int, speed: float = 0.0, player: int = -1, x: int = 0, y: int = 0,
+             exit_speed: float = 0.0):
+        i = self.count
+        if i == self.capacity:
+            self.dropped += 1
+            return
+        self.kinds[i] = kind
+        self.players[i] = player
+        self.speeds[i] = speed
+        self.exit_speeds[i] = exit_speed
+        self.xs[i] = x
+        self.ys[i] = y
+        self.count = i + 1
+
+    def dispatch(self):
+        """Entrega os eventos do tick aos assinantes, em uma única passada, e esvazia o buffer"""
+        if not self.count:
+            return
+        for callback in self._subscribers:
+            callback(self)
+        self.count = 0
@@ -1,31 +1,67 @@
+import os
 import pygame
+from typing import Dict, List, NamedTuple, Optional, Tuple
 from .asset_loader import AssetLoader
+from .config import Config
+from .quality_presets import QualitySettings
+from .sim_events import EventBus, GOAL, PADDLE_HIT
+
+
+class SoundSpec(NamedTuple):
+    """Regras de agendamento de um som"""
+    priority: int          # maior prioridade pode roubar a voz de sons menores
+    min_interval_ms: int   # intervalo mínimo entre dois disparos do mesmo som
+    max_voices: int        # vozes simultâneas permitidas para o mesmo som
+    gain: float            # volume do canal (multiplicado pelo volume geral)
+
 
 class SoundManager:
+    SPECS: Dict[str, SoundSpec] = {
+        'goal': SoundSpec(priority=3, min_interval_ms=500, max_voices=1, gain=1.0),
+        'start': SoundSpec(priority=2, min_interval_ms=100, max_voices=1, gain=1.0),
+        'click': SoundSpec(priority=2, min_interval_ms=50, max_voices=1, gain=1.0),
+        'collision': SoundSpec(priority=1, min_interval_ms=60, max_voices=2, gain=0.8),
+        'hover': SoundSpec(priority=0, min_interval_ms=40, max_voices=1, gain=1.0),
+    }
+
+    # Variações do som de colisão: altura base por superfície e, por faixa de velocidade
+    # de impacto (relativa a BALL_SPEED), o limite superior, a altura e o ganho
+    COLLISION_PATH = "assets/sons/collision.wav"
+    COLLISION_SURFACES = {'paddle': 0.85, 'wall': 1.1}
+    COLLISION_SPEED_LEVELS = ((0.8, 0.9, 0.3), (1.2, 1.0, 0.5), (1.8, 1.1, 0.7), (float("inf"), 1.2, 0.9))
+
     def __init__(self):
-        # Inicializar o mixer com um buffer menor para reduzir o atraso
-        pygame.mixer.pre_init(frequency=44100, size=-16, channels=2, buffer=256)
+        # O tamanho do buffer do mixer vem do preset de qualidade
+        pygame.mixer.pre_init(frequency=44100, size=-16, channels=2, buffer=QualitySettings.current().mixer_buffer,
+                              allowedchanges=0)
         pygame.init()
-        
-        # Configurar canais dedicados
-        pygame.mixer.set_num_channels(4)
-        self.channel_start = pygame.mixer.Channel(0)
-        self.channel_effects = pygame.mixer.Channel(1)
-        self.channel_goal = pygame.mixer.Channel(2)
-        self.background_channel = pygame.mixer.Channel(3)
+
+        # A música é transmitida por pygame.mixer.music; os canais formam o conjunto de vozes
+        pygame.mixer.set_num_channels(Config.AUDIO_VOICES)
+        self.voices: List[pygame.mixer.Channel] = [
+            pygame.mixer.Channel(i) for i in range(Config.AUDIO_VOICES)
+        ]
+        self._voice_sound: List[Optional[str]] = [None] * len(self.voices)
         self.is_muted = False
+        self.volume = 1.0
+
+        # Eventos pendentes do quadro atual (um por som, já agrupados)
+        self._pending: Dict[str, int] = {}
+        self._pending_collision: Optional[Tuple[float, Tuple[str, int]]] = None
+        self._last_played: Dict[str, int] = {name: -10 ** 9 for name in self.SPECS}
+        self._dispatch_order = sorted(self.SPECS, key=lambda name: self.SPECS[name].priority, reverse=True)
+
+        # Playlists de música de fundo (menu e partida)
+        self.music_context: Optional[str] = None
+        self._playlist: List[str] = []
+        self._track_index = 0
+        self._music_switching = False
 
         # Carregar todos os sons
         self._load_sounds()
 
-        # Configurar prioridades
-        self.channel_start.set_volume(1.0)
-        self.channel_effects.set_volume(0.8)
-        self.channel_goal.set_volume(1.0)
-        self.background_channel.set_volume(0.3)
-        
-        # Iniciar som de fundo
-        self.background_channel.play(self.background_sound, loops=-1)
+        # Iniciar música de fundo
+        self.set_music('menu')
 
     def toggle_mute(self):
         """
@@ -36,12 +72,13 @@ class SoundManager:
 
     def set_volume(self, volume: float):
         """
-        Define o volume dos canais de som.
+        Define o volume geral dos canais de som.
         """
-        self.channel_start.set_volume(volume)
-        self.channel_effects.set_volume(volume * 0.8)
-        self.channel_goal.set_volume(volume)
-        self.background_channel.set_volume(volume * 0.3)
+        self.volume = volume
+        for channel, name in zip(self.voices, self._voice_sound):
+            if name and channel.get_busy():
+                channel.set_volume(volume * self.SPECS[name].gain)
+        pygame.mixer.music.set_volume(volume * Config.MUSIC_VOLUME)
 
     def _load_sounds(self):
         """
@@ -49,12 +86,11 @@ class SoundManager:
         """
         try:
             # Carregar sons
-            self.goal_sound = pygame.mixer.Sound(AssetLoader.resource_path("assets/sons/goal.wav"))
-            self.collision_sound = pygame.mixer.Sound(AssetLoader.resource_path("assets/sons/collision.wav"))
-            self.button_click_sound = pygame.mixer.Sound(AssetLoader.resource_path("assets/sons/button_click.wav"))
-            self.button_hover_sound = pygame.mixer.Sound(AssetLoader.resource_path("assets/sons/button_hover.wav"))
-            self.start_sound = pygame.mixer.Sound(AssetLoader.resource_path("assets/sons/start.wav"))
-            self.background_sound = pygame.mixer.Sound(AssetLoader.resource_path("assets/sons/background.wav"))
+            self.goal_sound = AssetLoader.load_sound("assets/sons/goal.wav")
+            self.collision_sound = AssetLoader.load_sound(self.COLLISION_PATH)
+            self.button_click_sound = AssetLoader.load_sound("assets/sons/button_click.wav")
+            self.button_hover_sound = AssetLoader.load_sound("assets/sons/button_hover.wav")
+            self.start_sound = AssetLoader.load_sound("assets/sons/start.wav")
 
             # Configurar volumes
             self.start_sound.set_volume(0.2)
@@ -62,45 +98,239 @@ class SoundManager:
             self.button_click_sound.set_volume(0.7)
             self.goal_sound.set_volume(1.0)
             self.collision_sound.set_volume(0.5)
-            self.background_sound.set_volume(0.3)
-            
+
         except Exception as e:
             print(f"Erro ao carregar sons: {e}")
             raise SystemExit
 
+        self.sounds = {
+            'goal': self.goal_sound,
+            'collision': self.collision_sound,
+            'click': self.button_click_sound,
+            'hover': self.button_hover_sound,
+            'start': self.start_sound,
+        }
+
+        # Variações de colisão (normalmente já geradas durante a tela de carregamento)
+        self.collision_bank = SoundManager.load_collision_bank()
+
         # Pré-aquecer os buffers
-        self.start_sound.play().stop()
-        self.button_hover_sound.play().stop()
-        self.button_click_sound.play().stop()
-        self.goal_sound.play().stop()
-        self.collision_sound.play().stop()
+        for sound in list(self.sounds.values()) + list(self.collision_bank.values()):
+            sound.play().stop()
+
+    @staticmethod
+    def load_collision_bank() -> Dict[Tuple[str, int], pygame.mixer.Sound]:
+        """
+        Retorna o banco de variações do som de colisão, gerado uma única vez.
+        """
+        return AssetLoader.get_or_build("collision_bank", SoundManager._build_collision_bank)
+
+    @staticmethod
+    def _build_collision_bank() -> Dict[Tuple[str, int], pygame.mixer.Sound]:
+        """
+        Gera, com ``pygame.sndarray`` e NumPy, uma cópia do som de colisão com a altura
+        alterada (por reamostragem) para cada superfície e faixa de velocidade.
+        O ganho de cada variação é definido no próprio ``Sound``.
+        """
+        try:
+            import numpy as np
+            import pygame.sndarray
+            samples = pygame.sndarray.array(AssetLoader.load_sound(SoundManager.COLLISION_PATH))
+        except (ImportError, pygame.error) as e:
+            print(f"Variações do som de colisão indisponíveis: {e}")
+            return {}
+
+        frames = samples.shape[0]
+        source = np.arange(frames)
+        bank = {}
+        for surface, surface_pitch in SoundManager.COLLISION_SURFACES.items():
+            for level, (_, pitch, gain) in enumerate(SoundManager.COLLISION_SPEED_LEVELS):
+                positions = np.arange(0, frames - 1, surface_pitch * pitch)
+                if samples.ndim == 1:
+                    shifted = np.interp(positions, source, samples)
+                else:
+                    shifted = np.stack([np.interp(positions, source, samples[:, c])
+                                        for c in range(samples.shape[1])], axis=1)
+                sound = pygame.sndarray.make_sound(np.ascontiguousarray(shifted.astype(samples.dtype)))
+                sound.set_volume(gain)
+                bank[(surface, level)] = sound
+        return bank
+
+    @staticmethod
+    def _resolve_track(base_path: str) -> Optional[str]:
+        """
+        Retorna o arquivo da faixa, preferindo OGG (comprimido) a WAV.
+        """
+        for extension in (".ogg", ".wav"):
+            path = AssetLoader.resource_path(base_path + extension)
+            if os.path.exists(path):
+                return path
+        return None
+
+    def set_music(self, context: str):
+        """
+        Troca a playlist de fundo ('menu' ou 'match'). O ``pygame.mixer.music`` tem um só
+        stream, então não há crossfade: a faixa atual sai em fade e a próxima entra em fade,
+        cada um com ``MUSIC_FADE_MS``. Chamadas repetidas com o mesmo contexto não fazem nada.
+        """
+        if context == self.music_context:
+            return
+        self.music_context = context
+        playlist = [
+            path for path in map(self._resolve_track, Config.MUSIC_PLAYLISTS.get(context, [])) if path
+        ]
+        if playlist == self._playlist and pygame.mixer.music.get_busy():
+            return
+        self._playlist = playlist
+        if not self._playlist:
+            print(f"Nenhuma música encontrada para '{context}'")
+        self._track_index = 0
+
+        if pygame.mixer.music.get_busy():
+            pygame.mixer.music.fadeout(Config.MUSIC_FADE_MS)
+            self._music_switching = True
+        else:
+            self._play_current_track()
+
+    def _play_current_track(self):
+        """
+        Transmite a faixa atual da playlist a partir do disco, sem decodificá-la inteira.
+        """
+        self._music_switching = False
+        if not self._playlist:
+            pygame.mixer.music.stop()
+            return
+        path = self._playlist[self._track_index % len(self._playlist)]
+        try:
+            pygame.mixer.music.load(path)
+            pygame.mixer.music.set_volume(self.volume * Config.MUSIC_VOLUME)
+            # Com uma única faixa, o próprio mixer repete sem interrupção
+            loops = -1 if len(self._playlist) == 1 else 0
+            pygame.mixer.music.play(loops=loops, fade_ms=Config.MUSIC_FADE_MS)
+        except pygame.error as e:
+            print(f"Erro ao tocar música {path}: {e}")
+            self._playlist.remove(path)
+
+    def _update_music(self):
+        """
+        Avança a playlist quando a faixa termina ou quando o fade de saída acaba.
+        """
+        if pygame.mixer.music.get_busy() or not self._playlist:
+            return
+        if not self._music_switching:
+            self._track_index += 1
+        self._play_current_track()
+
+    def request(self, name: str):
+        """
+        Agenda um som para o próximo despacho. Pedidos repetidos no mesmo quadro
+        são agrupados em um único disparo.
+        """
+        self._pending[name] = self._pending.get(name, 0) + 1
+
+    def update(self):
+        """
+        Despacha os sons pendentes uma vez por quadro, respeitando o intervalo mínimo
+        de cada som e atribuindo vozes por prioridade. O custo é limitado pelo número
+        de sons distintos, não pela quantidade de eventos gerados no quadro.
+        """
+        self._update_music()
+        if not self._pending:
+            return
+
+        now = pygame.time.get_ticks()
+        for name in self._dispatch_order:
+            if name not in self._pending:
+                continue
+            spec = self.SPECS[name]
+            if now - self._last_played[name] < spec.min_interval_ms:
+                continue
+            voice = self._allocate_voice(name, spec)
+            if voice is None:
+                continue
+
+            channel = self.voices[voice]
+            sound = self.sounds[name]
+            if name == 'collision' and self._pending_collision:
+                sound = self.collision_bank.get(self._pending_collision[1], sound)
+            channel.set_volume(self.volume * spec.gain)
+            channel.play(sound)
+            self._voice_sound[voice] = name
+            self._last_played[name] = now
+        self._pending.clear()
+        self._pending_collision = None
+
+    def _allocate_voice(self, name: str, spec: SoundSpec) -> Optional[int]:
+        """
+        Escolhe uma voz livre; se não houver, rouba a de menor prioridade
+        (ou a do próprio som, se ele já atingiu o limite de vozes).
+        """
+        free = None
+        same_sound: List[int] = []
+        victim, victim_priority = None, spec.priority
+        for i, channel in enumerate(self.voices):
+            playing = self._voice_sound[i] if channel.get_busy() else None
+            if playing is None:
+                if free is None:
+                    free = i
+            elif playing == name:
+                same_sound.append(i)
+            elif self.SPECS[playing].priority < victim_priority:
+                victim, victim_priority = i, self.SPECS[playing].priority
+
+        if len(same_sound) >= spec.max_voices:
+            return same_sound[0]
+        if free is not None:
+            return free
+        return victim
+
+    def on_sim_events(self, events: EventBus):
+        """
+        Assinante do barramento da física: converte os eventos do tick em pedidos de som.
+        """
+        kinds, speeds = events.kinds, events.speeds
+        for i in range(events.count):
+            kind = kinds[i]
+            if kind == GOAL:
+                self.request('goal')
+            else:
+                self.play_collision_sound(speeds[i], 'paddle' if kind == PADDLE_HIT else 'wall')
 
     def play_goal_sound(self):
         """
         Reproduz o som de gol.
         """
-        self.channel_goal.play(self.goal_sound)
+        self.request('goal')
 
-    def play_collision_sound(self):
+    def play_collision_sound(self, speed: Optional[float] = None, surface: str = 'wall'):
         """
-        Reproduz o som de colisão.
+        Reproduz o som de colisão. Com a velocidade de impacto, escolhe a variação
+        pré-calculada correspondente; no mesmo quadro prevalece o impacto mais forte.
         """
-        self.channel_effects.play(self.collision_sound, maxtime=0, fade_ms=0)
+        self.request('collision')
+        if speed is None:
+            return
+        ratio = speed / Config.BALL_SPEED
+        level = 0
+        while ratio >= self.COLLISION_SPEED_LEVELS[level][0]:
+            level += 1
+        if self._pending_collision is None or speed > self._pending_collision[0]:
+            self._pending_collision = (speed, (surface, level))
 
     def play_button_click_sound(self):
         """
         Reproduz o som de clique de botão.
         """
-        self.channel_start.play(self.button_click_sound)
+        self.request('click')
 
     def play_button_hover_sound(self):
         """
         Reproduz o som de hover de botão.
         """
-        self.channel_start.play(self.button_hover_sound)
+        self.request('hover')
 
     def play_start_sound(self):
         """
         Reproduz o som de início de jogo.
         """
-        self.channel_start.play(self.start_sound)
\ No newline at end of file
+        self.request('start')
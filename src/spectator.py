@@ -0,0 +1,296 @@
+"""
+Transmissão da partida para espectadores.
+
+O ``SpectatorServer`` roda um laço asyncio em uma thread própria. O loop do jogo
+apenas publica a tupla de estado mais recente; a codificação e o envio acontecem
+na thread do servidor, em ritmo fixo. Cada espectador confirma o último snapshot
+recebido e passa a receber só os campos que mudaram desde então. Espectadores com
+a mesma confirmação compartilham o mesmo pacote codificado.
+
+Para assistir a uma partida:
+
+    python -m src.spectator --connect 127.0.0.1:7790
+"""
+import argparse
+import asyncio
+import socket
+import struct
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, NamedTuple, Optional, Tuple
+from .config import Config
+
+
+class SpectatorSnapshot(NamedTuple):
+    """Estado da partida visível para os espectadores"""
+    ball_x: int
+    ball_y: int
+    player1_x: int
+    player1_y: int
+    player2_x: int
+    player2_y: int
+    player1_score: int
+    player2_score: int
+    time_remaining: int
+    status: int  # 0 = menu, 1 = em jogo, 2 = fim de jogo
+    player1_name: str
+    player2_name: str
+
+
+# Formato de cada campo; None indica texto com prefixo de tamanho
+_FIELD_FORMATS = ["<h"] * 6 + ["<H"] * 3 + ["<B"] + [None] * 2
+_FIELD_STRUCTS = [struct.Struct(fmt) if fmt else None for fmt in _FIELD_FORMATS]
+EMPTY_SNAPSHOT = SpectatorSnapshot(0, 0, 0, 0, 0, 0, 0, 0, 0, 0, "", "")
+
+_MAGIC = b"GAGS"
+_SNAPSHOT = struct.Struct("<4sBIIH")   # magic, tipo, seq, seq base, máscara de campos
+_ACK = struct.Struct("<4sBI")          # magic, tipo, última seq recebida
+_TYPE_SNAPSHOT = 1
+_TYPE_ACK = 2
+
+
+def encode_delta(seq: int, baseline_seq: int, baseline: SpectatorSnapshot, snapshot: SpectatorSnapshot) -> bytes:
+    """Codifica apenas os campos de ``snapshot`` que diferem de ``baseline``"""
+    mask = 0
+    body = []
+    for index, (old, new) in enumerate(zip(baseline, snapshot)):
+        if old == new:
+            continue
+        mask |= 1 << index
+        packer = _FIELD_STRUCTS[index]
+        if packer:
+            body.append(packer.pack(new))
+        else:
+            data = new.encode("utf-8")[:255]
+            body.append(bytes((len(data),)) + data)
+    return _SNAPSHOT.pack(_MAGIC, _TYPE_SNAPSHOT, seq, baseline_seq, mask) + b"".join(body)
+
+
+def decode_delta(packet: bytes, baselines: Dict[int, SpectatorSnapshot]) -> Optional[Tuple[int, SpectatorSnapshot]]:
+    """
+    Reconstrói o snapshot a partir do pacote e do snapshot base já conhecido.
+    Retorna None se o pacote for inválido ou a base não estiver disponível.
+    """
+    if len(packet) < _SNAPSHOT.size:
+        return None
+    magic, kind, seq, baseline_seq, mask = _SNAPSHOT.unpack_from(packet)
+    if magic != _MAGIC or kind != _TYPE_SNAPSHOT:
+        return None
+    baseline = EMPTY_SNAPSHOT if baseline_seq == 0 else baselines.get(baseline_seq)
+    if baseline is None:
+        return None
+
+    values = list(baseline)
+    offset = _SNAPSHOT.size
+    for index, packer in enumerate(_FIELD_STRUCTS):
+        if not mask & (1 << index):
+            continue
+        if packer:
+            values[index] = packer.unpack_from(packet, offset)[0]
+            offset += packer.size
+        else:
+            length = packet[offset]
+            values[index] = packet[offset + 1:offset + 1 + length].decode("utf-8", "replace")
+            offset += 1 + length
+    return seq, SpectatorSnapshot(*values)
+
+
+class _Spectator:
+    __slots__ = ("ack", "last_seen")
+
+    def __init__(self, now: float):
+        self.ack = 0
+        self.last_seen = now
+
+
+class _SpectatorProtocol(asyncio.DatagramProtocol):
+    def __init__(self, server: "SpectatorServer"):
+        self.server = server
+
+    def datagram_received(self, data: bytes, addr):
+        if len(data) != _ACK.size:
+            return
+        magic, kind, seq = _ACK.unpack(data)
+        if magic == _MAGIC and kind == _TYPE_ACK:
+            self.server._acknowledge(addr, seq)
+
+
+class SpectatorServer:
+    """
+    Servidor UDP de espectadores. ``publish`` é a única chamada feita pelo loop do
+    jogo e custa uma atribuição, independente do número de espectadores.
+    """
+
+    def __init__(self, host: str = "0.0.0.0", port: int = Config.SPECTATOR_PORT,
+                 rate: float = Config.SPECTATOR_RATE):
+        self.host = host
+        self.port = port
+        self.interval = 1 / rate
+        self._latest: Optional[SpectatorSnapshot] = None
+        self._history: "OrderedDict[int, SpectatorSnapshot]" = OrderedDict()
+        self._seq = 0
+        self._spectators: Dict[tuple, _Spectator] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stop: Optional[asyncio.Event] = None
+        self._thread: Optional[threading.Thread] = None
+        self._ready = threading.Event()
+        self.packets_sent = 0
+        self.bytes_sent = 0
+
+    @property
+    def spectator_count(self) -> int:
+        return len(self._spectators)
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="spectators", daemon=True)
+        self._thread.start()
+        self._ready.wait(timeout=2)
+
+    def stop(self):
+        if self._loop and self._stop:
+            self._loop.call_soon_threadsafe(self._stop.set)
+        if self._thread:
+            self._thread.join(timeout=2)
+
+    def publish(self, snapshot: SpectatorSnapshot):
+        """Chamado pelo loop do jogo: apenas substitui o snapshot mais recente"""
+        self._latest = snapshot
+
+    def _run(self):
+        try:
+            asyncio.run(self._serve())
+        except OSError as e:
+            print(f"Erro ao iniciar o servidor de espectadores: {e}")
+            self._ready.set()
+
+    async def _serve(self):
+        self._loop = asyncio.get_running_loop()
+        self._stop = asyncio.Event()
+        transport, _ = await self._loop.create_datagram_endpoint(
+            lambda: _SpectatorProtocol(self), local_addr=(self.host, self.port)
+        )
+        self.port = transport.get_extra_info("sockname")[1]
+        print(f"Servidor de espectadores na porta {self.port}")
+        self._ready.set()
+
+        next_tick = self._loop.time()
+        try:
+            while not self._stop.is_set():
+                self._broadcast(transport)
+                next_tick += self.interval
+                try:
+                    await asyncio.wait_for(self._stop.wait(), max(0.0, next_tick - self._loop.time()))
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            transport.close()
+
+    def _acknowledge(self, addr, seq: int):
+        spectator = self._spectators.get(addr)
+        if spectator is None:
+            spectator = self._spectators[addr] = _Spectator(time.perf_counter())
+        spectator.last_seen = time.perf_counter()
+        if seq in self._history and seq > spectator.ack:
+            spectator.ack = seq
+
+    def _broadcast(self, transport):
+        snapshot = self._latest
+        if snapshot is None:
+            return
+        if not self._history or self._history[self._seq] != snapshot:
+            self._seq += 1
+            self._history[self._seq] = snapshot
+            while len(self._history) > Config.SPECTATOR_HISTORY:
+                self._history.popitem(last=False)
+
+        now = time.perf_counter()
+        encoded: Dict[int, bytes] = {}
+        for addr, spectator in list(self._spectators.items()):
+            if now - spectator.last_seen > Config.SPECTATOR_CLIENT_TIMEOUT:
+                del self._spectators[addr]
+                continue
+            # Confirmações antigas demais recebem o estado completo
+            baseline_seq = spectator.ack if spectator.ack in self._history else 0
+            if baseline_seq == self._seq:
+                continue
+            packet = encoded.get(baseline_seq)
+            if packet is None:
+                baseline = self._history[baseline_seq] if baseline_seq else EMPTY_SNAPSHOT
+                packet = encoded[baseline_seq] = encode_delta(self._seq, baseline_seq, baseline, snapshot)
+            transport.sendto(packet, addr)
+            self.packets_sent += 1
+            self.bytes_sent += len(packet)
+
+
+class SpectatorClient:
+    """Cliente UDP não bloqueante que reconstrói a partida a partir dos deltas"""
+
+    def __init__(self, server_addr: Tuple[str, int]):
+        self.server_addr = server_addr
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.setblocking(False)
+        self.states: "OrderedDict[int, SpectatorSnapshot]" = OrderedDict()
+        self.seq = 0
+        self._last_ack = 0.0
+
+    @property
+    def snapshot(self) -> Optional[SpectatorSnapshot]:
+        return self.states.get(self.seq)
+
+    def poll(self) -> Optional[SpectatorSnapshot]:
+        """Processa os pacotes recebidos, confirma o mais recente e retorna o estado atual"""
+        received = False
+        while True:
+            try:
+                packet = self.sock.recv(2048)
+            except (BlockingIOError, ConnectionResetError):
+                break
+            decoded = decode_delta(packet, self.states)
+            if decoded is None or decoded[0] <= self.seq:
+                continue
+            self.seq, state = decoded
+            self.states[self.seq] = state
+            while len(self.states) > Config.SPECTATOR_HISTORY:
+                self.states.popitem(last=False)
+            received = True
+
+        # Confirma a cada snapshot novo e, sem novidades, uma vez por segundo
+        now = time.perf_counter()
+        if received or now - self._last_ack > 1.0:
+            self._last_ack = now
+            try:
+                self.sock.sendto(_ACK.pack(_MAGIC, _TYPE_ACK, self.seq), self.server_addr)
+            except OSError:
+                pass
+        return self.snapshot
+
+    def close(self):
+        self.sock.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--connect", default=f"127.0.0.1:{Config.SPECTATOR_PORT}", help="host:porta do jogo")
+    args = parser.parse_args()
+
+    host, port = args.connect.rsplit(":", 1)
+    client = SpectatorClient((host, int(port)))
+    last_line = None
+    try:
+        while True:
+            snapshot = client.poll()
+            if snapshot:
+                line = (f"{snapshot.player1_name or 'Jogador 1'} {snapshot.player1_score} x "
+                        f"{snapshot.player2_score} {snapshot.player2_name or 'Jogador 2'} "
+                        f"- {snapshot.time_remaining // 60}:{snapshot.time_remaining % 60:02d}")
+                if line != last_line:
+                    print(line)
+                    last_line = line
+            time.sleep(1 / Config.SPECTATOR_RATE)
+    except KeyboardInterrupt:
+        client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Telemetria ao vivo em memória compartilhada.
+
+A cada tick o jogo grava um registro de tamanho fixo em um arquivo mapeado em
+memória, protegido por um seqlock: ferramentas locais (overlays de transmissão,
+painéis, testes) leem o estado sem chamadas de IPC e sem afetar o loop do jogo.
+
+Layout (little-endian):
+    0   cabeçalho  magic "GAGT", versão (u8), 3 bytes livres, tamanho do registro (u32)
+    16  registro   seq (u64, ímpar = escrita em andamento), timestamp (f64, time.time),
+                   bola x, y, vx, vy, jogador 1 x, y, jogador 2 x, y (f32),
+                   placar 1, placar 2 (u16), tempo restante (i16), estado (u8, 0 = menu,
+                   1 = em jogo, 2 = fim de jogo), 1 byte livre, duração do quadro em ms,
+                   idade da última detecção de cada rastreador em ms (f32, -1 = inativo)
+
+Para acompanhar a partida no terminal:
+
+    python -m src.telemetry [--path ARQUIVO]
+"""
+import argparse
+import mmap
+import os
+import struct
+import time
+from typing import NamedTuple, Optional
+from .config import Config
+
+_MAGIC = b"GAGT"
+_VERSION = 1
+_HEADER = struct.Struct("<4sBxxxI")
+_SEQ = struct.Struct("<Q")
+_RECORD = struct.Struct("<Qd8fHHhBx3f")
+_RECORD_OFFSET = 16
+_FILE_SIZE = _RECORD_OFFSET + _RECORD.size
+
+
+class TelemetryRecord(NamedTuple):
+    """Registro publicado a cada tick"""
+    seq: int
+    timestamp: float
+    ball_x: float
+    ball_y: float
+    ball_vx: float
+    ball_vy: float
+    player1_x: float
+    player1_y: float
+    player2_x: float
+    player2_y: float
+    player1_score: int
+    player2_score: int
+    time_remaining: int
+    status: int
+    frame_ms: float
+    tracker1_ms: float
+    tracker2_ms: float
+
+
+class TelemetryWriter:
+    """Publica o registro no arquivo mapeado; cada publicação são três gravações na memória"""
+
+    def __init__(self, path: str = Config.TELEMETRY_PATH):
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._file = open(path, "w+b")
+        self._file.truncate(_FILE_SIZE)
+        self._map = mmap.mmap(self._file.fileno(), _FILE_SIZE)
+        _HEADER.pack_into(self._map, 0, _MAGIC, _VERSION, _RECORD.size)
+        self._seq = 0
+
+    def publish(self, *values):
+        """Grava os campos do registro (sem ``seq``) sob o seqlock"""
+        seq = self._seq + 1
+        # Sequência ímpar antes dos dados: leitores que pegarem a escrita pela metade descartam a leitura
+        _SEQ.pack_into(self._map, _RECORD_OFFSET, seq)
+        _RECORD.pack_into(self._map, _RECORD_OFFSET, seq, *values)
+        self._seq = seq + 1
+        _SEQ.pack_into(self._map, _RECORD_OFFSET, self._seq)
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+
+class TelemetryReader:
+    """Lê o registro mais recente sem bloquear o jogo"""
+
+    def __init__(self, path: str = Config.TELEMETRY_PATH):
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, record_size = _HEADER.unpack_from(self._map)
+        if magic != _MAGIC or version != _VERSION or record_size != _RECORD.size:
+            raise ValueError(f"arquivo de telemetria inválido: {path}")
+
+    def read(self, retries: int = 100) -> Optional[TelemetryRecord]:
+        """Retorna um registro consistente, ou None se nada foi publicado ainda"""
+        for _ in range(retries):
+            values = _RECORD.unpack_from(self._map, _RECORD_OFFSET)
+            seq = values[0]
+            if seq & 1 or _SEQ.unpack_from(self._map, _RECORD_OFFSET)[0] != seq:
+                continue
+            return TelemetryRecord(*values) if seq else None
+        return None
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--path", default=Config.TELEMETRY_PATH)
+    parser.add_argument("--rate", type=float, default=10.0, help="leituras por segundo")
+    args = parser.parse_args()
+
+    reader = TelemetryReader(args.path)
+    try:
+        while True:
+            record = reader.read()
+            if record:
+                print(f"\r#{record.seq // 2:<8} bola ({record.ball_x:4.0f}, {record.ball_y:4.0f}) "
+                      f"placar {record.player1_score} x {record.player2_score}  tempo {record.time_remaining:3d}s  "
+                      f"quadro {record.frame_ms:4.1f} ms  rastreadores {record.tracker1_ms:5.0f} / "
+                      f"{record.tracker2_ms:5.0f} ms", end="", flush=True)
+            time.sleep(1 / args.rate)
+    except KeyboardInterrupt:
+        print()
+    finally:
+        reader.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,10 @@
 import pygame
-import cv2
-from typing import Tuple
+from typing import Optional, Tuple
 from .config import Config
 from .asset_loader import AssetLoader
 from .game_state import GameState
 from .sound_manager import SoundManager
+from .camera_stack import CameraStack
 
 class UIManager:
     def __init__(self, state: GameState, sound_manager: SoundManager):
@@ -16,6 +16,8 @@ class UIManager:
             for size in ['normal', 'small', 'large']
         }
         self.fonts['button'] = AssetLoader.load_font("assets/fonts/PressStart2P-Regular.ttf", 10)
+        # Aviso exibido no rodapé do menu (por exemplo, reiniciar para aplicar a qualidade)
+        self.notice: Optional[str] = None
         self.grass = AssetLoader.load_image("assets/imagens/grass.png",
             (Config.FIELD_WIDTH, Config.FIELD_HEIGHT))
 
@@ -131,9 +133,9 @@ class UIManager:
             surface.blit(text_surf, (x + (Config.BUTTON_WIDTH - 50)//2 - text_surf.get_width()//2,
                                 y + (Config.BUTTON_HEIGHT - 10)//2 - text_surf.get_height()//2))
 
-    def draw_end_game(self, surface: pygame.Surface):
+    def draw_end_game(self, surface: pygame.Surface, stats=None):
         """
-        Desenha a tela de fim de jogo.
+        Desenha a tela de fim de jogo e, se houver, as estatísticas da partida.
         """
         if self.state.player1_score > self.state.player2_score:
             text, color = f"{self.state.player1_name} Venceu!", Config.DARK_GOLD
@@ -142,15 +144,69 @@ class UIManager:
         else:
             text, color = "Empate!", Config.BLUE
 
-        self._draw_text_with_outline(surface, text, color)
+        if not stats or not stats.ticks:
+            self._draw_text_with_outline(surface, text, color)
+            return
 
-    def _draw_text_with_outline(self, surface: pygame.Surface, text: str, color: Tuple[int, int, int]):
+        overlay = pygame.Surface((Config.WIDTH, Config.HEIGHT), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 190))
+        surface.blit(overlay, (0, 0))
+        self._draw_text_with_outline(surface, text, color, center_y=150)
+        self._draw_match_stats(surface, stats)
+
+    def _draw_match_stats(self, surface: pygame.Surface, stats):
+        """
+        Mapas de calor (gerados uma vez por partida) e o resumo numérico.
+        """
+        size = (Config.FIELD_WIDTH * 3 // 10, Config.FIELD_HEIGHT * 3 // 10)
+        gap = (Config.WIDTH - 3 * size[0]) // 4
+        top = 250
+        heatmaps = [
+            ('player1', self.state.player1_name, (80, 160, 255)),
+            ('player2', self.state.player2_name, (255, 90, 90)),
+            ('ball', "Bola", Config.GOLD),
+        ]
+        for i, (name, label, color) in enumerate(heatmaps):
+            x = gap + i * (size[0] + gap)
+            surface.blit(stats.heatmap_surface(name, size, color), (x, top))
+            pygame.draw.rect(surface, Config.WHITE, (x, top, size[0], size[1]), 2)
+            label_surf = self.fonts['small'].render(label, True, Config.WHITE)
+            surface.blit(label_surf, (x + size[0] // 2 - label_surf.get_width() // 2, top + size[1] + 10))
+
+            # Locais dos gols sobre o mapa da bola
+            if name == 'ball':
+                for scorer, goal_x, goal_y in stats.goals:
+                    point = (x + (goal_x - Config.FIELD_OFFSET_X) * size[0] // Config.FIELD_WIDTH,
+                             top + (goal_y - Config.FIELD_OFFSET_Y) * size[1] // Config.FIELD_HEIGHT)
+                    pygame.draw.circle(surface, heatmaps[scorer][2], point, 6)
+                    pygame.draw.circle(surface, Config.WHITE, point, 6, 1)
+
+        possession = stats.possession_share()
+        rows = [
+            ("Posse de bola", f"{possession[0]:.0%}", f"{possession[1]:.0%}"),
+            ("Toques", str(stats.touches[0]), str(stats.touches[1])),
+            ("Chute mais rápido (px/s)", f"{stats.top_shot_speed[0]:.0f}", f"{stats.top_shot_speed[1]:.0f}"),
+        ]
+        y = top + size[1] + 70
+        for label, value1, value2 in rows:
+            label_surf = self.fonts['small'].render(label, True, Config.WHITE)
+            surface.blit(label_surf, (Config.WIDTH // 2 - label_surf.get_width() // 2, y))
+            for value, x in ((value1, Config.WIDTH // 4), (value2, Config.WIDTH * 3 // 4)):
+                value_surf = self.fonts['normal'].render(value, True, Config.GOLD)
+                surface.blit(value_surf, (x - value_surf.get_width() // 2, y - 2))
+            y += 45
+
+        bounces = self.fonts['small'].render(f"Rebotes nas paredes: {stats.wall_bounces}", True, Config.WHITE)
+        surface.blit(bounces, (Config.WIDTH // 2 - bounces.get_width() // 2, y + 10))
+
+    def _draw_text_with_outline(self, surface: pygame.Surface, text: str, color: Tuple[int, int, int],
+                                center_y: int = Config.HEIGHT // 2):
         """
         Desenha texto com contorno.
         """
         text_surf = self.fonts['large'].render(text, True, color)
         outline_surf = self.fonts['large'].render(text, True, Config.BLACK)
-        pos = (Config.WIDTH//2 - text_surf.get_width()//2, Config.HEIGHT//2 - text_surf.get_height()//2)
+        pos = (Config.WIDTH//2 - text_surf.get_width()//2, center_y - text_surf.get_height()//2)
 
         for dx in [-2, 0, 2]:
             for dy in [-2, 0, 2]:
@@ -207,6 +263,13 @@ class UIManager:
         # Botão Mute
         self.mute_rect = self._draw_mute_button(surface, elements_y + spacing * 5)
 
+        if self.notice:
+            notice = self.fonts['button'].render(self.notice, True, Config.WHITE)
+            surface.blit(notice, (
+                Config.WIDTH//2 - notice.get_width()//2,
+                menu_rect.bottom + 10
+            ))
+
     def _draw_mute_button(self, surface, y):
         button_rect = pygame.Rect(
             Config.WIDTH // 2 - 100,
@@ -291,15 +354,17 @@ class UIManager:
 
         # Botão de calibração
         if self.state.player1_control == "virtual":
-            self._draw_calibration_button(surface, menu_rect.y + 150)
+            self._draw_calibration_button(surface, menu_rect.y + 150, 0)
 
         # Configurações Player 2
         self._draw_control_option(
             surface, "Player 2:",
-            [("Setas", "arrows"), ("CPU", "cpu")],
+            [("Setas", "arrows"), ("CPU", "cpu"), ("Virtual", "virtual")],
             self.state.player2_control,
             menu_rect.y + 250
         )
+        if self.state.player2_control == "virtual":
+            self._draw_calibration_button(surface, menu_rect.y + 295, 1)
 
         # Botão Voltar
         self._draw_back_button(surface, menu_rect.y + 380)
@@ -310,9 +375,10 @@ class UIManager:
         label_text = font.render(label, True, Config.WHITE)
         surface.blit(label_text, (Config.WIDTH // 2 - 350, label_y))
 
+        first_x = Config.WIDTH // 2 - 90 - (len(options) - 2) * 110
         for i, (display_text, value) in enumerate(options):
             rect = pygame.Rect(
-                Config.WIDTH // 2 - 90 + i * 180,
+                first_x + i * 180,
                 y + 5,
                 170,
                 30
@@ -405,7 +471,7 @@ class UIManager:
         elif self.hovered_button == button_rect:
             self.hovered_button = None
 
-    def _draw_calibration_button(self, surface, y):
+    def _draw_calibration_button(self, surface, y, player: int):
         button_rect = pygame.Rect(
             Config.WIDTH // 2 - 100,
             y,
@@ -413,9 +479,14 @@ class UIManager:
             40
         )
 
-        if hasattr(self.state, 'is_calibrating') and self.state.is_calibrating:
+        camera_status = self.state.camera_statuses[player]
+        head_tracker = self.state.head_trackers[player]
+        if self.state.is_calibrating and self.state.calibrating_player == player:
             color = Config.BLUE
             text = "CALIBRANDO..."
+        elif camera_status:
+            color = Config.BLUE
+            text = "AGUARDE..."
         else:
             color = Config.GOLD
             text = "CALIBRAR"
@@ -426,9 +497,12 @@ class UIManager:
         text_rect = text_surf.get_rect(center=button_rect.center)
         surface.blit(text_surf, text_rect)
 
-        # Mostrar status da calibração
-        if hasattr(self.state, 'head_tracker') and self.state.head_tracker:
-            status_text = self.state.head_tracker.get_calibration_status()
+        # Mostrar progresso da câmera ou status da calibração
+        if camera_status:
+            status_surf = self.fonts['small'].render(camera_status, True, Config.WHITE)
+            surface.blit(status_surf, (button_rect.x, button_rect.y + 45))
+        elif head_tracker:
+            status_text = head_tracker.get_calibration_status()
             status_surf = self.fonts['small'].render(status_text, True, Config.WHITE)
             surface.blit(status_surf, (button_rect.x, button_rect.y + 45))
 
@@ -450,6 +524,7 @@ class UIManager:
         surface.blit(overlay, (0, 0))
 
         # Converter frame OpenCV para superficie pygame
+        cv2 = CameraStack.cv2()
         frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
         frame = cv2.resize(frame, (640, 480))
         frame_surface = pygame.surfarray.make_surface(frame.swapaxes(0, 1))
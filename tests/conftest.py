@@ -0,0 +1,38 @@
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def headless_pygame():
+    """Os recursos são lidos relativos à raiz do projeto, com uma janela virtual do SDL"""
+    previous = os.getcwd()
+    os.chdir(ROOT)
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    yield
+    pygame.quit()
+    os.chdir(previous)
+
+
+@pytest.fixture
+def match():
+    """Estado, bola e jogadores de uma partida em andamento"""
+    from src.ball import Ball
+    from src.game import Game
+    from src.game_state import GameState
+
+    state = GameState()
+    state.menu_active = False
+    state.game_started = True
+    ball = Ball()
+    return state, ball, Game.create_paddles(ball)
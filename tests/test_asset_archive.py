@@ -0,0 +1,35 @@
+import pygame
+
+from src.asset_archive import (BALL_SURFACE_KEY, MIXER_FORMAT, AssetArchive, build_archive,
+                               font_key, image_key, sound_key)
+from src.asset_preloader import FONT_PATH, IMAGES, SOUNDS
+
+
+def test_build_and_read_back(tmp_path):
+    path = str(tmp_path / "assets.pack")
+    index = build_archive(path)
+    archive = AssetArchive(path)
+    assert set(archive.index) == set(index)
+    assert BALL_SURFACE_KEY in archive
+
+    for _, image_path, size in IMAGES:
+        original = pygame.image.load(image_path)
+        if size:
+            original = pygame.transform.scale(original, size)
+        surface = archive.image(image_key(image_path, size))
+        assert surface.get_size() == original.get_size()
+        center = (original.get_width() // 2, original.get_height() // 2)
+        assert surface.get_at(center)[:3] == original.get_at(center)[:3]
+
+    assert pygame.mixer.get_init() == MIXER_FORMAT
+    for sound_path in SOUNDS:
+        assert archive.sound(sound_key(sound_path)).get_raw() == pygame.mixer.Sound(sound_path).get_raw()
+    assert archive.font(font_key(FONT_PATH), 12).size("GOL") == pygame.font.Font(FONT_PATH, 12).size("GOL")
+
+
+def test_missing_key_returns_none(tmp_path):
+    path = str(tmp_path / "assets.pack")
+    build_archive(path)
+    archive = AssetArchive(path)
+    assert archive.image("image|nao-existe.png") is None
+    assert archive.sound("sound|nao-existe.wav") is None
@@ -0,0 +1,39 @@
+import pytest
+
+from src.cpu_ai import predict_intercept_y
+
+
+def _simulate(x, y, speed_x, speed_y, target_x, top, bottom):
+    """Referência quadro a quadro, refletindo nas paredes"""
+    frames = 0
+    while (target_x - x) * speed_x > 0:
+        step = min(1.0, (target_x - x) / speed_x)
+        x += speed_x * step
+        y += speed_y * step
+        if y < top:
+            y, speed_y = 2 * top - y, -speed_y
+        elif y > bottom:
+            y, speed_y = 2 * bottom - y, -speed_y
+        frames += step
+    return y, frames
+
+
+@pytest.mark.parametrize("x, y, speed_x, speed_y", [
+    (100, 300, 5, 0),
+    (100, 300, 5, 3),
+    (100, 300, 4, -7),
+    (900, 150, -6, 11),
+    (900, 590, -3, 2.5),
+])
+def test_matches_step_simulation(x, y, speed_x, speed_y):
+    top, bottom, target_x = 100, 600, 700 if speed_x > 0 else 200
+    predicted_y, frames = predict_intercept_y(x, y, speed_x, speed_y, target_x, top, bottom)
+    expected_y, expected_frames = _simulate(x, y, speed_x, speed_y, target_x, top, bottom)
+    assert predicted_y == pytest.approx(expected_y)
+    assert frames == pytest.approx(expected_frames)
+    assert top <= predicted_y <= bottom
+
+
+def test_ball_moving_away_is_not_intercepted():
+    assert predict_intercept_y(500, 300, -5, 2, 700, 100, 600) is None
+    assert predict_intercept_y(500, 300, 0, 2, 700, 100, 600) is None
@@ -0,0 +1,50 @@
+import random
+
+import pytest
+
+from src.ball import Ball
+from src.game import Game
+from src.game_snapshot import GameSnapshot
+from src.game_state import GameState
+
+
+def test_round_trip_restores_simulation_and_meta(match):
+    state, ball, paddles = match
+    state.player1_score, state.player2_score, state.time_remaining = 3, 2, 41
+    state.player1_name, state.player2_name = "Ana", "Léo"
+    state.player2_control = "cpu"
+    ball.rect.topleft = (321, 123)
+    ball.speed_x, ball.speed_y, ball.angle = -4.5, 2.25, 90.0
+    paddles[0].rect.topleft = (150, 200)
+    paddles[1].rect.topleft = (900, 400)
+    data = GameSnapshot.snapshot(state, ball, paddles)
+
+    other_ball = Ball()
+    other_state, other_paddles = GameState(), Game.create_paddles(other_ball)
+    rng_state = GameSnapshot.restore(data, other_state, other_ball, other_paddles, restore_rng=False)
+
+    assert GameSnapshot.snapshot(other_state, other_ball, other_paddles, rng_state) == data
+    assert (other_state.player1_name, other_state.player2_name) == ("Ana", "Léo")
+    assert other_state.player2_control == "cpu"
+    assert other_ball.rect.topleft == (321, 123)
+    assert other_paddles[1].rect.topleft == (900, 400)
+
+
+def test_restore_brings_back_the_random_stream(match):
+    state, ball, paddles = match
+    data = GameSnapshot.snapshot(state, ball, paddles)
+    expected = [random.random() for _ in range(5)]
+    GameSnapshot.restore(data, state, ball, paddles)
+    assert [random.random() for _ in range(5)] == expected
+
+
+def test_snapshot_without_meta_has_fixed_size(match):
+    state, ball, paddles = match
+    assert len(GameSnapshot.snapshot(state, ball, paddles, include_meta=False)) == GameSnapshot.SIMULATION_SIZE
+    assert len(GameSnapshot.snapshot(state, ball, paddles)) == GameSnapshot.FULL_SIZE
+
+
+def test_restore_rejects_other_data(match):
+    state, ball, paddles = match
+    with pytest.raises(ValueError):
+        GameSnapshot.restore(b"XXXX" + bytes(GameSnapshot.FULL_SIZE), state, ball, paddles)
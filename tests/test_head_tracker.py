@@ -0,0 +1,32 @@
+import random
+
+import pytest
+
+# O rastreador importa o OpenCV e o MediaPipe no carregamento do módulo
+pytest.importorskip("cv2")
+pytest.importorskip("mediapipe")
+
+from src.head_tracker import StreamingQuantile
+
+
+@pytest.mark.parametrize("p", [0.05, 0.5, 0.95])
+def test_p2_estimate_is_close_to_the_exact_quantile(p):
+    rng = random.Random(7)
+    samples = [rng.gauss(0, 1) for _ in range(5000)]
+    estimator = StreamingQuantile(p)
+    for value in samples:
+        estimator.add(value)
+    exact = sorted(samples)[int(p * len(samples))]
+    assert estimator.value() == pytest.approx(exact, abs=0.05)
+
+
+def test_few_samples_use_the_exact_order_statistic():
+    estimator = StreamingQuantile(0.5)
+    for value in (3.0, 1.0, 2.0):
+        estimator.add(value)
+    assert estimator.value() == 2.0
+
+
+def test_empty_estimator_has_no_value():
+    with pytest.raises(ValueError):
+        StreamingQuantile(0.5).value()
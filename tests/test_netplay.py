@@ -0,0 +1,89 @@
+import random
+import time
+
+import pytest
+
+from src.ball import Ball
+from src.config import Config
+from src.game import Game
+from src.game_state import GameState
+from src.netplay import RollbackSession
+
+
+class _LossyLink:
+    """Transporte em memória: cada pacote chega ``delay`` quadros depois ou se perde"""
+
+    def __init__(self, rng: random.Random, delay: int, loss: float):
+        self.peer = None
+        self.rng = rng
+        self.delay = delay
+        self.loss = loss
+        self.frame = 0
+        self._in_flight = []
+
+    def send(self, data: bytes):
+        if self.rng.random() >= self.loss:
+            self.peer._in_flight.append((self.peer.frame + self.delay + self.rng.randint(0, 2), data))
+
+    def receive(self):
+        ready = [data for due, data in self._in_flight if due <= self.frame]
+        self._in_flight = [(due, data) for due, data in self._in_flight if due > self.frame]
+        return ready
+
+
+def _play(seconds: int, delay: int, loss: float, seed: int = 1):
+    rng = random.Random(seed)
+    links = [_LossyLink(rng, delay, loss), _LossyLink(rng, delay, loss)]
+    links[0].peer, links[1].peer = links[1], links[0]
+
+    sessions, recorded = [], [{}, {}]
+    for index in range(2):
+        state = GameState()
+        state.game_started, state.menu_active = True, False
+        state.selected_duration = seconds
+        ball = Ball()
+        session = RollbackSession(state, ball, Game.create_paddles(ball), None, links[index], index, seed=42)
+        # Como Game._record_online_tick: ticks ressimulados sobrescrevem os previstos
+        session.on_tick = lambda tick, s=session, r=recorded[index]: r.__setitem__(tick, s.checksum())
+        sessions.append(session)
+
+    scripts = [random.Random(seed * 10 + i) for i in range(2)]
+    moves = [(0, 0), (0, 0)]
+    lingering = [True, True]
+    deadline = time.perf_counter() + 30
+    while any(not s.state.game_over or lingering[i] for i, s in enumerate(sessions)):
+        assert time.perf_counter() < deadline, "a partida não terminou"
+        for index, session in enumerate(sessions):
+            links[index].frame += 1
+            if session.state.game_over:
+                lingering[index] = lingering[index] and session.linger()
+                continue
+            if scripts[index].random() < 0.1:
+                moves[index] = (scripts[index].choice((-7, 0, 7)), scripts[index].choice((-7, 0, 7)))
+            session.advance(moves[index])
+        time.sleep(0.001)
+    return sessions, recorded
+
+
+@pytest.mark.parametrize("delay, loss", [(1, 0.0), (4, 0.1), (8, 0.3)])
+def test_peers_end_in_the_same_state(delay, loss):
+    sessions, recorded = _play(seconds=2, delay=delay, loss=loss)
+    final_tick = 2 * Config.NET_TICK_RATE - 1
+    for session in sessions:
+        assert session.state.game_over
+        assert session.confirmed_remote >= final_tick
+    assert sessions[0].checksum() == sessions[1].checksum()
+    # Cada tick confirmado foi gravado com o mesmo estado nos dois lados
+    assert [recorded[0][t] for t in range(final_tick + 1)] == [recorded[1][t] for t in range(final_tick + 1)]
+
+
+def test_same_inputs_replay_to_the_same_result():
+    first, _ = _play(seconds=1, delay=3, loss=0.1, seed=5)
+    second, _ = _play(seconds=1, delay=3, loss=0.1, seed=5)
+    assert first[0].checksum() == second[0].checksum()
+
+
+def test_rollback_corrects_mispredictions():
+    sessions, _ = _play(seconds=2, delay=6, loss=0.0)
+    assert sum(s.rollbacks for s in sessions) > 0
+    assert sessions[0].checksum() == sessions[1].checksum()
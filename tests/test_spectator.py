@@ -0,0 +1,28 @@
+from src.spectator import EMPTY_SNAPSHOT, SpectatorSnapshot, decode_delta, encode_delta
+
+FIRST = SpectatorSnapshot(500, 300, 120, 310, 880, 290, 0, 0, 60, 1, "Ana", "Léo")
+
+
+def test_full_snapshot_round_trip():
+    packet = encode_delta(1, 0, EMPTY_SNAPSHOT, FIRST)
+    assert decode_delta(packet, {}) == (1, FIRST)
+
+
+def test_delta_carries_only_changed_fields():
+    moved = FIRST._replace(ball_x=510, ball_y=295)
+    full = encode_delta(2, 0, EMPTY_SNAPSHOT, moved)
+    delta = encode_delta(2, 1, FIRST, moved)
+    assert len(delta) < len(full)
+    assert decode_delta(delta, {1: FIRST}) == (2, moved)
+
+
+def test_unchanged_snapshot_round_trip():
+    packet = encode_delta(3, 1, FIRST, FIRST)
+    assert decode_delta(packet, {1: FIRST}) == (3, FIRST)
+
+
+def test_unknown_baseline_or_garbage_is_ignored():
+    packet = encode_delta(2, 1, FIRST, FIRST._replace(player1_score=1))
+    assert decode_delta(packet, {}) is None
+    assert decode_delta(b"GAGS", {}) is None
+    assert decode_delta(b"XXXX" + packet[4:], {1: FIRST}) is None